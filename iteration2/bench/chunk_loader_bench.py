@@ -0,0 +1,200 @@
+"""
+Peak memory and load time of the chunk corpus: the former json.load of
+the whole file followed by a recursive walk vs the streaming ChunkLoader
+on the same corpus as nested JSON and as JSON Lines.
+
+The corpus is synthetic (see synthetic_corpus.py) and written to a
+temporary directory. Every loader runs in a fresh process so peak RSS is
+its own; "imports only" is the interpreter baseline. Exits non-zero if
+any loader produces a different store.
+
+    python bench/chunk_loader_bench.py --chunks 1000000
+"""
+import argparse
+import hashlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.append(parent_dir)
+
+from src.config.config_loader import ConfigLoader
+from src.data.chunk_loader import ChunkLoader
+from src.data.chunk_store import ChunkStore
+from src.model.chunk import Chunk
+
+from synthetic_corpus import build_synthetic_store
+
+
+def write_nested(store: ChunkStore, path: str) -> None:
+    """Writes the store as {"documents": [...]}, one document at a time."""
+    def flush(f, doc_id, sections, first):
+        doc = {"docId": doc_id, "title": store.get_document_title(doc_id), "sections": [
+            {"sectionId": section_id, "header": store.get_section_header(doc_id, section_id), "chunks": chunks}
+            for section_id, chunks in sections
+        ]}
+        f.write(("" if first else ",\n") + json.dumps(doc, ensure_ascii=False))
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"documents": [\n')
+        doc_id, sections, first = None, [], True
+        for chunk in store.iter_chunks():
+            if chunk.get_doc_id() != doc_id:
+                if doc_id is not None:
+                    flush(f, doc_id, sections, first)
+                    first = False
+                doc_id, sections = chunk.get_doc_id(), []
+            if not sections or sections[-1][0] != chunk.get_section_id():
+                sections.append((chunk.get_section_id(), []))
+            sections[-1][1].append({
+                "chunkId": chunk.get_chunk_id(),
+                "startOffset": chunk.get_start_offset(),
+                "endOffset": chunk.get_end_offset(),
+                "content": chunk.get_text()
+            })
+        if doc_id is not None:
+            flush(f, doc_id, sections, first)
+        f.write("\n]}\n")
+
+
+def write_jsonl(store: ChunkStore, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for chunk in store.iter_chunks():
+            f.write(json.dumps({
+                "docId": chunk.get_doc_id(),
+                "sectionId": chunk.get_section_id(),
+                "chunkId": chunk.get_chunk_id(),
+                "startOffset": chunk.get_start_offset(),
+                "endOffset": chunk.get_end_offset(),
+                "content": chunk.get_text(),
+                "title": store.get_document_title(chunk.get_doc_id()),
+                "header": store.get_section_header(chunk.get_doc_id(), chunk.get_section_id())
+            }, ensure_ascii=False) + "\n")
+
+
+def load_with_json_load(path: str) -> ChunkStore:
+    """The loader before streaming: the whole file parsed, then walked."""
+    with open(path, "r", encoding="utf-8") as f:
+        json_content = json.load(f)
+
+    store = ChunkStore()
+    for doc in json_content.get("documents", []):
+        doc_id = doc.get("docId")
+        if doc.get("title"):
+            store.set_document_title(doc_id, doc["title"])
+        for section in doc.get("sections", []):
+            section_id = section.get("sectionId", "")
+            if section.get("header"):
+                store.set_section_header(doc_id, section_id, section["header"])
+            for chunk in section.get("chunks", []):
+                store.add_chunk(Chunk(
+                    doc_id, chunk["chunkId"], chunk["content"], section_id,
+                    chunk.get("startOffset", 0), chunk.get("endOffset", 0)
+                ))
+    return store
+
+
+def store_digest(store: ChunkStore) -> str:
+    digest = hashlib.sha256()
+    for chunk in store.iter_chunks():
+        digest.update("\x1f".join((
+            chunk.get_doc_id(), chunk.get_chunk_id(), chunk.get_section_id(), chunk.get_text() or "",
+            store.get_document_title(chunk.get_doc_id()) or "",
+            store.get_section_header(chunk.get_doc_id(), chunk.get_section_id()) or ""
+        )).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def peak_rss_mb() -> float:
+    """VmHWM of this process; ru_maxrss would include the parent's peak before exec."""
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_worker(mode: str, path: str) -> None:
+    start = time.perf_counter()
+    if mode == "json.load":
+        store = load_with_json_load(path)
+    elif mode == "streaming":
+        store = ChunkLoader().load_chunks(path)
+    else:
+        store = ChunkStore()
+    seconds = time.perf_counter() - start
+    peak = peak_rss_mb()
+    print(json.dumps({
+        "seconds": seconds,
+        "peak_rss_mb": peak,
+        "chunks": store.size(),
+        "digest": store_digest(store)
+    }))
+
+
+def measure(mode: str, path: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", mode, path],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chunk loader memory benchmark")
+    parser.add_argument("--config", default=os.path.join(parent_dir, "data", "config.yaml"))
+    parser.add_argument("--chunks", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--worker", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(*args.worker)
+        return
+
+    config = ConfigLoader(args.config).load_config()
+    source = ChunkLoader().load_chunks(config.get_chunk_path())
+    store = build_synthetic_store(source, args.chunks, args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        nested_path = os.path.join(tmp, "chunks.json")
+        jsonl_path = os.path.join(tmp, "chunks.jsonl")
+        write_nested(store, nested_path)
+        write_jsonl(store, jsonl_path)
+        del store
+        print(f"Corpus: {args.chunks} chunks, nested JSON {os.path.getsize(nested_path) / 2**20:.0f} MB, "
+              f"JSON Lines {os.path.getsize(jsonl_path) / 2**20:.0f} MB\n")
+
+        baseline = measure("imports", nested_path)
+        print(f"{'imports only':<22} peak RSS {baseline['peak_rss_mb']:7.0f} MB")
+
+        expected = None
+        identical = True
+        for label, mode, path in (
+            ("json.load (nested)", "json.load", nested_path),
+            ("streaming (nested)", "streaming", nested_path),
+            ("streaming (JSON Lines)", "streaming", jsonl_path),
+        ):
+            result = measure(mode, path)
+            expected = expected or result["digest"]
+            same = result["digest"] == expected and result["chunks"] == args.chunks
+            identical = identical and same
+            print(
+                f"{label:<22} peak RSS {result['peak_rss_mb']:7.0f} MB | {result['seconds']:6.1f} s | "
+                f"{result['chunks']} chunks | identical store: {same}"
+            )
+
+    sys.exit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
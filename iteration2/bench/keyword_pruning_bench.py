@@ -0,0 +1,83 @@
+"""
+Exhaustive vs MaxScore-pruned keyword top-k on a synthetic corpus.
+
+The corpus is generated from data/chunks.json: every synthetic chunk is a
+random word window of a real chunk, and every pass over the real corpus
+becomes a new set of documents with the original titles and headers.
+Queries are the evaluation questions run through the configured query
+writer, so they carry the same booster terms as real traffic.
+
+    python bench/keyword_pruning_bench.py --chunks 1000000 --queries 50
+"""
+import argparse
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.append(parent_dir)
+
+from src.config.config_loader import ConfigLoader
+from src.data.chunk_loader import ChunkLoader
+from src.data.chunk_store import ChunkStore
+from src.index.keyword_index import KeywordIndex
+from src.orchestrator.pipeline_session import PipelineSession
+from src.retrieval.keyword_retriever import KeywordRetriever
+
+from synthetic_corpus import build_synthetic_store, load_queries
+
+
+def time_queries(retriever: KeywordRetriever, queries, store: ChunkStore):
+    results = []
+    start = time.perf_counter()
+    for terms in queries:
+        results.append([(h.get_doc_id(), h.get_chunk_id(), h.get_score()) for h in retriever.retrieve(terms, store)])
+    return (time.perf_counter() - start) * 1000 / max(1, len(queries)), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyword top-k pruning benchmark")
+    parser.add_argument("--config", default=os.path.join(parent_dir, "data", "config.yaml"))
+    parser.add_argument("--ground-truth", default=os.path.join(parent_dir, "eval", "ground_truth.json"))
+    parser.add_argument("--chunks", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    config = ConfigLoader(args.config).load_config()
+    source = ChunkLoader().load_chunks(config.get_chunk_path())
+    session = PipelineSession(config, source)
+    queries = load_queries(session, args.ground_truth, args.queries)
+
+    start = time.perf_counter()
+    store = build_synthetic_store(source, args.chunks, args.seed)
+    print(f"Synthetic corpus: {store.size()} chunks ({time.perf_counter() - start:.1f} s)")
+
+    start = time.perf_counter()
+    index = KeywordIndex.for_store(store, session.get_stemmer())
+    print(f"Keyword index: {index.vocabulary_size()} terms ({time.perf_counter() - start:.1f} s)")
+    print(f"Queries: {len(queries)}, top_k={args.top_k}\n")
+
+    all_identical = True
+    for scoring in (KeywordRetriever.SCORING_TF, KeywordRetriever.SCORING_BM25):
+        exhaustive_ms, exhaustive = time_queries(
+            KeywordRetriever(args.top_k, session.get_stemmer(), scoring, pruning=False), queries, store
+        )
+        pruned_ms, pruned = time_queries(
+            KeywordRetriever(args.top_k, session.get_stemmer(), scoring, pruning=True), queries, store
+        )
+        identical = exhaustive == pruned
+        all_identical = all_identical and identical
+        print(
+            f"{scoring:5s} exhaustive {exhaustive_ms:9.2f} ms/query | pruned {pruned_ms:9.2f} ms/query | "
+            f"speedup {exhaustive_ms / pruned_ms if pruned_ms > 0 else float('inf'):5.2f}x | "
+            f"identical top-k: {identical}"
+        )
+
+    sys.exit(0 if all_identical else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Throughput and latency of concurrent vector searches, each run directly
+against the VectorIndex vs through a MicroBatchScheduler, which embeds
+the queries waiting in one window together and scores them with one
+matrix-matrix product.
+
+Load is closed-loop: --clients threads each send their next query as
+soon as the previous one is answered, like busy server workers. The
+corpus is synthetic (see synthetic_corpus.py); queries are the
+evaluation questions run through the configured query writer. Exits
+non-zero if any batched top-k differs from the direct search.
+
+    python bench/micro_batch_bench.py --chunks 200000 --clients 16 --windows 1,2,5
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.append(parent_dir)
+
+from src.config.config_loader import ConfigLoader
+from src.data.chunk_loader import ChunkLoader
+from src.index.micro_batch_scheduler import MicroBatchScheduler
+from src.index.vector_index import VectorIndex
+from src.orchestrator.pipeline_session import PipelineSession
+
+from synthetic_corpus import build_synthetic_store, load_queries
+
+
+def run_load(searcher, queries, clients: int, rounds: int, top_k: int):
+    """
+    Every client searches all queries `rounds` times, starting at its own
+    offset. Returns (wall seconds, per-search latencies in ms, results of
+    client 0 in query order).
+    """
+    latencies = [[] for _ in range(clients)]
+    first_results = [None] * len(queries)
+    barrier = threading.Barrier(clients + 1)
+
+    def client(c: int) -> None:
+        barrier.wait()
+        for r in range(rounds):
+            for i in range(len(queries)):
+                q = (i + c * 7) % len(queries)
+                start = time.perf_counter()
+                result = searcher.search_rows(queries[q], top_k)
+                latencies[c].append((time.perf_counter() - start) * 1000)
+                if c == 0 and r == 0:
+                    first_results[q] = result
+
+    threads = [threading.Thread(target=client, args=(c,)) for c in range(clients)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    return wall, sorted(ms for client_ms in latencies for ms in client_ms), first_results
+
+
+def percentile(sorted_values, p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(p / 100.0 * len(sorted_values)))]
+
+
+def report(label: str, wall: float, latencies, extra: str = "") -> None:
+    print(
+        f"{label:<16} {len(latencies) / wall:8.1f} q/s | "
+        f"p50 {percentile(latencies, 50):8.2f} ms | p99 {percentile(latencies, 99):8.2f} ms{extra}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vector search micro-batching benchmark")
+    parser.add_argument("--config", default=os.path.join(parent_dir, "data", "config.yaml"))
+    parser.add_argument("--ground-truth", default=os.path.join(parent_dir, "eval", "ground_truth.json"))
+    parser.add_argument("--chunks", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=98)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument("--windows", default="1,2,5", help="Comma-separated batch windows in ms")
+    parser.add_argument("--max-queries", type=int, default=16)
+    parser.add_argument("--storage", default=VectorIndex.STORAGE_FLOAT32)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    config = ConfigLoader(args.config).load_config()
+    source = ChunkLoader().load_chunks(config.get_chunk_path())
+    session = PipelineSession(config, source)
+    queries = [" ".join(terms) for terms in load_queries(session, args.ground_truth, args.queries)]
+    provider = session.get_embedding_provider()
+
+    store = build_synthetic_store(source, args.chunks, args.seed)
+    start = time.perf_counter()
+    index = VectorIndex(store, provider, VectorIndex.BACKEND_NUMPY, storage=args.storage)
+    print(f"Index: {index.size()} chunks, storage={index.get_storage()} "
+          f"({time.perf_counter() - start:.1f} s to embed)")
+    print(f"Load: {args.clients} clients x {len(queries) * args.rounds} queries, top_k={args.top_k}\n")
+
+    wall, latencies, expected = run_load(index, queries, args.clients, args.rounds, args.top_k)
+    report("direct", wall, latencies)
+
+    identical = True
+    for window_ms in (float(w) for w in args.windows.split(",") if w.strip()):
+        scheduler = MicroBatchScheduler(index, window_ms, args.max_queries)
+        wall, latencies, results = run_load(scheduler, queries, args.clients, args.rounds, args.top_k)
+        scheduler.close()
+        same = results == expected
+        identical = identical and same
+        report(
+            f"batch {window_ms:g} ms",
+            wall,
+            latencies,
+            f" | {scheduler.get_query_count() / max(1, scheduler.get_batch_count()):5.1f} queries/batch"
+            f" | identical top-k: {same}"
+        )
+
+    sys.exit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Synthetic corpora and query sets for the benchmarks in this directory."""
+import json
+import random
+
+from src.data.chunk_store import ChunkStore
+from src.model.chunk import Chunk
+from src.orchestrator.pipeline_session import PipelineSession
+
+
+def build_synthetic_store(source: ChunkStore, size: int, seed: int) -> ChunkStore:
+    """
+    Every synthetic chunk is a random word window of a real chunk, and every
+    pass over the real corpus becomes a new set of documents with the
+    original titles and headers.
+    """
+    rng = random.Random(seed)
+    chunks = source.get_all_chunks()
+    words = [chunk.get_text().split() for chunk in chunks]
+
+    store = ChunkStore()
+    for i in range(size):
+        copy, position = divmod(i, len(chunks))
+        chunk = chunks[position]
+        doc_id = f"{chunk.get_doc_id()}#{copy}"
+
+        if position == 0 or chunks[position - 1].get_doc_id() != chunk.get_doc_id():
+            title = source.get_document_title(chunk.get_doc_id())
+            if title:
+                store.set_document_title(doc_id, title)
+        header = source.get_section_header(chunk.get_doc_id(), chunk.get_section_id())
+        if header and store.get_section_header(doc_id, chunk.get_section_id()) is None:
+            store.set_section_header(doc_id, chunk.get_section_id(), header)
+
+        tokens = words[position]
+        if len(tokens) > 8:
+            width = rng.randint(8, min(len(tokens), 40))
+            start = rng.randint(0, len(tokens) - width)
+            tokens = tokens[start:start + width]
+        store.add_chunk(Chunk(doc_id, chunk.get_chunk_id(), " ".join(tokens), chunk.get_section_id(), 0, 0))
+
+    return store
+
+
+def load_queries(session: PipelineSession, ground_truth_path: str, count: int):
+    """Evaluation questions run through the configured query writer."""
+    with open(ground_truth_path, "r", encoding="utf-8") as f:
+        questions = [item["question"] for item in json.load(f)]
+    return [session.normalize_query(question)[1] for question in questions[:count]]
@@ -0,0 +1,69 @@
+"""
+Full sort vs TopKSelector for the two kinds of candidate lists in the
+pipeline: Hit objects (retrievers, rerankers) and score arrays (vector
+index, HitList). Candidate scores have few distinct values, so ties and
+the docId/chunkId tie-break are exercised. Exits non-zero if a selection
+differs from the first k entries of the full sort.
+
+    python bench/top_k_bench.py --top-k 10
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.append(parent_dir)
+
+from src.index.top_k_selector import TopKSelector
+from src.model.hit import Hit
+
+
+def best_of(repeats: int, run):
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Top-k selection benchmark")
+    parser.add_argument("--counts", default="1000,10000,100000,1000000")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    k = args.top_k
+    mismatches = 0
+
+    print(f"{'candidates':>10} | {'hits: sort':>10} {'heap':>8} | {'array: argsort':>14} {'argpartition':>12}  (ms, best of {args.repeats})")
+    for count in (int(c) for c in args.counts.split(",")):
+        scores = [rng.randint(0, 1000) / 10.0 for _ in range(count)]
+        hits = [Hit(f"doc{rng.randint(0, 99)}", f"c{i}", score) for i, score in enumerate(scores)]
+        values = np.asarray(scores)
+
+        sort_ms, sorted_hits = best_of(args.repeats, lambda: sorted(hits, key=TopKSelector.hit_sort_key)[:k])
+        heap_ms, selected_hits = best_of(args.repeats, lambda: TopKSelector.select_hits(hits, k))
+        argsort_ms, sorted_rows = best_of(args.repeats, lambda: np.lexsort((np.arange(count), -values))[:k].tolist())
+        partition_ms, selected_rows = best_of(args.repeats, lambda: TopKSelector.select_indices(values, k))
+
+        if selected_hits != sorted_hits or selected_rows != sorted_rows:
+            mismatches += 1
+        print(f"{count:>10} | {sort_ms:>10.2f} {heap_ms:>8.2f} | {argsort_ms:>14.2f} {partition_ms:>12.2f}")
+
+    if mismatches:
+        print(f"MISMATCH: {mismatches} candidate counts selected a different top-{k}")
+        sys.exit(1)
+    print("Selections identical to the full sort.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Recall@k vs latency of the IVF vector index against the exact flat scan.
+
+The corpus is synthetic (see synthetic_corpus.py) and embedded with the
+configured embedding provider; queries are the evaluation questions run
+through the configured query writer, embedded the way VectorRetriever does.
+
+    python bench/vector_ann_bench.py --chunks 200000 --nprobe 1,2,4,8,16,32,64
+"""
+import argparse
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.append(parent_dir)
+
+from src.config.config_loader import ConfigLoader
+from src.data.chunk_loader import ChunkLoader
+from src.index.vector_index import VectorIndex
+from src.orchestrator.pipeline_session import PipelineSession
+
+from synthetic_corpus import build_synthetic_store, load_queries
+
+
+def time_queries(index: VectorIndex, queries, top_k: int):
+    results = []
+    start = time.perf_counter()
+    for query in queries:
+        results.append(index.search(query, top_k))
+    return (time.perf_counter() - start) * 1000 / max(1, len(queries)), results
+
+
+def recall(approximate, exact) -> float:
+    """
+    Share of returned hits that belong in the exact top-k. The synthetic
+    corpus repeats chunks, so a hit counts if its score reaches the exact
+    k-th score (any of the tied copies is a correct answer).
+    """
+    found = expected = 0
+    for approximate_hits, exact_hits in zip(approximate, exact):
+        if not exact_hits:
+            continue
+        kth_score = exact_hits[-1][1]
+        found += sum(1 for _, score in approximate_hits if score >= kth_score - 1e-6)
+        expected += len(exact_hits)
+    return found / expected if expected else 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IVF vector index benchmark")
+    parser.add_argument("--config", default=os.path.join(parent_dir, "data", "config.yaml"))
+    parser.add_argument("--ground-truth", default=os.path.join(parent_dir, "eval", "ground_truth.json"))
+    parser.add_argument("--chunks", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=98)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--nlist", type=int, default=0)
+    parser.add_argument("--nprobe", default="1,2,4,8,16,32,64")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    config = ConfigLoader(args.config).load_config()
+    source = ChunkLoader().load_chunks(config.get_chunk_path())
+    session = PipelineSession(config, source)
+    queries = [" ".join(terms) for terms in load_queries(session, args.ground_truth, args.queries)]
+    provider = session.get_embedding_provider()
+
+    store = build_synthetic_store(source, args.chunks, args.seed)
+
+    start = time.perf_counter()
+    flat = VectorIndex(store, provider, VectorIndex.BACKEND_NUMPY)
+    print(f"Flat index: {flat.size()} chunks ({time.perf_counter() - start:.1f} s to embed)")
+
+    start = time.perf_counter()
+    ivf = VectorIndex(store, provider, VectorIndex.BACKEND_NUMPY, index_type=VectorIndex.TYPE_IVF, nlist=args.nlist)
+    print(f"IVF index: built in {time.perf_counter() - start:.1f} s (embedding included)")
+    print(f"Queries: {len(queries)}, top_k={args.top_k}\n")
+
+    flat_ms, exact = time_queries(flat, queries, args.top_k)
+    print(f"{'flat':>10s} {flat_ms:8.2f} ms/query  recall@{args.top_k} 1.000")
+
+    for nprobe in (int(value) for value in args.nprobe.split(",")):
+        ivf.set_nprobe(nprobe)
+        ivf_ms, approximate = time_queries(ivf, queries, args.top_k)
+        print(
+            f"{'nprobe=' + str(nprobe):>10s} {ivf_ms:8.2f} ms/query  "
+            f"recall@{args.top_k} {recall(approximate, exact):.3f}  "
+            f"speedup {flat_ms / ivf_ms if ivf_ms > 0 else float('inf'):5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
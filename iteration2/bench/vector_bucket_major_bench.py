@@ -0,0 +1,79 @@
+"""
+Dense row-major scan vs the bucket-major vector storage, which
+only reads the embedding dimensions where the query is non-zero.
+
+The corpus is synthetic (see synthetic_corpus.py); queries are the
+evaluation questions run through the configured query writer. Exits
+non-zero if the two layouts disagree on any top-k.
+
+    python bench/vector_bucket_major_bench.py --chunks 200000
+"""
+import argparse
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.append(parent_dir)
+
+from src.config.config_loader import ConfigLoader
+from src.data.chunk_loader import ChunkLoader
+from src.index.vector_index import VectorIndex
+from src.orchestrator.pipeline_session import PipelineSession
+
+from synthetic_corpus import build_synthetic_store, load_queries
+from vector_ann_bench import time_queries
+
+
+def same_results(dense, bucket_major) -> bool:
+    for dense_hits, bucket_hits in zip(dense, bucket_major):
+        if [key for key, _ in dense_hits] != [key for key, _ in bucket_hits]:
+            return False
+        if any(abs(a - b) > 1e-6 for (_, a), (_, b) in zip(dense_hits, bucket_hits)):
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bucket-major vector storage benchmark")
+    parser.add_argument("--config", default=os.path.join(parent_dir, "data", "config.yaml"))
+    parser.add_argument("--ground-truth", default=os.path.join(parent_dir, "eval", "ground_truth.json"))
+    parser.add_argument("--chunks", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=98)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    config = ConfigLoader(args.config).load_config()
+    source = ChunkLoader().load_chunks(config.get_chunk_path())
+    session = PipelineSession(config, source)
+    queries = [" ".join(terms) for terms in load_queries(session, args.ground_truth, args.queries)]
+    provider = session.get_embedding_provider()
+
+    store = build_synthetic_store(source, args.chunks, args.seed)
+
+    start = time.perf_counter()
+    dense = VectorIndex(store, provider, VectorIndex.BACKEND_NUMPY)
+    print(f"Dense index: {dense.size()} chunks ({time.perf_counter() - start:.1f} s to embed)")
+    bucket_major = VectorIndex(store, provider, VectorIndex.BACKEND_NUMPY, storage=VectorIndex.STORAGE_BUCKET_MAJOR)
+
+    dimensions = len(provider.embed("")) or 1
+    query_density = sum(sum(1 for value in provider.embed(q) if value) for q in queries) / max(1, len(queries))
+    print(f"Queries: {len(queries)}, top_k={args.top_k}, "
+          f"non-zero query dimensions {query_density:.1f}/{dimensions}\n")
+
+    dense_ms, dense_results = time_queries(dense, queries, args.top_k)
+    bucket_ms, bucket_results = time_queries(bucket_major, queries, args.top_k)
+    identical = same_results(dense_results, bucket_results)
+    print(
+        f"dense {dense_ms:8.2f} ms/query | bucket-major {bucket_ms:8.2f} ms/query | "
+        f"speedup {dense_ms / bucket_ms if bucket_ms > 0 else float('inf'):5.2f}x | "
+        f"identical top-k: {identical}"
+    )
+
+    sys.exit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Memory per vector, recall@k and latency of int8 vector storage against the
+float32 flat scan, with and without exact re-scoring of the best candidates.
+
+The corpus is synthetic (see synthetic_corpus.py). The float32 vectors are
+persisted to a temporary directory so re-scoring reads them from the
+memory-mapped vector file, as it does for a persisted production index.
+
+    python bench/vector_quantization_bench.py --chunks 200000 --rescore 0,20,50,100
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.append(parent_dir)
+
+from src.config.config_loader import ConfigLoader
+from src.data.chunk_loader import ChunkLoader
+from src.index.vector_index import VectorIndex
+from src.orchestrator.pipeline_session import PipelineSession
+
+from synthetic_corpus import build_synthetic_store, load_queries
+from vector_ann_bench import time_queries
+
+
+def recall(approximate, flat: VectorIndex, queries, top_k: int) -> float:
+    """
+    Share of returned hits that belong in the exact top-k. Unlike
+    vector_ann_bench.recall this goes by key, since int8 hits without
+    re-scoring carry approximate scores; copies tied with the exact k-th
+    score count as correct.
+    """
+    found = expected = 0
+    for approximate_hits, query in zip(approximate, queries):
+        exact_hits = flat.search(query, top_k * 20)
+        if not exact_hits:
+            continue
+        kth_score = exact_hits[min(top_k, len(exact_hits)) - 1][1]
+        correct = {key for key, score in exact_hits if score >= kth_score - 1e-6}
+        found += sum(1 for key, _ in approximate_hits if key in correct)
+        expected += min(top_k, len(exact_hits))
+    return found / expected if expected else 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantized vector storage benchmark")
+    parser.add_argument("--config", default=os.path.join(parent_dir, "data", "config.yaml"))
+    parser.add_argument("--ground-truth", default=os.path.join(parent_dir, "eval", "ground_truth.json"))
+    parser.add_argument("--chunks", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=98)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--rescore", default="0,20,50,100")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    config = ConfigLoader(args.config).load_config()
+    source = ChunkLoader().load_chunks(config.get_chunk_path())
+    session = PipelineSession(config, source)
+    queries = [" ".join(terms) for terms in load_queries(session, args.ground_truth, args.queries)]
+    provider = session.get_embedding_provider()
+
+    store = build_synthetic_store(source, args.chunks, args.seed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # The vector file is keyed by the chunk file it sits next to; only
+        # its content fingerprint matters here.
+        chunk_path = Path(directory) / "synthetic.json"
+        chunk_path.write_text(f"synthetic chunks={args.chunks} seed={args.seed}", encoding="utf-8")
+
+        start = time.perf_counter()
+        quantized = VectorIndex(
+            store, provider, VectorIndex.BACKEND_NUMPY, chunk_path, storage=VectorIndex.STORAGE_INT8
+        )
+        print(f"int8 index: {quantized.size()} chunks ({time.perf_counter() - start:.1f} s to embed)")
+        flat = VectorIndex(store, provider, VectorIndex.BACKEND_NUMPY, chunk_path)
+        print(f"Queries: {len(queries)}, top_k={args.top_k}\n")
+
+        size = max(1, flat.size())
+        flat_bytes = flat.get_vector_bytes() / size
+        int8_bytes = quantized.get_vector_bytes() / size
+        print(f"{'float32':>16s} {flat_bytes:7.1f} bytes/vector")
+        print(f"{'int8':>16s} {int8_bytes:7.1f} bytes/vector ({flat_bytes / int8_bytes:.2f}x smaller)\n")
+
+        flat_ms, _ = time_queries(flat, queries, args.top_k)
+        print(f"{'float32':>16s} {flat_ms:8.2f} ms/query  recall@{args.top_k} 1.000")
+
+        for rescore in (int(value) for value in args.rescore.split(",")):
+            quantized.set_rescore(rescore)
+            quantized_ms, approximate = time_queries(quantized, queries, args.top_k)
+            value = recall(approximate, flat, queries, args.top_k)
+            print(
+                f"{'int8 rescore=' + str(rescore):>16s} {quantized_ms:8.2f} ms/query  "
+                f"recall@{args.top_k} {value:.3f}  delta {value - 1.0:+.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ setup(
     install_requires=[
         "pyyaml>=6.0",
         "pandas>=2.0.0",
+        "numpy>=1.24",
     ],
     extras_require={
         "dev": [
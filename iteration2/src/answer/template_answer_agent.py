@@ -1,4 +1,3 @@
-import re
 from typing import List
 
 from src.answer.answer_agent import AnswerAgent
@@ -19,13 +18,13 @@ class TemplateAnswerAgent(AnswerAgent):
 
         # Get best hit (first after reranking)
         best_hit = top_hits[0]
-        best_chunk = chunk_store.get_chunk(best_hit.get_doc_id(), best_hit.get_chunk_id())
+        best_chunk = chunk_store.get_chunk(best_hit.get_doc_id(), best_hit.get_chunk_id(), best_hit.get_ordinal())
 
         if best_chunk is None:
             return Answer("Üzgünüm, sorunuza ait detaylı metni bulamadım.", [])
 
         # Select sentence
-        best_sentence = self.__select_best_sentence(best_chunk.get_text(), query_terms)
+        best_sentence = self.__select_best_sentence(best_chunk, query_terms)
 
         # Build source description
         doc_title = chunk_store.get_document_title(best_chunk.get_doc_id())
@@ -40,7 +39,7 @@ class TemplateAnswerAgent(AnswerAgent):
         # Citations (first 3)
         citations: List[str] = []
         for hit in top_hits[:3]:
-            chunk = chunk_store.get_chunk(hit.get_doc_id(), hit.get_chunk_id())
+            chunk = chunk_store.get_chunk(hit.get_doc_id(), hit.get_chunk_id(), hit.get_ordinal())
             if chunk:
                 citations.append(self.__format_citation(chunk))
 
@@ -50,11 +49,13 @@ class TemplateAnswerAgent(AnswerAgent):
     # Private helpers
     # --------------------------
 
-    def __select_best_sentence(self, text: str, query_terms: List[str]) -> str:
+    def __select_best_sentence(self, chunk: Chunk, query_terms: List[str]) -> str:
+        text = chunk.get_text()
         if not text:
             return "Bilgi bulunamadı."
 
-        sentences = [s.strip() for s in re.split(r"[.!?]+", text) if s.strip()]
+        analysis = chunk.get_analysis()
+        sentences = analysis.get_sentences()
         if not sentences:
             return text[:200]
 
@@ -66,11 +67,10 @@ class TemplateAnswerAgent(AnswerAgent):
         # Normalize query terms
         normalized_terms = [t.lower() for t in query_terms if t and t.strip()] if query_terms else []
 
-        for sentence in sentences:
-            term_count = self.__count_query_terms(sentence, normalized_terms)
+        for sentence, lower_sentence in zip(sentences, analysis.get_lower_sentences()):
+            term_count = self.__count_query_terms(lower_sentence, normalized_terms)
 
             # Does this sentence contain all terms?    
-            lower_sentence = sentence.lower()
             contains_all = all(term in lower_sentence for term in normalized_terms)
 
             length = len(sentence)
@@ -93,11 +93,10 @@ class TemplateAnswerAgent(AnswerAgent):
 
         return best_sentence
 
-    def __count_query_terms(self, sentence: str, query_terms: List[str]) -> int:
+    def __count_query_terms(self, lower_sentence: str, query_terms: List[str]) -> int:
         if not query_terms:
             return 0
 
-        lower_sentence = sentence.lower()
         return sum(1 for term in query_terms if term in lower_sentence)
 
     def __format_citation(self, chunk: Chunk) -> str:
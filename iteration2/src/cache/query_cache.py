@@ -1,59 +1,210 @@
-import json
-from pathlib import Path
-from typing import Dict, Any, Optional
-
-from src.model.answer import Answer
-
-
-class QueryCache:
-
-    def __init__(self, cache_file_path: Path, max_size: int = 100):
-        self.__cache_file_path = Path(cache_file_path)
-        self.__cache: Dict[str, Dict[str, Any]] = {}
-        self.__max_size = max_size
-        self._load_from_file()
-
-    def _load_from_file(self) -> None:
-        if self.__cache_file_path.exists():
-            try:
-                with open(self.__cache_file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        self.__cache = data
-            except (json.JSONDecodeError, IOError):
-                self.__cache = {}
-
-    def _save_to_file(self) -> None:
-        try:
-            self.__cache_file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.__cache_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.__cache, f, ensure_ascii=False, indent=2)
-        except IOError:
-            pass
-
-    def get(self, query: str) -> Optional[Answer]:
-        query_lower = query.lower()
-        cached_data = self.__cache.get(query_lower)
-
-        if cached_data is None:
-            return None
-
-        return Answer(
-            text=cached_data.get("text", ""),
-            citations=cached_data.get("citations", [])
-        )
-
-    def set(self, query: str, answer: Answer) -> None:
-        query_lower = query.lower()
-
-        if len(self.__cache) >= self.__max_size:
-            first_key = next(iter(self.__cache))
-            del self.__cache[first_key]
-
-        self.__cache[query_lower] = {
-            "text": answer.get_text(),
-            "citations": answer.get_citations()
-        }
-
-        self._save_to_file()
-
+import atexit
+import json
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from src.model.answer import Answer
+from src.model.intent import Intent
+
+
+class QueryCache:
+    """
+    LRU cache of final answers keyed by query text, persisted to a JSON file.
+
+    - get/set are O(1); get refreshes recency, set evicts the least recently
+      used entry once max_size is reached.
+    - Entries older than ttl_seconds (if given) are treated as misses.
+    - Persistence is write-behind: the file is rewritten every flush_every
+      writes, on flush()/close() and at interpreter exit, through a temp file
+      and rename so readers never see a partial file. The exit hook only
+      holds a weak reference, so a cache dropped without close() is freed
+      and its unflushed writes are lost; call close() when done with it.
+
+    In "normalized" key mode a second tier keys answers on the detected intent
+    plus the written query terms, so paraphrases that reduce to the same terms
+    share an entry. Both tiers live in the same LRU.
+    """
+
+    KEY_MODE_TEXT = "text"
+    KEY_MODE_NORMALIZED = "normalized"
+
+    def __init__(
+        self,
+        cache_file_path: Path,
+        max_size: int = 100,
+        ttl_seconds: Optional[float] = None,
+        flush_every: int = 50,
+        key_mode: str = KEY_MODE_TEXT
+    ):
+        if key_mode not in (self.KEY_MODE_TEXT, self.KEY_MODE_NORMALIZED):
+            raise ValueError(f"Unknown cache key mode: {key_mode}")
+
+        self.__key_mode = key_mode
+        self.__cache_file_path = Path(cache_file_path)
+        self.__cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.__max_size = max_size
+        self.__ttl_seconds = ttl_seconds
+        self.__flush_every = max(1, flush_every)
+        self.__pending_writes = 0
+        self.__lock = threading.RLock()
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
+
+        self._load_from_file()
+        self.__flush_at_exit = partial(self.__flush_if_alive, weakref.ref(self))
+        atexit.register(self.__flush_at_exit)
+
+    @staticmethod
+    def __flush_if_alive(cache_ref: "weakref.ref[QueryCache]") -> None:
+        cache = cache_ref()
+        if cache is not None:
+            cache.flush()
+
+    def _load_from_file(self) -> None:
+        if self.__cache_file_path.exists():
+            try:
+                with open(self.__cache_file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    if isinstance(data, dict):
+                        # File order is LRU order (least recent first).
+                        now = time.time()
+                        for key, entry in data.items():
+                            if isinstance(entry, dict):
+                                entry.setdefault("created_at", now)
+                                self.__cache[key] = entry
+                        while len(self.__cache) > self.__max_size:
+                            self.__cache.popitem(last=False)
+            except (json.JSONDecodeError, IOError):
+                self.__cache = OrderedDict()
+
+    def _save_to_file(self) -> None:
+        try:
+            self.__cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.__cache_file_path.with_name(
+                f"{self.__cache_file_path.name}.{os.getpid()}.tmp"
+            )
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.__cache, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.__cache_file_path)
+        except IOError:
+            pass
+
+    def __is_expired(self, entry: Dict[str, Any]) -> bool:
+        if self.__ttl_seconds is None:
+            return False
+        return time.time() - entry.get("created_at", 0) > self.__ttl_seconds
+
+    def get_key_mode(self) -> str:
+        return self.__key_mode
+
+    def is_normalized_mode(self) -> bool:
+        return self.__key_mode == self.KEY_MODE_NORMALIZED
+
+    def get(self, query: str) -> Optional[Answer]:
+        return self.__get(query.lower())
+
+    def contains(self, query: str) -> bool:
+        """Checks for a live entry without touching recency or statistics."""
+        return self.__contains(query.lower())
+
+    def set(self, query: str, answer: Answer) -> None:
+        self.__set(query.lower(), answer)
+
+    def get_normalized(self, intent: Intent, terms: List[str]) -> Optional[Answer]:
+        key = self.__normalized_key(intent, terms)
+        return self.__get(key) if key is not None else None
+
+    def contains_normalized(self, intent: Intent, terms: List[str]) -> bool:
+        key = self.__normalized_key(intent, terms)
+        return key is not None and self.__contains(key)
+
+    def set_normalized(self, intent: Intent, terms: List[str], answer: Answer) -> None:
+        key = self.__normalized_key(intent, terms)
+        if key is not None:
+            self.__set(key, answer)
+
+    def __normalized_key(self, intent: Intent, terms: List[str]) -> Optional[str]:
+        if not self.is_normalized_mode() or not terms:
+            return None
+        # Term order only reflects weighting, so the key is the sorted term set.
+        resolved_intent = intent if intent is not None else Intent.UNKNOWN
+        return f"[{resolved_intent.value}] {' '.join(sorted(set(terms)))}"
+
+    def __get(self, key: str) -> Optional[Answer]:
+        with self.__lock:
+            cached_data = self.__cache.get(key)
+
+            if cached_data is not None and self.__is_expired(cached_data):
+                del self.__cache[key]
+                self.__expirations += 1
+                self.__pending_writes += 1
+                cached_data = None
+
+            if cached_data is None:
+                self.__misses += 1
+                return None
+
+            self.__cache.move_to_end(key)
+            self.__hits += 1
+
+        return Answer(
+            text=cached_data.get("text", ""),
+            citations=cached_data.get("citations", [])
+        )
+
+    def __contains(self, key: str) -> bool:
+        with self.__lock:
+            cached_data = self.__cache.get(key)
+            return cached_data is not None and not self.__is_expired(cached_data)
+
+    def __set(self, key: str, answer: Answer) -> None:
+        with self.__lock:
+            if key in self.__cache:
+                self.__cache.move_to_end(key)
+            elif len(self.__cache) >= self.__max_size:
+                self.__cache.popitem(last=False)
+                self.__evictions += 1
+
+            self.__cache[key] = {
+                "text": answer.get_text(),
+                "citations": answer.get_citations(),
+                "created_at": time.time()
+            }
+
+            self.__pending_writes += 1
+            if self.__pending_writes >= self.__flush_every:
+                self.flush()
+
+    def flush(self) -> None:
+        """Writes the cache to disk if anything changed since the last flush."""
+        with self.__lock:
+            if self.__pending_writes == 0:
+                return
+            self._save_to_file()
+            self.__pending_writes = 0
+
+    def close(self) -> None:
+        self.flush()
+        atexit.unregister(self.__flush_at_exit)
+
+    def size(self) -> int:
+        return len(self.__cache)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.__lock:
+            return {
+                "size": len(self.__cache),
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "evictions": self.__evictions,
+                "expirations": self.__expirations
+            }
@@ -0,0 +1,61 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from src.model.hit import Hit
+
+
+class RetrievalCache:
+    """
+    Bounded in-memory LRU of retrieval results.
+
+    Keys are built by the caller from everything that determines the
+    candidate list (terms, retriever type, top_k, fusion weights, index
+    fingerprint), so one instance can be shared by several sessions - e.g.
+    a sweep over reranker/answer settings reuses identical candidate lists.
+    Hits are stored as plain tuples and copied out, so callers may mutate
+    the returned Hit objects freely.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.__max_entries = max(1, max_entries)
+        self.__entries: "OrderedDict[Hashable, List[Tuple[str, str, int, Optional[int]]]]" = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get(self, key: Hashable) -> Optional[List[Hit]]:
+        with self.__lock:
+            stored = self.__entries.get(key)
+            if stored is None:
+                self.__misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+
+        return [Hit(doc_id, chunk_id, score, ordinal) for doc_id, chunk_id, score, ordinal in stored]
+
+    def put(self, key: Hashable, hits: List[Hit]) -> None:
+        stored = [(h.get_doc_id(), h.get_chunk_id(), h.get_score(), h.get_ordinal()) for h in hits]
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+            elif len(self.__entries) >= self.__max_entries:
+                self.__entries.popitem(last=False)
+            self.__entries[key] = stored
+
+    def size(self) -> int:
+        return len(self.__entries)
+
+    def get_hit_rate(self) -> float:
+        lookups = self.__hits + self.__misses
+        return self.__hits / lookups if lookups else 0.0
+
+    def get_stats(self) -> Dict[str, float]:
+        with self.__lock:
+            return {
+                "size": len(self.__entries),
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "hit_rate": self.get_hit_rate()
+            }
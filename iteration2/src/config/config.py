@@ -8,13 +8,35 @@ class Config:
         retriever_type: str,
         reranker_type: str,
         answer_agent_type: str,
+        pipeline_mode: str,
+        async_workers: int,
         rules_file_path: Path,
         top_k: int,
         retriever_alpha: float,
         retriever_beta: float,
+        retrieval_cache_size: int,
+        keyword_scoring: str,
+        bm25_k1: float,
+        bm25_b: float,
+        bm25f_title_weight: float,
+        bm25f_header_weight: float,
+        bm25f_content_weight: float,
+        keyword_pruning: bool,
         embedding_provider_type: str,
+        vector_backend: str,
+        persist_vector_index: bool,
+        embedding_batch_size: int,
+        vector_index_type: str,
+        ivf_nlist: int,
+        ivf_nprobe: int,
+        vector_storage: str,
+        vector_rescore: int,
+        vector_batch_window_ms: float,
+        vector_batch_max_queries: int,
         stopwords_file_path: Path,
         suffixes_file_path: Path,
+        stem_cache_size: int,
+        precompute_stems: bool,
         conjunctions_file_path: Path,
         tf_weight: float,
         booster_weight: float,
@@ -26,20 +48,51 @@ class Config:
         reranker_alpha: float,
         reranker_beta: float,
         chunk_path: Path,
-        logs_dir_path: Path
+        logs_dir_path: Path,
+        cache_key_mode: str,
+        cache_ttl_seconds: float,
+        cache_flush_every: int,
+        trace_mode: str,
+        trace_level: str,
+        trace_queue_size: int,
+        trace_flush_events: int,
+        trace_flush_interval_ms: int,
+        trace_overflow_policy: str
     ):
         self.__intent_type = intent_type
         self.__writer_type = writer_type
         self.__retriever_type = retriever_type
         self.__reranker_type = reranker_type
         self.__answer_agent_type = answer_agent_type
+        self.__pipeline_mode = pipeline_mode
+        self.__async_workers = async_workers
         self.__rules_file_path = rules_file_path
         self.__top_k = top_k
         self.__retriever_alpha = retriever_alpha
         self.__retriever_beta = retriever_beta
+        self.__retrieval_cache_size = retrieval_cache_size
+        self.__keyword_scoring = keyword_scoring
+        self.__bm25_k1 = bm25_k1
+        self.__bm25_b = bm25_b
+        self.__bm25f_title_weight = bm25f_title_weight
+        self.__bm25f_header_weight = bm25f_header_weight
+        self.__bm25f_content_weight = bm25f_content_weight
+        self.__keyword_pruning = keyword_pruning
         self.__embedding_provider_type = embedding_provider_type
+        self.__vector_backend = vector_backend
+        self.__persist_vector_index = persist_vector_index
+        self.__embedding_batch_size = embedding_batch_size
+        self.__vector_index_type = vector_index_type
+        self.__ivf_nlist = ivf_nlist
+        self.__ivf_nprobe = ivf_nprobe
+        self.__vector_storage = vector_storage
+        self.__vector_rescore = vector_rescore
+        self.__vector_batch_window_ms = vector_batch_window_ms
+        self.__vector_batch_max_queries = vector_batch_max_queries
         self.__stopwords_file_path = stopwords_file_path
         self.__suffixes_file_path = suffixes_file_path
+        self.__stem_cache_size = stem_cache_size
+        self.__precompute_stems = precompute_stems
         self.__conjunctions_file_path = conjunctions_file_path
         self.__tf_weight = tf_weight
         self.__booster_weight = booster_weight
@@ -52,6 +105,15 @@ class Config:
         self.__reranker_beta = reranker_beta
         self.__chunk_path = chunk_path
         self.__logs_dir_path = logs_dir_path
+        self.__cache_key_mode = cache_key_mode
+        self.__cache_ttl_seconds = cache_ttl_seconds
+        self.__cache_flush_every = cache_flush_every
+        self.__trace_mode = trace_mode
+        self.__trace_level = trace_level
+        self.__trace_queue_size = trace_queue_size
+        self.__trace_flush_events = trace_flush_events
+        self.__trace_flush_interval_ms = trace_flush_interval_ms
+        self.__trace_overflow_policy = trace_overflow_policy
 
     # Getters
     def get_intent_type(self) -> str:
@@ -69,6 +131,12 @@ class Config:
     def get_answer_agent_type(self) -> str:
         return self.__answer_agent_type
 
+    def get_pipeline_mode(self) -> str:
+        return self.__pipeline_mode
+
+    def get_async_workers(self) -> int:
+        return self.__async_workers
+
     def get_rules_file_path(self) -> Path:
         return self.__rules_file_path
 
@@ -81,15 +149,75 @@ class Config:
     def get_retriever_beta(self) -> float:
         return self.__retriever_beta
 
+    def get_retrieval_cache_size(self) -> int:
+        return self.__retrieval_cache_size
+
+    def get_keyword_scoring(self) -> str:
+        return self.__keyword_scoring
+
+    def get_bm25_k1(self) -> float:
+        return self.__bm25_k1
+
+    def get_bm25_b(self) -> float:
+        return self.__bm25_b
+
+    def get_bm25f_title_weight(self) -> float:
+        return self.__bm25f_title_weight
+
+    def get_bm25f_header_weight(self) -> float:
+        return self.__bm25f_header_weight
+
+    def get_bm25f_content_weight(self) -> float:
+        return self.__bm25f_content_weight
+
+    def is_keyword_pruning(self) -> bool:
+        return self.__keyword_pruning
+
     def get_embedding_provider_type(self) -> str:
         return self.__embedding_provider_type
 
+    def get_vector_backend(self) -> str:
+        return self.__vector_backend
+
+    def is_persist_vector_index(self) -> bool:
+        return self.__persist_vector_index
+
+    def get_embedding_batch_size(self) -> int:
+        return self.__embedding_batch_size
+
+    def get_vector_index_type(self) -> str:
+        return self.__vector_index_type
+
+    def get_ivf_nlist(self) -> int:
+        return self.__ivf_nlist
+
+    def get_ivf_nprobe(self) -> int:
+        return self.__ivf_nprobe
+
+    def get_vector_storage(self) -> str:
+        return self.__vector_storage
+
+    def get_vector_rescore(self) -> int:
+        return self.__vector_rescore
+
+    def get_vector_batch_window_ms(self) -> float:
+        return self.__vector_batch_window_ms
+
+    def get_vector_batch_max_queries(self) -> int:
+        return self.__vector_batch_max_queries
+
     def get_stopwords_file_path(self) -> Path:
         return self.__stopwords_file_path
 
     def get_suffixes_file_path(self) -> Path:
         return self.__suffixes_file_path
 
+    def get_stem_cache_size(self) -> int:
+        return self.__stem_cache_size
+
+    def is_precompute_stems(self) -> bool:
+        return self.__precompute_stems
+
     def get_conjunctions_file_path(self) -> Path:
         return self.__conjunctions_file_path
 
@@ -124,4 +252,31 @@ class Config:
         return self.__chunk_path
 
     def get_logs_dir_path(self) -> Path:
-        return self.__logs_dir_path
\ No newline at end of file
+        return self.__logs_dir_path
+
+    def get_cache_key_mode(self) -> str:
+        return self.__cache_key_mode
+
+    def get_cache_ttl_seconds(self) -> float:
+        return self.__cache_ttl_seconds
+
+    def get_cache_flush_every(self) -> int:
+        return self.__cache_flush_every
+
+    def get_trace_mode(self) -> str:
+        return self.__trace_mode
+
+    def get_trace_level(self) -> str:
+        return self.__trace_level
+
+    def get_trace_queue_size(self) -> int:
+        return self.__trace_queue_size
+
+    def get_trace_flush_events(self) -> int:
+        return self.__trace_flush_events
+
+    def get_trace_flush_interval_ms(self) -> int:
+        return self.__trace_flush_interval_ms
+
+    def get_trace_overflow_policy(self) -> str:
+        return self.__trace_overflow_policy
\ No newline at end of file
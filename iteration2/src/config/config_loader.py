@@ -23,14 +23,36 @@ class ConfigLoader:
             retriever_type = config_map.get("pipeline.retriever")
             reranker_type = config_map.get("pipeline.reranker")
             answer_agent_type = config_map.get("pipeline.answer_agent")
+            pipeline_mode = config_map.get("pipeline.mode", "sequential")
+            async_workers = int(config_map.get("pipeline.async_workers", "4"))
 
             rules_file = config_map.get("params.intent.rules_file")
             top_k = int(config_map.get("params.retriever.top_k"))
             retriever_alpha = float(config_map.get("params.retriever.alpha", "0.5"))
             retriever_beta = float(config_map.get("params.retriever.beta", "0.5"))
+            retrieval_cache_size = int(config_map.get("params.retriever.cache_size", "0"))
+            keyword_scoring = config_map.get("params.retriever.scoring", "tf")
+            bm25_k1 = float(config_map.get("params.retriever.k1", "1.2"))
+            bm25_b = float(config_map.get("params.retriever.b", "0.75"))
+            bm25f_title_weight = float(config_map.get("params.retriever.title_weight", "2.0"))
+            bm25f_header_weight = float(config_map.get("params.retriever.header_weight", "1.5"))
+            bm25f_content_weight = float(config_map.get("params.retriever.content_weight", "1.0"))
+            keyword_pruning = config_map.get("params.retriever.pruning", "true").lower() == "true"
             embedding_provider_type = config_map.get("params.embedding.provider", "SimpleEmbeddingProvider")
+            vector_backend = config_map.get("params.embedding.backend", "numpy")
+            persist_vector_index = config_map.get("params.embedding.persist_index", "true").lower() == "true"
+            embedding_batch_size = int(config_map.get("params.embedding.batch_size", "256"))
+            vector_index_type = config_map.get("params.vector_index.type", "flat")
+            ivf_nlist = int(config_map.get("params.vector_index.nlist", "0"))
+            ivf_nprobe = int(config_map.get("params.vector_index.nprobe", "32"))
+            vector_storage = config_map.get("params.vector_index.storage", "float32")
+            vector_rescore = int(config_map.get("params.vector_index.rescore", "0"))
+            vector_batch_window_ms = float(config_map.get("params.vector_index.batch_window_ms", "0"))
+            vector_batch_max_queries = int(config_map.get("params.vector_index.batch_max_queries", "16"))
             stopwords_file = config_map.get("params.query_writer.stopwords_file")
             suffixes_file = config_map.get("params.query_writer.suffixes_file")
+            stem_cache_size = int(config_map.get("params.query_writer.stem_cache_size", "65536"))
+            precompute_stems = config_map.get("params.query_writer.precompute_stems", "false").lower() == "true"
             conjunctions_file = config_map.get("params.query_writer.conjunctions_file")
             tf_weight = float(config_map.get("params.query_writer.tf_weight"))
             booster_weight = float(config_map.get("params.query_writer.booster_weight"))
@@ -41,6 +63,15 @@ class ConfigLoader:
             title_boost = int(config_map.get("params.reranker.title_boost", "3"))
             reranker_alpha = float(config_map.get("params.reranker.alpha", "0.5"))
             reranker_beta = float(config_map.get("params.reranker.beta", "0.5"))
+            cache_key_mode = config_map.get("params.cache.key_mode", "text")
+            cache_ttl_seconds = float(config_map.get("params.cache.ttl_seconds", "0"))
+            cache_flush_every = int(config_map.get("params.cache.flush_every", "50"))
+            trace_mode = config_map.get("params.trace.mode", "buffered")
+            trace_level = config_map.get("params.trace.level", "summary")
+            trace_queue_size = int(config_map.get("params.trace.queue_size", "1024"))
+            trace_flush_events = int(config_map.get("params.trace.flush_events", "64"))
+            trace_flush_interval_ms = int(config_map.get("params.trace.flush_interval_ms", "200"))
+            trace_overflow_policy = config_map.get("params.trace.overflow", "block")
 
             chunk_store = config_map.get("paths.chunk_store")
             logs_dir = config_map.get("paths.logs_dir")
@@ -60,13 +91,35 @@ class ConfigLoader:
                 retriever_type=retriever_type,
                 reranker_type=reranker_type,
                 answer_agent_type=answer_agent_type,
+                pipeline_mode=pipeline_mode,
+                async_workers=async_workers,
                 rules_file_path=rules_path,
                 top_k=int(top_k),
                 retriever_alpha=retriever_alpha,
                 retriever_beta=retriever_beta,
+                retrieval_cache_size=retrieval_cache_size,
+                keyword_scoring=keyword_scoring,
+                bm25_k1=bm25_k1,
+                bm25_b=bm25_b,
+                bm25f_title_weight=bm25f_title_weight,
+                bm25f_header_weight=bm25f_header_weight,
+                bm25f_content_weight=bm25f_content_weight,
+                keyword_pruning=keyword_pruning,
                 embedding_provider_type=embedding_provider_type,
+                vector_backend=vector_backend,
+                persist_vector_index=persist_vector_index,
+                embedding_batch_size=embedding_batch_size,
+                vector_index_type=vector_index_type,
+                ivf_nlist=ivf_nlist,
+                ivf_nprobe=ivf_nprobe,
+                vector_storage=vector_storage,
+                vector_rescore=vector_rescore,
+                vector_batch_window_ms=vector_batch_window_ms,
+                vector_batch_max_queries=vector_batch_max_queries,
                 stopwords_file_path=stopwords_path,
                 suffixes_file_path=suffixes_path,
+                stem_cache_size=stem_cache_size,
+                precompute_stems=precompute_stems,
                 conjunctions_file_path=conjunctions_path,
                 tf_weight=tf_weight,
                 booster_weight=booster_weight,
@@ -78,7 +131,16 @@ class ConfigLoader:
                 reranker_alpha=reranker_alpha,
                 reranker_beta=reranker_beta,
                 chunk_path=chunk_path,
-                logs_dir_path=logs_path
+                logs_dir_path=logs_path,
+                cache_key_mode=cache_key_mode,
+                cache_ttl_seconds=cache_ttl_seconds,
+                cache_flush_every=cache_flush_every,
+                trace_mode=trace_mode,
+                trace_level=trace_level,
+                trace_queue_size=trace_queue_size,
+                trace_flush_events=trace_flush_events,
+                trace_flush_interval_ms=trace_flush_interval_ms,
+                trace_overflow_policy=trace_overflow_policy
             )
         
         
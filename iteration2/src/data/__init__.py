@@ -1,8 +1,9 @@
 # Data package
 from src.data.chunk_store import ChunkStore
-from src.data.chunk_loader import ChunkLoader
+from src.data.chunk_loader import ChunkLoadProgress, ChunkLoader
 
 __all__ = [
     'ChunkStore',
-    'ChunkLoader'
+    'ChunkLoader',
+    'ChunkLoadProgress'
 ]
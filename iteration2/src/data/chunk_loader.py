@@ -1,57 +1,277 @@
+import codecs
 import json
+import os
 from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, List, Optional
 from src.data.chunk_store import ChunkStore
 from src.model.chunk import Chunk
 
+
+class ChunkLoadProgress:
+    """
+    Counters of one ChunkLoader pass, handed to the progress callback
+    every progress_interval chunks and once more when the load is done.
+    At most MAX_ERRORS skip messages are kept; the count covers them all.
+    """
+
+    MAX_ERRORS = 100
+
+    __slots__ = ("__path", "__total_bytes", "__bytes_read", "__chunk_count", "__skipped_count", "__errors", "__done")
+
+    def __init__(self, path: Path, total_bytes: int):
+        self.__path = path
+        self.__total_bytes = total_bytes
+        self.__bytes_read = 0
+        self.__chunk_count = 0
+        self.__skipped_count = 0
+        self.__errors: List[str] = []
+        self.__done = False
+
+    def get_path(self) -> Path:
+        return self.__path
+
+    def get_total_bytes(self) -> int:
+        return self.__total_bytes
+
+    def get_bytes_read(self) -> int:
+        return self.__bytes_read
+
+    def get_fraction(self) -> float:
+        """Share of the file read so far, 0.0 to 1.0."""
+        if self.__total_bytes <= 0:
+            return 1.0 if self.__done else 0.0
+        return min(1.0, self.__bytes_read / self.__total_bytes)
+
+    def get_chunk_count(self) -> int:
+        return self.__chunk_count
+
+    def get_skipped_count(self) -> int:
+        return self.__skipped_count
+
+    def get_errors(self) -> List[str]:
+        return list(self.__errors)
+
+    def is_done(self) -> bool:
+        return self.__done
+
+    def add_bytes(self, count: int) -> None:
+        self.__bytes_read += count
+
+    def add_chunk(self) -> None:
+        self.__chunk_count += 1
+
+    def skip(self, message: str) -> None:
+        self.__skipped_count += 1
+        if len(self.__errors) < self.MAX_ERRORS:
+            self.__errors.append(message)
+
+    def finish(self) -> None:
+        self.__done = True
+
+
 class ChunkLoader:
-    
+    """
+    Loads a chunk corpus into a ChunkStore as the file is read.
+
+    Two formats are accepted:
+    - the nested {"documents": [{"docId", "title", "sections": [{"sectionId",
+      "header", "chunks": [{"chunkId", "startOffset", "endOffset",
+      "content"}]}]}]} JSON, decoded one document at a time;
+    - JSON Lines (".jsonl" / ".ndjson"), one chunk per line with "docId",
+      "sectionId", "chunkId", "startOffset", "endOffset", "content" and
+      optionally the "title" of its document and "header" of its section.
+    Besides the store, memory holds one document (or line) and one read
+    block, never the whole parsed file.
+
+    A document, section or chunk that is not valid is skipped and recorded
+    in the ChunkLoadProgress (get_last_progress()); only an unreadable file
+    or broken JSON syntax in the nested format aborts the load, since the
+    parser cannot find the next document after it.
+    """
+
+    JSONL_SUFFIXES = (".jsonl", ".ndjson")
+    BLOCK_SIZE = 1 << 20
+
+    def __init__(
+        self,
+        progress: Optional[Callable[[ChunkLoadProgress], None]] = None,
+        progress_interval: int = 100000
+    ):
+        self.__progress = progress
+        self.__progress_interval = max(1, progress_interval)
+        self.__last_progress: Optional[ChunkLoadProgress] = None
+
+    def get_last_progress(self) -> Optional[ChunkLoadProgress]:
+        return self.__last_progress
 
     def load_chunks(self, chunks_json_path: Path) -> ChunkStore:
+        chunk_store = ChunkStore()
+        for _ in self.stream_chunks(chunks_json_path, chunk_store):
+            pass
+        return chunk_store
+
+    def stream_chunks(self, chunks_path: Path, chunk_store: ChunkStore) -> Iterator[Chunk]:
+        """
+        Adds every valid chunk of the corpus to chunk_store as soon as it is
+        parsed and then yields it. Titles and headers are set on the store
+        as well. The keyword and vector indexes are not fed from here; they
+        are built from the complete store when first needed.
+        """
+        chunks_path = Path(chunks_path)
         try:
-            with open(chunks_json_path, "r", encoding="utf-8") as f:
-                json_content = json.load(f)
+            progress = ChunkLoadProgress(chunks_path, os.path.getsize(chunks_path))
+            self.__last_progress = progress
 
-            chunk_store = ChunkStore()
-            self.__parse_json_and_load_chunks(json_content, chunk_store)
-            return chunk_store
+            with open(chunks_path, "rb") as f:
+                if chunks_path.suffix.lower() in self.JSONL_SUFFIXES:
+                    chunks = self.__read_jsonl(f, chunk_store, progress)
+                else:
+                    chunks = self.__read_documents(f, chunk_store, progress)
+
+                for chunk in chunks:
+                    chunk_store.add_chunk(chunk)
+                    progress.add_chunk()
+                    if self.__progress is not None and progress.get_chunk_count() % self.__progress_interval == 0:
+                        self.__progress(progress)
+                    yield chunk
+
+            progress.finish()
+            if self.__progress is not None:
+                self.__progress(progress)
 
         except Exception as e:
-            raise RuntimeError(f"Failed to load chunks from: {chunks_json_path}") from e
+            raise RuntimeError(f"Failed to load chunks from: {chunks_path}") from e
+
+    # --------------------------
+    # Nested JSON
+    # --------------------------
 
-    def __parse_json_and_load_chunks(self, json_content: dict, chunk_store: ChunkStore) -> None:
-        documents = json_content.get("documents", [])
-        for doc in documents:
-            self.__parse_document(doc, chunk_store)
+    def __read_documents(self, stream: BinaryIO, chunk_store: ChunkStore, progress: ChunkLoadProgress) -> Iterator[Chunk]:
+        reader = _JsonDocumentReader(stream, progress, self.BLOCK_SIZE)
+        for index, doc in enumerate(reader.documents()):
+            yield from self.__parse_document(doc, index, chunk_store, progress)
+
+    def __parse_document(self, doc: object, index: int, chunk_store: ChunkStore, progress: ChunkLoadProgress) -> Iterator[Chunk]:
+        if not isinstance(doc, dict):
+            progress.skip(f"documents[{index}]: not an object")
+            return
 
-    def __parse_document(self, doc: dict, chunk_store: ChunkStore) -> None:
         doc_id = doc.get("docId")
         if doc_id is None:
-            raise RuntimeError("Invalid document: docId not found")
+            progress.skip(f"documents[{index}]: docId not found")
+            return
 
         title = doc.get("title")
         if title:
             chunk_store.set_document_title(doc_id, title)
 
         sections = doc.get("sections", [])
-        for section in sections:
-            self.__parse_section(section, doc_id, chunk_store)
+        if not isinstance(sections, list):
+            progress.skip(f"document {doc_id}: sections is not a list")
+            return
+
+        for section_index, section in enumerate(sections):
+            yield from self.__parse_section(section, doc_id, section_index, chunk_store, progress)
+
+    def __parse_section(
+        self,
+        section: object,
+        doc_id: str,
+        section_index: int,
+        chunk_store: ChunkStore,
+        progress: ChunkLoadProgress
+    ) -> Iterator[Chunk]:
+        if not isinstance(section, dict):
+            progress.skip(f"document {doc_id}, sections[{section_index}]: not an object")
+            return
 
-    def __parse_section(self, section: dict, doc_id: str, chunk_store: ChunkStore) -> None:
         section_id = section.get("sectionId", "")
+        header = section.get("header")
+        if header:
+            chunk_store.set_section_header(doc_id, section_id, header)
+
         chunks = section.get("chunks", [])
-        for chunk in chunks:
-            self.__parse_chunk(chunk, doc_id, section_id, chunk_store)
+        if not isinstance(chunks, list):
+            progress.skip(f"document {doc_id}, section {section_id}: chunks is not a list")
+            return
+
+        for chunk_index, chunk in enumerate(chunks):
+            location = f"document {doc_id}, section {section_id}, chunks[{chunk_index}]"
+            chunk_obj = self.__parse_chunk(chunk, doc_id, section_id, location, progress)
+            if chunk_obj is not None:
+                yield chunk_obj
+
+    # --------------------------
+    # JSON Lines
+    # --------------------------
+
+    def __read_jsonl(self, stream: BinaryIO, chunk_store: ChunkStore, progress: ChunkLoadProgress) -> Iterator[Chunk]:
+        decoder = json.JSONDecoder()
+        for line_number, line in enumerate(stream, 1):
+            progress.add_bytes(len(line))
+            if not line.strip():
+                continue
+
+            location = f"line {line_number}"
+            try:
+                record = decoder.decode(line.decode("utf-8"))
+            except ValueError as e:  # also UnicodeDecodeError
+                progress.skip(f"{location}: {e}")
+                continue
+            if not isinstance(record, dict):
+                progress.skip(f"{location}: not an object")
+                continue
+
+            doc_id = record.get("docId")
+            if doc_id is None:
+                progress.skip(f"{location}: docId not found")
+                continue
+            section_id = record.get("sectionId", "")
+
+            chunk_obj = self.__parse_chunk(record, doc_id, section_id, location, progress)
+            if chunk_obj is None:
+                continue
+
+            title = record.get("title")
+            if title:
+                chunk_store.set_document_title(doc_id, title)
+            header = record.get("header")
+            if header:
+                chunk_store.set_section_header(doc_id, section_id, header)
+            yield chunk_obj
+
+    # --------------------------
+    # Chunks
+    # --------------------------
+
+    def __parse_chunk(
+        self,
+        chunk: object,
+        doc_id: str,
+        section_id: str,
+        location: str,
+        progress: ChunkLoadProgress
+    ) -> Optional[Chunk]:
+        if not isinstance(chunk, dict):
+            progress.skip(f"{location}: not an object")
+            return None
 
-    def __parse_chunk(self, chunk: dict, doc_id: str, section_id: str, chunk_store: ChunkStore) -> None:
         chunk_id = chunk.get("chunkId")
         content = chunk.get("content")
-        start_offset = chunk.get("startOffset", 0)
-        end_offset = chunk.get("endOffset", 0)
+        start_offset = self.__parse_offset(chunk.get("startOffset"))
+        end_offset = self.__parse_offset(chunk.get("endOffset"))
 
         if chunk_id is None or content is None:
-            raise RuntimeError("Invalid chunk: missing required fields")
+            progress.skip(f"{location}: missing required fields")
+            return None
+        if not isinstance(content, str):
+            progress.skip(f"{location}: content is not a string")
+            return None
+        if start_offset is None or end_offset is None:
+            progress.skip(f"{location}: offsets are not integers")
+            return None
 
-        chunk_obj = Chunk(
+        return Chunk(
             doc_id=doc_id,
             chunk_id=chunk_id,
             text=content,
@@ -59,4 +279,127 @@ class ChunkLoader:
             start_offset=start_offset,
             end_offset=end_offset
         )
-        chunk_store.add_chunk(chunk_obj)
+
+    @staticmethod
+    def __parse_offset(value: object) -> Optional[int]:
+        """
+        A missing or null offset is 0, as Chunk has always treated it, and
+        an integral float such as 14.0 is its int. None if the value cannot
+        be an offset.
+        """
+        if value is None:
+            return 0
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, int):
+            return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return None
+
+
+class _JsonDocumentReader:
+    """
+    Incremental reader of the nested corpus object that yields the elements
+    of its "documents" array one at a time. Other top-level keys are decoded
+    and dropped. The buffer holds the unread text of the current block and
+    grows only while a single value does not fit in it.
+    """
+
+    WHITESPACE = " \t\r\n"
+
+    def __init__(self, stream: BinaryIO, progress: ChunkLoadProgress, block_size: int):
+        self.__stream = stream
+        self.__progress = progress
+        self.__block_size = block_size
+        self.__text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__json_decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__pos = 0
+        self.__eof = False
+
+    def documents(self) -> Iterator[object]:
+        self.__expect("{")
+        if self.__peek() == "}":
+            self.__pos += 1
+        else:
+            while True:
+                key = self.__value()
+                if not isinstance(key, str):
+                    raise ValueError("Expected an object key")
+                self.__expect(":")
+                if key == "documents":
+                    yield from self.__array()
+                else:
+                    self.__value()
+                char = self.__next_char()
+                if char == "}":
+                    break
+                if char != ",":
+                    raise ValueError("Expected ',' or '}' after a corpus object member")
+
+        if self.__peek() is not None:
+            raise ValueError("Extra data after the corpus object")
+
+    def __array(self) -> Iterator[object]:
+        self.__expect("[")
+        if self.__peek() == "]":
+            self.__pos += 1
+            return
+        while True:
+            yield self.__value()
+            char = self.__next_char()
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError("Expected ',' or ']' after a document")
+
+    def __value(self) -> object:
+        self.__peek()
+        while True:
+            try:
+                value, end = self.__json_decoder.raw_decode(self.__buffer, self.__pos)
+            except json.JSONDecodeError:
+                if self.__eof:
+                    raise
+                self.__fill()
+                continue
+            # A number at the end of the buffer may continue in the next block.
+            if end == len(self.__buffer) and not self.__eof:
+                self.__fill()
+                continue
+            self.__pos = end
+            return value
+
+    def __expect(self, char: str) -> None:
+        if self.__next_char() != char:
+            raise ValueError(f"Expected '{char}' in the corpus object")
+
+    def __next_char(self) -> Optional[str]:
+        char = self.__peek()
+        if char is not None:
+            self.__pos += 1
+        return char
+
+    def __peek(self) -> Optional[str]:
+        """Next non-whitespace character without consuming it; None at the end."""
+        while True:
+            buffer = self.__buffer
+            while self.__pos < len(buffer) and buffer[self.__pos] in self.WHITESPACE:
+                self.__pos += 1
+            if self.__pos < len(buffer):
+                return buffer[self.__pos]
+            if self.__eof:
+                return None
+            self.__fill()
+
+    def __fill(self) -> None:
+        # Reading at least the unread length doubles the buffer on every
+        # retry, so a value larger than a block is decoded a few times only.
+        data = self.__stream.read(max(self.__block_size, len(self.__buffer) - self.__pos))
+        self.__progress.add_bytes(len(data))
+        if not data:
+            self.__eof = True
+        text = self.__text_decoder.decode(data, final=not data)
+        self.__buffer = self.__buffer[self.__pos:] + text
+        self.__pos = 0
@@ -1,31 +1,188 @@
-from typing import Dict, List, Set, Optional
+from array import array
+from functools import partial
+from typing import Dict, Iterator, List, Set, Optional, Tuple
+import hashlib
 from src.model.chunk import Chunk
+from src.model.chunk_analysis import ChunkAnalysis
 
 class ChunkStore:
-    
+    """
+    Columnar chunk storage addressed by integer chunk ordinals.
+
+    Ordinals follow insertion order; re-adding an existing (docId, chunkId)
+    replaces that chunk in place and keeps its ordinal. Doc and section IDs
+    are interned into small tables referenced by index, offsets live in
+    integer arrays, and all texts share one UTF-8 byte buffer sliced by
+    start/end byte indices. Chunk objects are only materialized on request
+    (get_chunk, get_chunk_at, get_all_chunks); they share the store's
+    cached ChunkAnalysis, so a chunk is still analyzed once per process.
+    """
+
+    # Text start of a chunk whose text is None.
+    __NO_TEXT = -1
+
     def __init__(self) -> None:
-        self.__chunks: Dict[str, Chunk] = {}  # key: "docId||chunkId"
+        self.__ordinals: Dict[Tuple[str, str], int] = {}  # key: (docId, chunkId)
+        self.__doc_ids: List[str] = []  # interned doc IDs
+        self.__doc_id_index: Dict[str, int] = {}
+        self.__section_ids: List[str] = []  # interned section IDs
+        self.__section_id_index: Dict[str, int] = {}
+        self.__chunk_doc = array("i")  # per ordinal: index into __doc_ids
+        self.__chunk_section = array("i")  # per ordinal: index into __section_ids
+        self.__chunk_ids: List[str] = []
+        self.__start_offsets = array("q")
+        self.__end_offsets = array("q")
+        self.__text_starts = array("q")  # per ordinal: byte slice of the text buffer
+        self.__text_ends = array("q")
+        self.__text_buffer = bytearray()
+        self.__analyses: List[Optional[ChunkAnalysis]] = []
         self.__document_titles: Dict[str, str] = {}  # key: docId, value: title
+        self.__section_headers: Dict[Tuple[str, str], str] = {}  # key: (docId, sectionId), value: header
+        self.__version: int = 0  # bumped on every chunk change so derived indexes can detect staleness
+        self.__fingerprint: Optional[Tuple[int, str]] = None  # (version, digest) of the last get_fingerprint()
 
     def add_chunk(self, chunk: Chunk) -> None:
-        key = f"{chunk.get_doc_id()}||{chunk.get_chunk_id()}"
-        self.__chunks[key] = chunk
+        doc_id = chunk.get_doc_id()
+        chunk_id = chunk.get_chunk_id()
+        text = chunk.get_text()
+
+        if text is None:
+            text_start = text_end = self.__NO_TEXT
+        else:
+            text_start = len(self.__text_buffer)
+            self.__text_buffer += text.encode("utf-8")
+            text_end = len(self.__text_buffer)
+
+        doc = self.__intern(doc_id, self.__doc_ids, self.__doc_id_index)
+        section = self.__intern(chunk.get_section_id(), self.__section_ids, self.__section_id_index)
+
+        ordinal = self.__ordinals.get((doc_id, chunk_id))
+        if ordinal is None:
+            self.__ordinals[(doc_id, chunk_id)] = len(self.__chunk_ids)
+            self.__chunk_doc.append(doc)
+            self.__chunk_section.append(section)
+            self.__chunk_ids.append(chunk_id)
+            self.__start_offsets.append(chunk.get_start_offset())
+            self.__end_offsets.append(chunk.get_end_offset())
+            self.__text_starts.append(text_start)
+            self.__text_ends.append(text_end)
+            self.__analyses.append(None)
+        else:
+            # The replaced text stays in the buffer, unreferenced.
+            self.__chunk_section[ordinal] = section
+            self.__start_offsets[ordinal] = chunk.get_start_offset()
+            self.__end_offsets[ordinal] = chunk.get_end_offset()
+            self.__text_starts[ordinal] = text_start
+            self.__text_ends[ordinal] = text_end
+            self.__analyses[ordinal] = None
+        self.__version += 1
+
+    @staticmethod
+    def __intern(value: str, table: List[str], index: Dict[str, int]) -> int:
+        position = index.get(value)
+        if position is None:
+            position = index[value] = len(table)
+            table.append(value)
+        return position
+
+    def get_chunk(self, doc_id: str, chunk_id: str, ordinal: Optional[int] = None) -> Optional[Chunk]:
+        """
+        Looks the chunk up by ID. A known ordinal (e.g. from a Hit) skips
+        the hash lookup when it still points at the same chunk.
+        """
+        if ordinal is not None and 0 <= ordinal < len(self.__chunk_ids) and self.get_chunk_ref_at(ordinal) == (doc_id, chunk_id):
+            return self.get_chunk_at(ordinal)
+        ordinal = self.__ordinals.get((doc_id, chunk_id))
+        if ordinal is None:
+            return None
+        return self.get_chunk_at(ordinal)
+
+    def get_ordinal(self, doc_id: str, chunk_id: str) -> Optional[int]:
+        return self.__ordinals.get((doc_id, chunk_id))
+
+    def get_chunk_at(self, ordinal: int) -> Chunk:
+        return Chunk(
+            self.__doc_ids[self.__chunk_doc[ordinal]],
+            self.__chunk_ids[ordinal],
+            self.get_text_at(ordinal),
+            self.__section_ids[self.__chunk_section[ordinal]],
+            self.__start_offsets[ordinal],
+            self.__end_offsets[ordinal],
+            analysis=self.get_analysis_at(ordinal)
+        )
 
-    def get_chunk(self, doc_id: str, chunk_id: str) -> Optional[Chunk]:
-        key = f"{doc_id}||{chunk_id}"
-        return self.__chunks.get(key)
+    def get_chunk_ref_at(self, ordinal: int) -> Tuple[str, str]:
+        """(docId, chunkId) of a chunk ordinal; the strings are shared, not copied."""
+        return self.__doc_ids[self.__chunk_doc[ordinal]], self.__chunk_ids[ordinal]
+
+    def get_text_at(self, ordinal: int) -> Optional[str]:
+        start = self.__text_starts[ordinal]
+        if start == self.__NO_TEXT:
+            return None
+        return self.__text_buffer[start:self.__text_ends[ordinal]].decode("utf-8")
+
+    def get_analysis_at(self, ordinal: int) -> ChunkAnalysis:
+        analysis = self.__analyses[ordinal]
+        if analysis is None:
+            # The analysis re-reads the text from the buffer instead of
+            # holding its own copy.
+            analysis = self.__analyses[ordinal] = ChunkAnalysis(text_loader=partial(self.get_text_at, ordinal))
+        return analysis
 
     def get_all_chunks(self) -> List[Chunk]:
-        return list(self.__chunks.values())
+        return list(self.iter_chunks())
+
+    def iter_chunks(self) -> Iterator[Chunk]:
+        """Chunks in ordinal order, materialized one at a time."""
+        for ordinal in range(len(self.__chunk_ids)):
+            yield self.get_chunk_at(ordinal)
 
     def set_document_title(self, doc_id: str, title: str) -> None:
         self.__document_titles[doc_id] = title
+        self.__version += 1
 
     def get_document_title(self, doc_id: str) -> Optional[str]:
         return self.__document_titles.get(doc_id)
 
+    def set_section_header(self, doc_id: str, section_id: str, header: str) -> None:
+        self.__section_headers[(doc_id, section_id)] = header
+        self.__version += 1
+
+    def get_section_header(self, doc_id: str, section_id: str) -> Optional[str]:
+        return self.__section_headers.get((doc_id, section_id))
+
     def get_all_doc_ids(self) -> Set[str]:
         return set(self.__document_titles.keys())
 
+    def get_fingerprint(self) -> str:
+        """
+        SHA-256 of the stored content: IDs, offsets, texts, titles and
+        headers. Stores loaded separately from the same file share it, so it
+        can key caches shared across sessions. Recomputed only after a change.
+        """
+        if self.__fingerprint is not None and self.__fingerprint[0] == self.__version:
+            return self.__fingerprint[1]
+
+        digest = hashlib.sha256()
+        for strings in (self.__doc_ids, self.__section_ids, self.__chunk_ids):
+            digest.update(len(strings).to_bytes(8, "little"))
+            digest.update("\x1f".join(strings).encode("utf-8"))
+        for column in (
+            self.__chunk_doc, self.__chunk_section, self.__start_offsets,
+            self.__end_offsets, self.__text_starts, self.__text_ends
+        ):
+            digest.update(column.tobytes())
+        digest.update(self.__text_buffer)
+        for (doc_id, section_id), header in sorted(self.__section_headers.items()):
+            digest.update(f"\x1e{doc_id}\x1f{section_id}\x1f{header}".encode("utf-8"))
+        for doc_id, title in sorted(self.__document_titles.items()):
+            digest.update(f"\x1d{doc_id}\x1f{title}".encode("utf-8"))
+
+        self.__fingerprint = (self.__version, digest.hexdigest())
+        return self.__fingerprint[1]
+
+    def get_version(self) -> int:
+        return self.__version
+
     def size(self) -> int:
-        return len(self.__chunks)
+        return len(self.__chunk_ids)
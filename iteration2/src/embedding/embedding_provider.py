@@ -1,8 +1,40 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Sequence
+
+from src.model.chunk import Chunk
+
+try:
+    import numpy as np
+except ImportError:  # embed() stays usable without numpy
+    np = None
 
 class EmbeddingProvider(ABC):
 
     @abstractmethod
     def embed(self, text: str) -> List[float]:
-        pass
\ No newline at end of file
+        pass
+
+    def embed_batch(self, texts: Sequence[str]) -> "np.ndarray":
+        """
+        Embeds many texts at once; row i is embed(texts[i]) as float64.
+        Providers override this when they can do better than one embed()
+        call per text.
+        """
+        vectors = [self.embed(text) for text in texts]
+        if not vectors:
+            return np.zeros((0, 0), dtype=np.float64)
+        return np.asarray(vectors, dtype=np.float64)
+
+    def embed_chunks(self, chunks: Sequence[Chunk]) -> "np.ndarray":
+        """
+        embed_batch() of the chunk texts. Providers that tokenize like the
+        chunk analysis can read it instead of re-analyzing the text.
+        """
+        return self.embed_batch([chunk.get_text() for chunk in chunks])
+
+    def get_signature(self) -> str:
+        """
+        Describes every setting that affects the produced vectors.
+        Persisted indexes are only reused when this signature matches.
+        """
+        return type(self).__name__
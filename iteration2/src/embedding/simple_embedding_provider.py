@@ -1,6 +1,7 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 import re
-from src.embedding.embedding_provider import EmbeddingProvider
+from src.embedding.embedding_provider import EmbeddingProvider, np
+from src.model.chunk import Chunk
 from src.writer.simple_stemmer import SimpleStemmer
 
 
@@ -11,8 +12,20 @@ class SimpleEmbeddingProvider(EmbeddingProvider):
     Uses word-based embedding with TF-like weighting for better semantic similarity.
     """
 
+    DIMENSIONS = 128
+    BUCKETS_PER_WORD = 4
+
     def __init__(self, stemmer: Optional[SimpleStemmer] = None):
         self.__stemmer = stemmer
+        # stemmed term -> the buckets it adds its weight to
+        self.__bucket_cache: Dict[str, Tuple[int, ...]] = {}
+
+    def get_signature(self) -> str:
+        if self.__stemmer is None:
+            stemmer_settings = "none"
+        else:
+            stemmer_settings = f"{self.__stemmer.min_word_length}:{','.join(self.__stemmer.suffixes_sorted)}"
+        return f"{type(self).__name__}(dim={self.DIMENSIONS}, stemmer={stemmer_settings})"
 
     def __word_hash(self, word: str) -> int:
         hash_val = 0
@@ -21,7 +34,7 @@ class SimpleEmbeddingProvider(EmbeddingProvider):
         return hash_val
 
     def embed(self, text: str) -> List[float]:
-        vector = [0.0] * 128
+        vector = [0.0] * self.DIMENSIONS
         if not text:
             return vector
 
@@ -46,8 +59,58 @@ class SimpleEmbeddingProvider(EmbeddingProvider):
         for word, count in word_counts.items():
             word_hash = self.__word_hash(word)
             tf = count / total_words
-            for i in range(4):
-                idx = (word_hash + i * 37) % 128
+            for i in range(self.BUCKETS_PER_WORD):
+                idx = (word_hash + i * 37) % self.DIMENSIONS
                 vector[idx] += tf
 
-        return vector
\ No newline at end of file
+        return vector
+
+    def embed_batch(self, texts: Sequence[str]) -> "np.ndarray":
+        """
+        Same vectors as embed(), built for all texts with one scatter-add.
+        Bucket weights are accumulated in the same order as embed() does,
+        so the rows are bit-identical to the per-text vectors.
+        """
+        return self.__scatter([
+            self.__stemmer.stem_terms(words) if self.__stemmer else words
+            for words in (re.findall(r'\b\w+\b', text.lower()) if text else [] for text in texts)
+        ])
+
+    def embed_chunks(self, chunks: Sequence[Chunk]) -> "np.ndarray":
+        """embed_batch() of the chunk texts, from the chunks' cached stems."""
+        return self.__scatter([chunk.get_analysis().get_stems(self.__stemmer) for chunk in chunks])
+
+    def __scatter(self, term_lists: Sequence[Sequence[str]]) -> "np.ndarray":
+        rows: List[int] = []
+        buckets: List[int] = []
+        weights: List[float] = []
+
+        for row, terms in enumerate(term_lists):
+            term_counts: Dict[str, int] = {}
+            for term in terms:
+                if len(term) < 2:
+                    continue
+                term_counts[term] = term_counts.get(term, 0) + 1
+
+            total_words = sum(term_counts.values())
+            for term, count in term_counts.items():
+                tf = count / total_words
+                for idx in self.__term_buckets(term):
+                    rows.append(row)
+                    buckets.append(idx)
+                    weights.append(tf)
+
+        flat = np.bincount(
+            np.asarray(rows, dtype=np.int64) * self.DIMENSIONS + np.asarray(buckets, dtype=np.int64),
+            weights=np.asarray(weights, dtype=np.float64),
+            minlength=len(term_lists) * self.DIMENSIONS
+        )
+        return flat.reshape(len(term_lists), self.DIMENSIONS)
+
+    def __term_buckets(self, term: str) -> Tuple[int, ...]:
+        entry = self.__bucket_cache.get(term)
+        if entry is None:
+            word_hash = self.__word_hash(term)
+            entry = tuple((word_hash + i * 37) % self.DIMENSIONS for i in range(self.BUCKETS_PER_WORD))
+            self.__bucket_cache[term] = entry
+        return entry
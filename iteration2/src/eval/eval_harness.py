@@ -1,22 +1,25 @@
 import json
 import time
 import statistics
-import re
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
+from src.cache.retrieval_cache import RetrievalCache
 from src.config.config import Config
 from src.config.config_loader import ConfigLoader
 from src.context.context import Context
 from src.data.chunk_loader import ChunkLoader
+from src.orchestrator.pipeline_session import PipelineSession
 from src.orchestrator.sequential_rag_pipeline import SequentialRagPipeline
 from src.trace.trace_bus import TraceBus
 from src.model.query import Query
 from src.model.hit import Hit
+from src.model.chunk_analysis import ChunkAnalysis
 
 class EvalHarness:
     
-    def __init__(self, config_path: str, ground_truth_path: str):
+    def __init__(self, config_path: str, ground_truth_path: str,
+                 retrieval_cache: Optional[RetrievalCache] = None):
         print(f"Loading config from {config_path}...")
         self.config_loader = ConfigLoader(Path(config_path))
         self.config: Config = self.config_loader.load_config()
@@ -24,6 +27,9 @@ class EvalHarness:
         print("Loading chunks...")
         self.chunk_loader = ChunkLoader()
         self.chunk_store = self.chunk_loader.load_chunks(self.config.get_chunk_path())
+        # Passing one RetrievalCache to several harnesses lets reranker/answer
+        # sweeps reuse identical candidate lists.
+        self.session = PipelineSession(self.config, self.chunk_store, retrieval_cache)
         
         self.ground_truth_path = Path(ground_truth_path)
         with open(self.ground_truth_path, 'r', encoding='utf-8') as f:
@@ -31,13 +37,7 @@ class EvalHarness:
 
     def normalize_text(self, text: str) -> str:
         """Metni temizler, Türkçe karakterleri düzeltir ve noktalama işaretlerini atar."""
-        if not text: return ""
-        text = str(text)
-        text = text.replace("İ", "i").replace("I", "ı").replace("Ğ", "ğ").replace("Ü", "ü").replace("Ş", "ş").replace("Ö", "ö").replace("Ç", "ç")
-        text = text.lower()
-        text = re.sub(r'[^a-z0-9@\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        return ChunkAnalysis.normalize_for_matching(text)
 
     def calculate_coverage_at_k(self, hits: List[Hit], expected_keywords: List[str], k: int = 10) -> float:
         """Calculate coverage@k: how many of the top-k chunks contain expected keywords."""
@@ -50,10 +50,10 @@ class EvalHarness:
         
         matched_chunks = 0
         for hit in top_k_hits:
-            chunk = self.chunk_store.get_chunk(hit.get_doc_id(), hit.get_chunk_id())
+            chunk = self.chunk_store.get_chunk(hit.get_doc_id(), hit.get_chunk_id(), hit.get_ordinal())
             if chunk is None:
                 continue
-            chunk_text_clean = self.normalize_text(chunk.get_text())
+            chunk_text_clean = chunk.get_analysis().get_match_text()
             for kw in expected_keywords:
                 kw_clean = self.normalize_text(kw)
                 if kw_clean in chunk_text_clean:
@@ -63,6 +63,13 @@ class EvalHarness:
         return matched_chunks / len(top_k_hits) if top_k_hits else 0.0
 
     def run(self):
+        try:
+            self.__run_cases()
+        finally:
+            # Flushes the session's trace sink and stops its worker threads.
+            self.session.close()
+
+    def __run_cases(self):
         total_questions = len(self.test_cases)
         print(f"\nStarting evaluation on {total_questions} questions...")
         print("Metrics: Accuracy, Coverage@k, Latency\n")
@@ -81,7 +88,7 @@ class EvalHarness:
             context.set_question(query)
             context.set_chunk_store(self.chunk_store)
             
-            pipeline = SequentialRagPipeline(self.config, context, trace_bus)
+            pipeline = SequentialRagPipeline(self.config, context, trace_bus, self.session)
             
             start_time = time.time()
             try:
@@ -0,0 +1,94 @@
+from typing import Optional
+
+import numpy as np
+
+
+class IvfPartition:
+    """
+    Inverted-file coarse quantizer over a matrix of L2-normalized rows.
+
+    Rows are clustered with spherical k-means (dot-product assignment,
+    re-normalized centroids) into nlist cells. A search probes only the
+    nprobe cells whose centroids are closest to the query and returns
+    their row ids as the candidates for exact re-scoring.
+    """
+
+    MAX_ITERATIONS = 10
+    # Centroids are trained on a sample; assignment always covers every row.
+    TRAINING_ROWS_PER_LIST = 64
+    ASSIGN_BATCH_ROWS = 65536
+
+    def __init__(self, matrix: "np.ndarray", nlist: int = 0, seed: int = 0):
+        n = matrix.shape[0] if matrix.ndim == 2 else 0
+        if nlist <= 0:
+            nlist = int(round(4 * np.sqrt(n)))
+        self.__nlist = max(1, min(nlist, n)) if n else 0
+
+        self.__centroids = np.zeros((0, matrix.shape[1] if matrix.ndim == 2 else 0), dtype=np.float32)
+        self.__list_offsets = np.zeros(1, dtype=np.int64)
+        self.__list_rows = np.zeros(0, dtype=np.int64)
+
+        if self.__nlist:
+            self.__train(matrix, np.random.default_rng(seed))
+            self.__build_lists(matrix)
+
+    def __train(self, matrix: "np.ndarray", rng: "np.random.Generator") -> None:
+        n = matrix.shape[0]
+        sample_size = min(n, self.__nlist * self.TRAINING_ROWS_PER_LIST)
+        sample = matrix[np.sort(rng.choice(n, sample_size, replace=False))] if sample_size < n else np.asarray(matrix)
+
+        centroids = sample[rng.choice(sample.shape[0], self.__nlist, replace=False)].astype(np.float32)
+        for _ in range(self.MAX_ITERATIONS):
+            assignment = self.__assign(sample, centroids)
+            sums = np.zeros_like(centroids, dtype=np.float64)
+            np.add.at(sums, assignment, sample)
+            counts = np.bincount(assignment, minlength=self.__nlist)
+
+            # Empty cells are reseeded from random sample rows.
+            empty = np.flatnonzero(counts == 0)
+            if empty.size:
+                sums[empty] = sample[rng.choice(sample.shape[0], empty.size, replace=False)]
+
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            np.divide(sums, norms, out=sums, where=norms > 0)
+            updated = sums.astype(np.float32)
+            if np.array_equal(updated, centroids):
+                break
+            centroids = updated
+
+        self.__centroids = centroids
+
+    def __assign(self, rows: "np.ndarray", centroids: "np.ndarray") -> "np.ndarray":
+        assignment = np.empty(rows.shape[0], dtype=np.int64)
+        for start in range(0, rows.shape[0], self.ASSIGN_BATCH_ROWS):
+            block = rows[start:start + self.ASSIGN_BATCH_ROWS]
+            assignment[start:start + block.shape[0]] = np.argmax(block @ centroids.T, axis=1)
+        return assignment
+
+    def __build_lists(self, matrix: "np.ndarray") -> None:
+        assignment = self.__assign(matrix, self.__centroids)
+        # Stable sort keeps store order inside every cell.
+        self.__list_rows = np.argsort(assignment, kind="stable")
+        self.__list_offsets = np.concatenate(([0], np.cumsum(np.bincount(assignment, minlength=self.__nlist))))
+
+    def get_nlist(self) -> int:
+        return self.__nlist
+
+    def get_list_sizes(self) -> "np.ndarray":
+        return np.diff(self.__list_offsets)
+
+    def candidates(self, query: "np.ndarray", nprobe: int) -> Optional["np.ndarray"]:
+        """
+        Row ids in the nprobe cells nearest to the (normalized) query, in
+        ascending order; None when every cell is probed anyway.
+        """
+        if nprobe >= self.__nlist:
+            return None
+
+        centroid_scores = self.__centroids @ query
+        probe = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+        rows = np.concatenate([
+            self.__list_rows[self.__list_offsets[cell]:self.__list_offsets[cell + 1]] for cell in probe
+        ])
+        rows.sort()
+        return rows
@@ -0,0 +1,232 @@
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+from weakref import WeakKeyDictionary, ref
+import math
+import re
+import threading
+
+from src.data.chunk_store import ChunkStore
+from src.writer.simple_stemmer import SimpleStemmer
+
+
+class KeywordIndex:
+    """
+    Inverted index of stemmed terms -> postings (chunk, tf).
+    Built once per ChunkStore so keyword retrieval only touches the
+    chunks that actually contain a query term.
+
+    Besides the chunk content, the document title and section header of
+    every chunk are indexed as separate fields, together with per-field
+    lengths and IDF tables, so BM25/BM25F scoring needs no corpus scan at
+    query time.
+    """
+
+    FIELD_CONTENT = "content"
+    FIELD_HEADER = "header"
+    FIELD_TITLE = "title"
+    FIELDS = (FIELD_CONTENT, FIELD_HEADER, FIELD_TITLE)
+
+    __EMPTY_POSTINGS = (array("i"), array("i"))
+
+    # store -> {stemmer signature -> index}
+    __registry: "WeakKeyDictionary[ChunkStore, Dict[Tuple, KeywordIndex]]" = WeakKeyDictionary()
+    __registry_lock = threading.Lock()
+
+    def __init__(self, store: ChunkStore, stemmer: Optional[SimpleStemmer] = None):
+        self.__stemmer = stemmer
+        self.__store_version = store.get_version()
+        # Weak, since the registry holding this index is keyed by the store.
+        self.__store = ref(store)
+        self.__size = 0
+
+        # Chunks are addressed by their store ordinal; postings of every
+        # field are parallel ordinal/tf arrays sorted by ordinal, which keeps
+        # large corpora compact and lets top-k evaluation skip ahead. Chunk
+        # IDs are resolved through the store, never copied into the index.
+
+        self.__field_postings: Dict[str, Dict[str, Tuple[array, array]]] = {field: {} for field in self.FIELDS}
+        self.__field_lengths: Dict[str, array] = {field: array("i") for field in self.FIELDS}
+        self.__average_field_lengths: Dict[str, float] = {}
+        self.__postings = self.__field_postings[self.FIELD_CONTENT]
+
+        # Per content term: (max tf, min chunk length) over its postings, the
+        # inputs of the per-term score upper bounds used for pruning.
+        self.__term_bounds: Dict[str, Tuple[int, int]] = {}
+
+        self.__idf: Dict[str, float] = {}  # content-only document frequency
+        self.__any_field_idf: Dict[str, float] = {}  # term in any field of the chunk
+
+        self.__build_index(store)
+
+    @classmethod
+    def for_store(cls, store: ChunkStore, stemmer: Optional[SimpleStemmer] = None) -> "KeywordIndex":
+        """
+        Returns the shared index for this store and stemmer configuration,
+        building it on first use or when the store has changed since.
+        """
+        signature = cls.__stemmer_signature(stemmer)
+
+        with cls.__registry_lock:
+            indexes = cls.__registry.setdefault(store, {})
+
+            index = indexes.get(signature)
+            if index is None or index.get_store_version() != store.get_version():
+                index = cls(store, stemmer)
+                indexes[signature] = index
+            return index
+
+    @staticmethod
+    def __stemmer_signature(stemmer: Optional[SimpleStemmer]) -> Tuple:
+        if stemmer is None:
+            return ()
+        return (tuple(stemmer.suffixes_sorted), stemmer.min_word_length)
+
+    def __build_index(self, store: ChunkStore) -> None:
+        any_field_df: Dict[str, int] = {}
+        # Titles and headers are shared by many chunks; tokenize each once.
+        field_terms_cache: Dict[Tuple[str, object], Dict[str, int]] = {}
+        term_bounds = self.__term_bounds
+
+        for ordinal, chunk in enumerate(store.iter_chunks()):
+            title = store.get_document_title(chunk.get_doc_id())
+            header = store.get_section_header(chunk.get_doc_id(), chunk.get_section_id())
+            field_texts = (
+                (self.FIELD_CONTENT, None, None),
+                (self.FIELD_HEADER, (chunk.get_doc_id(), chunk.get_section_id()), header),
+                # Titles are file-name like ("erasmus_yonergesi"), so "_" separates words.
+                (self.FIELD_TITLE, chunk.get_doc_id(), title.replace("_", " ") if title else None),
+            )
+
+            chunk_terms = set()
+            for field, cache_key, text in field_texts:
+                if field == self.FIELD_CONTENT:
+                    # Chunk content comes pre-tokenized and stemmed.
+                    term_counts = self.__count_stems(chunk.get_analysis().get_stems(self.__stemmer))
+                else:
+                    term_counts = field_terms_cache.get((field, cache_key))
+                    if term_counts is None:
+                        term_counts = self.__count_terms(text)
+                        field_terms_cache[(field, cache_key)] = term_counts
+
+                length = sum(term_counts.values())
+                postings = self.__field_postings[field]
+                for term, tf in term_counts.items():
+                    entry = postings.get(term)
+                    if entry is None:
+                        entry = postings[term] = (array("i"), array("i"))
+                    entry[0].append(ordinal)
+                    entry[1].append(tf)
+
+                    if field == self.FIELD_CONTENT:
+                        bounds = term_bounds.get(term)
+                        if bounds is None:
+                            term_bounds[term] = (tf, length)
+                        elif tf > bounds[0] or length < bounds[1]:
+                            term_bounds[term] = (max(tf, bounds[0]), min(length, bounds[1]))
+                self.__field_lengths[field].append(length)
+                chunk_terms.update(term_counts)
+
+            for term in chunk_terms:
+                any_field_df[term] = any_field_df.get(term, 0) + 1
+
+        n = self.__size = store.size()
+        for field in self.FIELDS:
+            lengths = self.__field_lengths[field]
+            self.__average_field_lengths[field] = sum(lengths) / n if n else 0.0
+
+        self.__idf = {term: self.__bm25_idf(n, len(postings[0])) for term, postings in self.__postings.items()}
+        self.__any_field_idf = {term: self.__bm25_idf(n, df) for term, df in any_field_df.items()}
+
+    @staticmethod
+    def __bm25_idf(n: int, df: int) -> float:
+        # Okapi IDF shifted by one so very common terms score >= 0 instead of negative.
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def __count_terms(self, text: Optional[str]) -> Dict[str, int]:
+        return self.__count_stems(self.__extract_words(text))
+
+    @staticmethod
+    def __count_stems(words: Iterable[str]) -> Dict[str, int]:
+        term_counts: Dict[str, int] = {}
+        for word in words:
+            term_counts[word] = term_counts.get(word, 0) + 1
+        return term_counts
+
+    def __extract_words(self, text: Optional[str]) -> List[str]:
+        if not text:
+            return []
+        words = re.findall(r'\b\w+\b', text.lower())
+        if self.__stemmer:
+            return [self.__stemmer.stem(word) for word in words]
+        return words
+
+    def normalize_term(self, term: str) -> str:
+        """Applies the same lowercasing/stemming used when indexing chunk text."""
+        term_lower = term.lower()
+        return self.__stemmer.stem(term_lower) if self.__stemmer else term_lower
+
+    def get_postings(self, term: str) -> List[Tuple[str, int]]:
+        """Returns (chunk key, tf) postings for an already normalized term."""
+        return self.get_field_postings(self.FIELD_CONTENT, term)
+
+    def get_field_postings(self, field: str, term: str) -> List[Tuple[str, int]]:
+        """Returns (chunk key, tf) postings of a normalized term in one field."""
+        ordinals, tfs = self.get_posting_arrays(term, field)
+        return [("||".join(self.get_chunk_ref_at(ordinal)), tf) for ordinal, tf in zip(ordinals, tfs)]
+
+    def get_posting_arrays(self, term: str, field: str = FIELD_CONTENT) -> Tuple[array, array]:
+        """Returns the (ordinals, tfs) arrays of a normalized term, sorted by ordinal."""
+        return self.__field_postings[field].get(term, self.__EMPTY_POSTINGS)
+
+    def get_field_length(self, field: str, key: str) -> int:
+        """Number of indexed terms of the chunk in the given field."""
+        ordinal = self.__ordinal_of(key)
+        return self.__field_lengths[field][ordinal] if ordinal is not None else 0
+
+    def get_field_lengths(self, field: str) -> array:
+        """Field lengths of all chunks, indexed by ordinal."""
+        return self.__field_lengths[field]
+
+    def get_average_field_length(self, field: str) -> float:
+        return self.__average_field_lengths[field]
+
+    def get_term_bounds(self, term: str) -> Tuple[int, int]:
+        """(max tf, min content length) over the content postings of a term."""
+        return self.__term_bounds.get(term, (0, 0))
+
+    def get_idf(self, term: str) -> float:
+        """BM25 IDF of a normalized term over chunk content; 0.0 if unseen."""
+        return self.__idf.get(term, 0.0)
+
+    def get_any_field_idf(self, term: str) -> float:
+        """BM25F IDF: a chunk counts if the term is in any of its fields."""
+        return self.__any_field_idf.get(term, 0.0)
+
+    def get_chunk_ref(self, key: str) -> Tuple[str, str]:
+        ordinal = self.__ordinal_of(key)
+        if ordinal is None:
+            raise KeyError(key)
+        return self.get_chunk_ref_at(ordinal)
+
+    def get_chunk_ref_at(self, ordinal: int) -> Tuple[str, str]:
+        return self.__get_store().get_chunk_ref_at(ordinal)
+
+    def __ordinal_of(self, key: str) -> Optional[int]:
+        doc_id, _, chunk_id = key.partition("||")
+        ordinal = self.__get_store().get_ordinal(doc_id, chunk_id)
+        return ordinal if ordinal is not None and ordinal < self.__size else None
+
+    def __get_store(self) -> ChunkStore:
+        store = self.__store()
+        if store is None:
+            raise RuntimeError("The chunk store of this keyword index no longer exists")
+        return store
+
+    def size(self) -> int:
+        return self.__size
+
+    def get_store_version(self) -> int:
+        return self.__store_version
+
+    def vocabulary_size(self) -> int:
+        return len(self.__postings)
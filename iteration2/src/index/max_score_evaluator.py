@@ -0,0 +1,123 @@
+from bisect import bisect_left
+from heapq import nlargest
+from typing import Callable, Dict, List, Tuple
+
+# (ordinals sorted ascending, tfs, score(ordinal, tf) -> float, upper bound of score)
+TermPostings = Tuple[object, object, Callable[[int, int], float], float]
+
+
+class MaxScoreEvaluator:
+    """
+    Term-at-a-time top-k evaluation with MaxScore pruning.
+
+    Terms are visited from the largest score upper bound to the smallest
+    and their postings are accumulated with the same plain loop as
+    exhaustive scoring. Once the k-th best partial score (the threshold)
+    exceeds the summed bounds of the terms not yet visited, no unseen chunk
+    can reach the top-k: the remaining, usually long, postings of the weak
+    terms are then only probed for the accumulated chunks, and chunks that
+    can no longer reach the threshold are dropped after every term.
+
+    The result matches exhaustive evaluation exactly: the chunks left at
+    the end are re-scored with their contributions summed in query term
+    order (as the exhaustive loop does), and chunks that tie the threshold
+    are kept so the caller's tie-break still applies.
+    """
+
+    # Bounds are compared with a little slack so float rounding in the bound
+    # sums can never prune a chunk that exhaustive scoring would keep.
+    __SLACK = 1e-9
+
+    # Probing postings by binary search beats scanning them while there are
+    # this many times more postings than accumulated chunks.
+    __PROBE_RATIO = 4
+
+    def __init__(self, top_k: int):
+        self.__top_k = top_k
+
+    def evaluate(self, query_terms: List[str], term_postings: Dict[str, TermPostings]) -> List[Tuple[int, float]]:
+        """
+        Returns (ordinal, score) for every chunk that can be in the top-k,
+        i.e. whose score is at least the final k-th best score. The caller
+        sorts and truncates, exactly as for exhaustive scores.
+        """
+        k = self.__top_k
+        if k <= 0:
+            return []
+
+        multiplicity: Dict[str, int] = {}
+        for term in query_terms:
+            if term in term_postings and len(term_postings[term][0]) > 0:
+                multiplicity[term] = multiplicity.get(term, 0) + 1
+        if not multiplicity:
+            return []
+
+        # Strongest terms first; remaining[i] bounds what terms i.. can add.
+        terms = sorted(multiplicity, key=lambda t: term_postings[t][3] * multiplicity[t], reverse=True)
+        n = len(terms)
+        remaining = [0.0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            remaining[i] = remaining[i + 1] + term_postings[terms[i]][3] * multiplicity[terms[i]]
+
+        slack = self.__SLACK
+        scores: Dict[int, float] = {}
+        threshold = float("-inf")
+        i = 0
+
+        # Every posting of a term counts while unseen chunks can still make it.
+        while i < n:
+            if len(scores) >= k:
+                threshold = nlargest(k, scores.values())[-1]
+                if remaining[i] * (1.0 + slack) + slack < threshold:
+                    break
+            ordinals, tfs, score, _ = term_postings[terms[i]]
+            count = multiplicity[terms[i]]
+            get = scores.get
+            for ordinal, tf in zip(ordinals, tfs):
+                scores[ordinal] = get(ordinal, 0) + score(ordinal, tf) * count
+            i += 1
+
+        # Afterwards only the accumulated chunks that can still reach the
+        # threshold are looked up in the remaining postings.
+        while i < n:
+            bound = remaining[i] * (1.0 + slack) + slack
+            scores = {ordinal: s for ordinal, s in scores.items() if s + bound >= threshold}
+            ordinals, tfs, score, _ = term_postings[terms[i]]
+            count = multiplicity[terms[i]]
+            if len(ordinals) > self.__PROBE_RATIO * len(scores):
+                length = len(ordinals)
+                for ordinal in scores:
+                    p = bisect_left(ordinals, ordinal)
+                    if p < length and ordinals[p] == ordinal:
+                        scores[ordinal] += score(ordinal, tfs[p]) * count
+            else:
+                for ordinal, tf in zip(ordinals, tfs):
+                    if ordinal in scores:
+                        scores[ordinal] += score(ordinal, tf) * count
+            i += 1
+            if len(scores) >= k:
+                threshold = nlargest(k, scores.values())[-1]
+
+        if len(scores) > k:
+            kth = nlargest(k, scores.values())[-1]
+            cutoff = kth - abs(kth) * slack - slack
+            scores = {ordinal: s for ordinal, s in scores.items() if s >= cutoff}
+
+        candidates = [(ordinal, self.__exact_score(ordinal, query_terms, term_postings)) for ordinal in scores]
+        if len(candidates) > k:
+            kth = nlargest(k, (s for _, s in candidates))[-1]
+            candidates = [(ordinal, s) for ordinal, s in candidates if s >= kth]
+        return candidates
+
+    @staticmethod
+    def __exact_score(ordinal: int, query_terms: List[str], term_postings: Dict[str, TermPostings]) -> float:
+        score = 0
+        for term in query_terms:
+            postings = term_postings.get(term)
+            if postings is None:
+                continue
+            ordinals, tfs, scorer, _ = postings
+            p = bisect_left(ordinals, ordinal)
+            if p < len(ordinals) and ordinals[p] == ordinal:
+                score = score + scorer(ordinal, tfs[p])
+        return score
@@ -0,0 +1,130 @@
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+import queue
+import threading
+import time
+
+from src.index.vector_index import VectorIndex
+
+
+class _PendingSearch:
+    __slots__ = ("query_text", "top_k", "future")
+
+    def __init__(self, query_text: str, top_k: int):
+        self.query_text = query_text
+        self.top_k = top_k
+        self.future: Future = Future()
+
+
+class MicroBatchScheduler:
+    """
+    Groups concurrent VectorIndex searches into micro-batches.
+
+    search_rows() has the signature of VectorIndex.search_rows(), so a
+    VectorRetriever can search through the scheduler unchanged. Each call
+    is queued and blocks its thread; a dispatcher thread collects queries
+    until window_ms has passed since the first one or max_queries are
+    waiting, runs them as one VectorIndex.search_rows_batch() (one embed
+    batch and one matrix-matrix product) and hands every caller its own
+    result. Results equal those of VectorIndex.search_rows().
+
+    Batching only pays off when several threads query at once (server
+    workers, threaded batch workers, async pipeline stages); a lone caller
+    waits up to window_ms for company that never comes.
+    """
+
+    def __init__(self, vector_index: VectorIndex, window_ms: float = 2.0, max_queries: int = 16):
+        self.__vector_index = vector_index
+        self.__window = max(0.0, window_ms) / 1000.0
+        self.__max_queries = max(1, max_queries)
+        self.__queue: "queue.Queue[Optional[_PendingSearch]]" = queue.Queue()
+        self.__lock = threading.Lock()
+        self.__thread: Optional[threading.Thread] = None
+        self.__closed = False
+        self.__batch_count = 0
+        self.__query_count = 0
+
+    def get_vector_index(self) -> VectorIndex:
+        return self.__vector_index
+
+    def get_window_ms(self) -> float:
+        return self.__window * 1000.0
+
+    def get_max_queries(self) -> int:
+        return self.__max_queries
+
+    def get_batch_count(self) -> int:
+        return self.__batch_count
+
+    def get_query_count(self) -> int:
+        return self.__query_count
+
+    def size(self) -> int:
+        return self.__vector_index.size()
+
+    def search_rows(self, query_text: str, top_k: int) -> List[Tuple[int, float]]:
+        return self.submit(query_text, top_k).result()
+
+    def submit(self, query_text: str, top_k: int) -> Future:
+        """Queues one search; the future resolves to its (row, score) pairs."""
+        pending = _PendingSearch(query_text, top_k)
+        with self.__lock:
+            if self.__closed:
+                raise RuntimeError("MicroBatchScheduler is closed")
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, name="vector-batch", daemon=True)
+                self.__thread.start()
+            self.__queue.put(pending)
+        return pending.future
+
+    def close(self) -> None:
+        """Answers the queued searches, then stops the dispatcher thread."""
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            thread = self.__thread
+            self.__queue.put(None)
+        if thread is not None:
+            thread.join()
+
+    def __run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self.__queue.get()
+            if first is None:
+                return
+
+            batch = [first]
+            deadline = time.monotonic() + self.__window
+            while len(batch) < self.__max_queries:
+                try:
+                    # Queries that are already waiting join without delay.
+                    pending = self.__queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stopping = True
+                    break
+                batch.append(pending)
+
+            self.__dispatch(batch)
+
+    def __dispatch(self, batch: List[_PendingSearch]) -> None:
+        # One search_rows_batch() per distinct top_k, in arrival order.
+        groups: Dict[int, List[_PendingSearch]] = {}
+        for pending in batch:
+            groups.setdefault(pending.top_k, []).append(pending)
+
+        for top_k, group in groups.items():
+            try:
+                results = self.__vector_index.search_rows_batch([p.query_text for p in group], top_k)
+            except Exception as ex:
+                for pending in group:
+                    pending.future.set_exception(ex)
+                continue
+            for pending, result in zip(group, results):
+                pending.future.set_result(result)
+
+        self.__batch_count += 1
+        self.__query_count += len(batch)
@@ -0,0 +1,61 @@
+import numpy as np
+
+
+class ScalarQuantizer:
+    """
+    Per-dimension 8-bit scalar quantization of an embedding matrix.
+
+    Every dimension is mapped linearly from its [min, max] range onto
+    0..255, so a vector takes one byte per dimension instead of four.
+    Scores are asymmetric: the query stays in float32 and is folded into
+    the dequantization, i.e. q . (min + scale * code) is computed as
+    q . min + (q * scale) . code without decoding the matrix.
+    """
+
+    LEVELS = 255
+    ENCODE_BATCH_ROWS = 65536
+    # Codes are widened to float32 a few hundred rows at a time so the
+    # widened block stays in cache for the matrix-vector product.
+    SCORE_BATCH_ROWS = 512
+
+    def __init__(self, matrix: "np.ndarray"):
+        dim = matrix.shape[1] if matrix.ndim == 2 else 0
+        n = matrix.shape[0] if matrix.ndim == 2 else 0
+
+        if n:
+            self.__minimum = matrix.min(axis=0).astype(np.float32)
+            spread = matrix.max(axis=0).astype(np.float32) - self.__minimum
+        else:
+            self.__minimum = np.zeros(dim, dtype=np.float32)
+            spread = np.zeros(dim, dtype=np.float32)
+        # Constant dimensions keep a scale of 0 and always decode to min.
+        self.__scale = np.where(spread > 0, spread / self.LEVELS, 0).astype(np.float32)
+
+        self.__codes = np.empty((n, dim), dtype=np.uint8)
+        inverse = np.where(self.__scale > 0, 1.0 / np.where(self.__scale > 0, self.__scale, 1), 0).astype(np.float32)
+        for start in range(0, n, self.ENCODE_BATCH_ROWS):
+            block = (np.asarray(matrix[start:start + self.ENCODE_BATCH_ROWS], dtype=np.float32) - self.__minimum) * inverse
+            self.__codes[start:start + block.shape[0]] = np.clip(np.rint(block), 0, self.LEVELS)
+
+    def get_codes(self) -> "np.ndarray":
+        return self.__codes
+
+    def nbytes(self) -> int:
+        """Bytes held for codes plus the per-dimension min/scale tables."""
+        return self.__codes.nbytes + self.__minimum.nbytes + self.__scale.nbytes
+
+    def scores(self, query: "np.ndarray", rows: "np.ndarray" = None) -> "np.ndarray":
+        """Approximate dot products of the query with all (or the given) rows."""
+        codes = self.__codes if rows is None else self.__codes[rows]
+        offset = np.float32(query @ self.__minimum)
+        weights = (query * self.__scale).astype(np.float32)
+
+        result = np.empty(codes.shape[0], dtype=np.float32)
+        buffer = np.empty((min(self.SCORE_BATCH_ROWS, codes.shape[0]), codes.shape[1]), dtype=np.float32)
+        for start in range(0, codes.shape[0], self.SCORE_BATCH_ROWS):
+            block = codes[start:start + self.SCORE_BATCH_ROWS]
+            widened = buffer[:block.shape[0]]
+            np.copyto(widened, block)
+            np.dot(widened, weights, out=result[start:start + block.shape[0]])
+        result += offset
+        return result
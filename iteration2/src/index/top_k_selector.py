@@ -0,0 +1,77 @@
+from heapq import nsmallest
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # index selection falls back to a heap without numpy
+    np = None
+
+from src.model.hit import Hit
+
+
+class TopKSelector:
+    """
+    Top-k selection shared by the retrievers, the vector index and the
+    rerankers, so every stage orders candidates the same way.
+
+    - select_hits(): Hit objects by (score desc, docId, chunkId), through a
+      bounded heap (heapq.nsmallest) instead of a full sort when k is
+      smaller than the candidate list.
+    - select_indices(): positions of the k best entries of a score array.
+      With numpy, argpartition finds the k-th score and only the entries
+      tied with or above it are sorted; without numpy a heap is used.
+      Ties go to the smaller tie_key, by default the smaller position.
+
+    Both return exactly the first k entries of the corresponding full sort.
+    """
+
+    @staticmethod
+    def hit_sort_key(hit: Hit) -> Tuple:
+        return -hit.get_score(), hit.get_doc_id(), hit.get_chunk_id()
+
+    @classmethod
+    def select_hits(cls, hits: Iterable[Hit], k: Optional[int] = None) -> List[Hit]:
+        """The k best hits in order; all of them, sorted, when k is None."""
+        if k is None:
+            return sorted(hits, key=cls.hit_sort_key)
+        if k <= 0:
+            return []
+
+        hits = list(hits)
+        if k >= len(hits):
+            return sorted(hits, key=cls.hit_sort_key)
+        return nsmallest(k, hits, key=cls.hit_sort_key)
+
+    @staticmethod
+    def select_indices(
+        scores: Sequence[float],
+        k: int,
+        tie_key: Optional[Callable[[int], object]] = None
+    ) -> List[int]:
+        """Positions of the k highest scores, best first."""
+        n = len(scores)
+        k = min(k, n)
+        if k <= 0:
+            return []
+
+        if np is None:
+            if tie_key is None:
+                return nsmallest(k, range(n), key=lambda i: (-scores[i], i))
+            return nsmallest(k, range(n), key=lambda i: (-scores[i], tie_key(i)))
+
+        values = np.asarray(scores)
+        if k < n:
+            # Keep every candidate tied with the k-th score so the result
+            # matches a full sort.
+            kth_score = values[np.argpartition(-values, k - 1)[k - 1]]
+            candidates = np.flatnonzero(values >= kth_score)
+        else:
+            candidates = np.arange(n)
+
+        if tie_key is None:
+            return candidates[np.lexsort((candidates, -values[candidates]))][:k].tolist()
+
+        positions = candidates.tolist()
+        candidate_scores = values[candidates].tolist()
+        order = sorted(range(len(positions)), key=lambda j: (-candidate_scores[j], tie_key(positions[j])))
+        return [positions[j] for j in order[:k]]
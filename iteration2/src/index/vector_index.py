@@ -1,38 +1,268 @@
-from typing import Dict, List
+from itertools import islice
+from pathlib import Path
+from typing import List, Optional, Tuple
+import hashlib
+import json
 import math
+import os
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python backend stays usable without numpy
+    np = None
 
 from src.data.chunk_store import ChunkStore
-from src.model.chunk import Chunk
 from src.embedding.embedding_provider import EmbeddingProvider
+from src.index.top_k_selector import TopKSelector
 
 
 class VectorIndex:
     """
     Stores embeddings for all chunks and provides cosine similarity search.
+
+    Two backends are available:
+    - "numpy": all embeddings live in one pre-normalized float32 matrix;
+      search is a single matrix-vector product followed by argpartition
+      top-k selection.
+    - "python": the original list of vectors scanned with pure-Python cosine.
+    Both order results by score desc and break ties by chunk store order.
+    Row i of the index is chunk ordinal i of the store, so search_rows()
+    results resolve through the store without any key strings.
+
+    When chunk_path is given, the numpy backend is persisted next to the chunk
+    file (a raw float32 vector file plus a JSON key manifest) and memory-mapped
+    back on later runs, as long as the chunk file content and the embedding
+    provider signature are unchanged.
+
+    index_type "ivf" (numpy backend only) adds an approximate search: rows
+    are partitioned into nlist k-means cells and a query is scored exactly
+    against the rows of its nprobe nearest cells only. "flat" is the exact
+    scan.
+
+    storage "int8" (numpy backend only) keeps the searched vectors as 8-bit
+    scalar-quantized codes (a quarter of the float32 size) and scores the
+    float32 query against them directly. With rescore > 0, that many best
+    approximate candidates are re-scored exactly against the float32
+    vectors, read from the memory-mapped vector file when the index is
+    persisted and re-embedded otherwise, so returned scores stay exact
+    cosines. The float32 matrix is not kept in memory.
+
+    storage "bucket_major" (numpy backend only) keeps the float32 matrix
+    transposed: one contiguous row per embedding dimension holding the
+    weight of every chunk in it. It is as large as the row-major matrix
+    (zero weights included), but a query only reads the rows of the
+    dimensions where it is non-zero, which for short hashed-word queries is
+    a small share of the matrix; scores equal the dense scan up to float32
+    rounding.
     """
 
+    BACKEND_NUMPY = "numpy"
+    BACKEND_PYTHON = "python"
+
+    TYPE_FLAT = "flat"
+    TYPE_IVF = "ivf"
+
+    STORAGE_FLOAT32 = "float32"
+    STORAGE_INT8 = "int8"
+    STORAGE_BUCKET_MAJOR = "bucket_major"
+
+    # Above the worst-case float32 rounding error of a 128-dimension dot
+    # product of unit vectors (128 * 2**-24); see __search_matrix.
+    ROUNDING_MARGIN = 1e-5
+
+    FORMAT_VERSION = 1
+    VECTORS_SUFFIX = ".vecindex.f32"
+    MANIFEST_SUFFIX = ".vecindex.json"
+
     def __init__(
         self,
         store: ChunkStore,
-        embedding_provider: EmbeddingProvider
+        embedding_provider: EmbeddingProvider,
+        backend: str = BACKEND_NUMPY,
+        chunk_path: Optional[Path] = None,
+        index_type: str = TYPE_FLAT,
+        nlist: int = 0,
+        nprobe: int = 32,
+        storage: str = STORAGE_FLOAT32,
+        rescore: int = 0,
+        batch_size: int = 256
     ):
+        if backend not in (self.BACKEND_NUMPY, self.BACKEND_PYTHON):
+            raise ValueError(f"Unknown vector index backend: {backend}")
+        if index_type not in (self.TYPE_FLAT, self.TYPE_IVF):
+            raise ValueError(f"Unknown vector index type: {index_type}")
+        if storage not in (self.STORAGE_FLOAT32, self.STORAGE_INT8, self.STORAGE_BUCKET_MAJOR):
+            raise ValueError(f"Unknown vector index storage: {storage}")
+        if backend == self.BACKEND_NUMPY and np is None:
+            backend = self.BACKEND_PYTHON
+
         self.__embedding_provider = embedding_provider
-        self.__vectors: Dict[str, List[float]] = {}
+        self.__backend = backend
+        self.__vectors: List[List[float]] = []  # python backend, by row
+        self.__size = 0
+        self.__matrix = None
+        self.__loaded_from_disk = False
+        self.__nprobe = max(1, nprobe)
+        self.__ivf = None
+        self.__quantizer = None
+        self.__buckets = None
+        self.__rescore = max(0, rescore)
+        self.__store = store
+        self.__batch_size = max(1, batch_size)
+
+        if chunk_path is not None and self.__backend == self.BACKEND_NUMPY:
+            self.__load_or_build(store, Path(chunk_path), storage == self.STORAGE_INT8)
+        else:
+            self.__build_index(store)
+
+        # The pure-Python backend has no matrix to partition and stays exact.
+        if index_type == self.TYPE_IVF and self.__backend == self.BACKEND_NUMPY:
+            from src.index.ivf_partition import IvfPartition
+            self.__ivf = IvfPartition(self.__matrix, nlist)
+
+        if storage == self.STORAGE_INT8 and self.__backend == self.BACKEND_NUMPY:
+            from src.index.scalar_quantizer import ScalarQuantizer
+            self.__quantizer = ScalarQuantizer(self.__matrix)
+            # Exact re-scoring reads rows from the vector file when there is
+            # one; an in-memory matrix is dropped and rows are re-embedded.
+            if not isinstance(self.__matrix, np.memmap):
+                self.__matrix = None
+        elif storage == self.STORAGE_BUCKET_MAJOR and self.__backend == self.BACKEND_NUMPY:
+            # The row-major matrix (and a memory-mapped file) is replaced by
+            # its bucket-major copy.
+            self.__buckets = np.ascontiguousarray(self.__matrix.T)
+            self.__matrix = None
+
+    def __load_or_build(self, store: ChunkStore, chunk_path: Path, remap: bool) -> None:
+        vectors_path = chunk_path.with_name(chunk_path.name + self.VECTORS_SUFFIX)
+        manifest_path = chunk_path.with_name(chunk_path.name + self.MANIFEST_SUFFIX)
+        fingerprint = self.__fingerprint(chunk_path)
+
+        if self.__try_load(vectors_path, manifest_path, fingerprint, store.size()):
+            self.__loaded_from_disk = True
+            return
 
         self.__build_index(store)
+        if self.__save(vectors_path, manifest_path, fingerprint) and remap:
+            # Quantized storage drops the in-memory matrix; map the file just
+            # written instead so re-scoring can read rows from it.
+            self.__try_load(vectors_path, manifest_path, fingerprint, store.size())
+
+    def __fingerprint(self, chunk_path: Path) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"v{self.FORMAT_VERSION}|{self.__embedding_provider.get_signature()}|".encode("utf-8"))
+        with open(chunk_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def __try_load(self, vectors_path: Path, manifest_path: Path, fingerprint: str, expected_count: int) -> bool:
+        if not vectors_path.exists() or not manifest_path.exists():
+            return False
+
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+
+            keys = manifest.get("keys", [])
+            dim = int(manifest.get("dim", 0))
+            if (
+                manifest.get("fingerprint") != fingerprint
+                or len(keys) != expected_count
+                or vectors_path.stat().st_size != len(keys) * dim * 4
+                or keys != self.__store_keys()
+            ):
+                return False
+
+            if keys:
+                matrix = np.memmap(vectors_path, dtype=np.float32, mode="r", shape=(len(keys), dim))
+            else:
+                matrix = np.zeros((0, 0), dtype=np.float32)
+        except (OSError, ValueError, json.JSONDecodeError):
+            return False
+
+        self.__size = len(keys)
+        self.__matrix = matrix
+        return True
+
+    def __save(self, vectors_path: Path, manifest_path: Path, fingerprint: str) -> bool:
+        """
+        Writes the vector file first and the manifest last, each through a temp
+        file and rename, so a half-written index is never picked up.
+        """
+        dim = self.__matrix.shape[1] if self.__matrix.ndim == 2 else 0
+        manifest = {
+            "fingerprint": fingerprint,
+            "dim": dim,
+            "keys": self.__store_keys()
+        }
+
+        try:
+            if manifest_path.exists():
+                manifest_path.unlink()
+
+            tmp_vectors = vectors_path.with_name(f"{vectors_path.name}.{os.getpid()}.tmp")
+            with open(tmp_vectors, "wb") as f:
+                f.write(self.__matrix.tobytes())
+            os.replace(tmp_vectors, vectors_path)
+
+            tmp_manifest = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+            with open(tmp_manifest, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False)
+            os.replace(tmp_manifest, manifest_path)
+        except OSError:
+            # Persistence is an optimization only; the in-memory index is complete.
+            return False
+        return True
 
     def __build_index(self, store: ChunkStore) -> None:
         """
         Pre-compute embeddings for all chunks in the store.
         """
-        for chunk in store.get_all_chunks():
-            key = self.__make_key(chunk)
-            self.__vectors[key] = self.__embedding_provider.embed(
+        if self.__backend == self.BACKEND_NUMPY:
+            self.__build_matrix(store)
+            return
+
+        for chunk in store.iter_chunks():
+            self.__vectors.append(self.__embedding_provider.embed(
                 chunk.get_text()
-            )
+            ))
+        self.__size = len(self.__vectors)
+
+    def __build_matrix(self, store: ChunkStore) -> None:
+        """
+        Embeds the chunks batch_size at a time straight into the matrix.
+        """
+        n = self.__size = store.size()
+        chunks = store.iter_chunks()
 
-    def __make_key(self, chunk: Chunk) -> str:
-        return f"{chunk.get_doc_id()}||{chunk.get_chunk_id()}"
+        matrix = np.zeros(0, dtype=np.float64)
+        for start in range(0, n, self.__batch_size):
+            batch = list(islice(chunks, self.__batch_size))
+            vectors = self.__embedding_provider.embed_chunks(batch)
+            if start == 0:
+                matrix = np.empty((n, vectors.shape[1]), dtype=np.float64)
+            matrix[start:start + len(batch)] = vectors
+
+        self.__matrix = self.__normalize_rows(matrix)
+
+    def __normalize_rows(self, matrix: "np.ndarray") -> "np.ndarray":
+        if matrix.ndim != 2:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        # Normalize in float64 before narrowing so that proportional vectors
+        # (true cosine ties) collapse onto the same float32 row and keep
+        # their store-order tie-break.
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        # Zero vectors stay zero, which yields a cosine of 0.0 as before.
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return np.ascontiguousarray(matrix, dtype=np.float32)
+
+    def __make_key(self, row: int) -> str:
+        return "||".join(self.__store.get_chunk_ref_at(row))
+
+    def __store_keys(self) -> List[str]:
+        return [self.__make_key(row) for row in range(self.__store.size())]
 
     def __cosine_similarity(
         self,
@@ -48,21 +278,228 @@ class VectorIndex:
 
         return dot / (norm1 * norm2)
 
+    def get_backend(self) -> str:
+        return self.__backend
+
+    def get_index_type(self) -> str:
+        return self.TYPE_IVF if self.__ivf is not None else self.TYPE_FLAT
+
+    def get_storage(self) -> str:
+        if self.__quantizer is not None:
+            return self.STORAGE_INT8
+        if self.__buckets is not None:
+            return self.STORAGE_BUCKET_MAJOR
+        return self.STORAGE_FLOAT32
+
+    def set_rescore(self, rescore: int) -> None:
+        """Number of approximate candidates re-scored exactly; 0 disables it."""
+        self.__rescore = max(0, rescore)
+
+    def get_vector_bytes(self) -> int:
+        """
+        Bytes of vector data held in memory for search. A memory-mapped
+        float32 file only counts when it is the searched storage.
+        """
+        if self.__quantizer is not None:
+            return self.__quantizer.nbytes()
+        if self.__buckets is not None:
+            return int(self.__buckets.nbytes)
+        if self.__matrix is not None:
+            return int(self.__matrix.nbytes)
+        return sum(len(vector) * 8 for vector in self.__vectors)
+
+    def set_nprobe(self, nprobe: int) -> None:
+        """Number of IVF cells scanned per query; ignored by the flat index."""
+        self.__nprobe = max(1, nprobe)
+
+    def is_loaded_from_disk(self) -> bool:
+        return self.__loaded_from_disk
+
+    def size(self) -> int:
+        return self.__size
+
     def search(
         self,
         query_text: str,
         top_k: int
-    ) -> List[tuple[str, float]]:
+    ) -> List[Tuple[str, float]]:
         """
         Returns (chunk_key, cosine_score) pairs.
         """
+        return [(self.__make_key(row), score) for row, score in self.search_rows(query_text, top_k)]
+
+    def search_rows(
+        self,
+        query_text: str,
+        top_k: int
+    ) -> List[Tuple[int, float]]:
+        """
+        Returns (row, cosine_score) pairs; a row is the chunk's store ordinal.
+        """
         query_vec = self.__embedding_provider.embed(query_text)
 
-        scored = []
+        if self.__backend == self.BACKEND_NUMPY:
+            return self.__search_matrix(query_vec, top_k)
+        return self.__search_python(query_vec, top_k)
+
+    def search_rows_batch(
+        self,
+        query_texts: List[str],
+        top_k: int
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        search_rows() for several queries at once, in query order.
+
+        The queries are embedded with one embed_batch() call. A flat float32
+        or bucket-major numpy index then scores all of them with one matrix-matrix
+        product, reading the stored vectors once per batch instead of once
+        per query; IVF, int8 and the python backend search query by query.
+        Results equal those of search_rows().
+        """
+        if not query_texts:
+            return []
+        if (
+            self.__backend != self.BACKEND_NUMPY
+            or self.__ivf is not None
+            or self.__quantizer is not None
+        ):
+            return [self.search_rows(query_text, top_k) for query_text in query_texts]
+
+        n = self.__size
+        if min(top_k, n) <= 0:
+            return [[] for _ in query_texts]
+
+        queries = [
+            self.__normalize_query(vector)
+            for vector in self.__embedding_provider.embed_batch(query_texts)
+        ]
+        nonzero = [query for query in queries if query is not None]
+        scores = self.__score_batch(np.stack(nonzero)) if nonzero else None
+        rows = np.arange(n)
+
+        results = []
+        position = 0
+        for query in queries:
+            if query is None:
+                results.append([(i, 0.0) for i in range(min(top_k, n))])
+                continue
+            results.append(self.__rank_rows(query, rows, scores[position], top_k))
+            position += 1
+        return results
+
+    def __search_python(
+        self,
+        query_vec: List[float],
+        top_k: int
+    ) -> List[Tuple[int, float]]:
+        scores = [self.__cosine_similarity(query_vec, chunk_vec) for chunk_vec in self.__vectors]
+        return [(row, scores[row]) for row in TopKSelector.select_indices(scores, top_k)]
+
+    def __search_matrix(
+        self,
+        query_vec: List[float],
+        top_k: int
+    ) -> List[Tuple[int, float]]:
+        n = self.__size
+        if min(top_k, n) <= 0:
+            return []
+
+        query = self.__normalize_query(query_vec)
+        if query is None:
+            # Every cosine is 0.0, so the result is the first rows in store order.
+            return [(i, 0.0) for i in range(min(top_k, n))]
+
+        rows = self.__ivf.candidates(query, self.__nprobe) if self.__ivf is not None else None
+        scores = self.__score_rows(query, rows)
+        if rows is None:
+            rows = np.arange(n)
+        return self.__rank_rows(query, rows, scores, top_k)
+
+    def __normalize_query(self, query_vec) -> Optional["np.ndarray"]:
+        """The query as a float32 unit vector; None for a zero vector."""
+        query = np.asarray(query_vec, dtype=np.float64)
+        query_norm = float(np.linalg.norm(query))
+        if query_norm == 0:
+            return None
+        return (query / query_norm).astype(np.float32)
+
+    def __rank_rows(
+        self,
+        query: "np.ndarray",
+        rows: "np.ndarray",
+        scores: "np.ndarray",
+        top_k: int
+    ) -> List[Tuple[int, float]]:
+        """Top-k (row, score) pairs from the approximate scores of the given rows."""
+        if self.__quantizer is None:
+            # float32 sums round differently per layout and per candidate
+            # subset, so rows near the k-th score are re-scored in float64.
+            # Every layout then ranks (and scores) identically.
+            shortlist = self.__select_near_top_rows(rows, scores, top_k)
+        elif self.__rescore > 0:
+            # Shortlist by approximate score, then rank the shortlist exactly.
+            shortlist = self.__select_top_rows(rows, scores, max(top_k, self.__rescore))
+        else:
+            return self.__select_top_k(rows, scores, top_k)
+
+        exact = self.__exact_rows(shortlist).astype(np.float64) @ query.astype(np.float64)
+        return self.__select_top_k(shortlist, exact.astype(np.float32), top_k)
+
+    def __score_batch(self, queries: "np.ndarray") -> "np.ndarray":
+        """Scores of all rows for each query row, as a (queries, rows) matrix."""
+        if self.__buckets is not None:
+            # Only the dimensions used by at least one query are read.
+            dimensions = np.flatnonzero(np.any(queries != 0, axis=0))
+            return queries[:, dimensions] @ self.__buckets[dimensions]
+        return queries @ self.__matrix.T
+
+    def __score_rows(self, query: "np.ndarray", rows: Optional["np.ndarray"]) -> "np.ndarray":
+        """Scores of all rows (rows=None) or of the given rows, in that order."""
+        if self.__quantizer is not None:
+            return self.__quantizer.scores(query, rows)
+
+        if self.__buckets is not None:
+            dimensions = np.flatnonzero(query)
+            buckets = self.__buckets[dimensions]
+            if rows is not None:
+                buckets = buckets[:, rows]
+            return query[dimensions] @ buckets
+
+        if rows is None:
+            return self.__matrix @ query
+        return self.__matrix[rows] @ query
+
+    def __exact_rows(self, rows: "np.ndarray") -> "np.ndarray":
+        """Normalized float32 vectors of the given rows."""
+        if self.__matrix is not None:
+            return np.asarray(self.__matrix[rows])
+        if self.__buckets is not None:
+            return self.__buckets[:, rows].T
+
+        vectors = [self.__embedding_provider.embed(self.__store.get_text_at(int(row))) for row in rows]
+        return self.__normalize_rows(np.asarray(vectors, dtype=np.float64))
+
+    def __select_top_k(
+        self,
+        rows: "np.ndarray",
+        scores: "np.ndarray",
+        top_k: int
+    ) -> List[Tuple[int, float]]:
+        """Top-k of (row ids ascending, scores) by score desc, then row order."""
+        order = self.__top_k_order(scores, top_k)
+        return [(int(rows[i]), float(scores[i])) for i in order]
+
+    def __select_top_rows(self, rows: "np.ndarray", scores: "np.ndarray", top_k: int) -> "np.ndarray":
+        """Row ids of the top-k, ascending, as candidates for a second pass."""
+        return np.sort(rows[self.__top_k_order(scores, top_k)])
 
-        for key, chunk_vec in self.__vectors.items():
-            score = self.__cosine_similarity(query_vec, chunk_vec)
-            scored.append((key, score))
+    def __select_near_top_rows(self, rows: "np.ndarray", scores: "np.ndarray", top_k: int) -> "np.ndarray":
+        """Row ids (ascending) whose score is within the rounding margin of the k-th score."""
+        k = min(top_k, scores.shape[0])
+        if k <= 0:
+            return rows[:0]
+        kth_score = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        return rows[scores >= kth_score - self.ROUNDING_MARGIN]
 
-        scored.sort(key=lambda x: -x[1])
-        return scored[:top_k]
\ No newline at end of file
+    def __top_k_order(self, scores: "np.ndarray", top_k: int) -> "np.ndarray":
+        return np.asarray(TopKSelector.select_indices(scores, top_k), dtype=np.int64)
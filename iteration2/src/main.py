@@ -2,19 +2,34 @@ from __future__ import annotations
 
 import argparse
 import json
+import multiprocessing.util
+import signal
+import sys
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.config.config import Config
 from src.config.config_loader import ConfigLoader
 from src.context.context import Context
-from src.data.chunk_loader import ChunkLoader
+from src.data.chunk_loader import ChunkLoadProgress, ChunkLoader
 from src.data.chunk_store import ChunkStore
 from src.model.answer import Answer
+from src.model.intent import Intent
 from src.model.query import Query
+from src.orchestrator.pipeline_session import PipelineSession
 from src.orchestrator.rag_orchestrator import RagOrchestrator
 from src.eval.eval_harness import EvalHarness
 from src.cache.query_cache import QueryCache
+from src.server.rag_client import RagClient
+from src.server.rag_server import RagServer
+
+DEFAULT_SERVER_ADDRESS = "127.0.0.1:8765"
+DEFAULT_SERVER_WORKERS = 4
+
+# (intent, written query terms) of a question, as PipelineSession.normalize_query returns them.
+NormalizedQuery = Tuple[Intent, List[str]]
 
 
 def resolve_config_path(config_argument: str) -> Optional[Path]:
@@ -49,6 +64,24 @@ def resolve_config_path(config_argument: str) -> Optional[Path]:
     return None
 
 
+def _report_load_progress(progress: ChunkLoadProgress) -> None:
+    # On stderr, and for small corpora only the skipped records, so stdout
+    # and ordinary runs stay unchanged.
+    if not progress.is_done():
+        print(
+            f"Loading chunks: {progress.get_chunk_count()} chunks ({progress.get_fraction() * 100:.0f}% of the file)",
+            file=sys.stderr
+        )
+        return
+    if progress.get_skipped_count() > 0:
+        print(
+            f"Skipped {progress.get_skipped_count()} invalid records in {progress.get_path()}:",
+            file=sys.stderr
+        )
+        for error in progress.get_errors():
+            print(f"  {error}", file=sys.stderr)
+
+
 def _load_batch_queries(batch_path: Path) -> List[str]:
     if not batch_path.exists():
         raise FileNotFoundError(f"Batch file not found: {batch_path}")
@@ -76,48 +109,264 @@ def _load_batch_queries(batch_path: Path) -> List[str]:
     return [line for line in lines if line and not line.lstrip().startswith("#")]
 
 
-def _execute_pipeline(config: Config, question_text: str, chunk_store: ChunkStore) -> Optional[Answer]:
+def _execute_pipeline(
+    config: Config,
+    question_text: str,
+    session: PipelineSession,
+    normalized: Optional[NormalizedQuery] = None
+) -> Optional[Answer]:
     context = Context()
-    context.set_chunk_store(chunk_store)
+    context.set_chunk_store(session.get_chunk_store())
     context.set_question(Query(question_text))
+    if normalized is not None and session.is_normalization_exact(question_text):
+        # The cache key already detected the intent and wrote the query.
+        intent, terms = normalized
+        context.set_intent(intent)
+        context.set_terms(list(terms))
 
-    orchestrator = RagOrchestrator(context)
+    orchestrator = RagOrchestrator(context, session)
     orchestrator.run(config)
 
     return context.get_final_answer()
 
 
-def _process_single_query(config: Config, question_text: str, chunk_store: ChunkStore, query_cache: QueryCache) -> None:
+def _open_query_cache(config: Config, cache_file_path: Path) -> QueryCache:
+    return QueryCache(
+        cache_file_path,
+        max_size=100,
+        ttl_seconds=config.get_cache_ttl_seconds() or None,  # 0 disables expiry
+        flush_every=config.get_cache_flush_every(),
+        key_mode=config.get_cache_key_mode()
+    )
+
+
+def _normalize_query(question_text: str, session: PipelineSession, query_cache: QueryCache) -> Optional[NormalizedQuery]:
+    """Key of the normalized cache tier; None in text key mode."""
+    if not query_cache.is_normalized_mode():
+        return None
+    return session.normalize_query(question_text)
+
+
+def _lookup_cached_answer(
+    question_text: str,
+    session: PipelineSession,
+    query_cache: QueryCache,
+    normalized: Optional[NormalizedQuery] = None
+) -> Tuple[Optional[Answer], Optional[NormalizedQuery]]:
+    """
+    Exact-text tier first, then (in normalized key mode) the intent + terms
+    tier. Returns the answer and the normalized query if it was computed
+    (or passed in), for the pipeline and _store_answer to reuse.
+    """
     cached_answer = query_cache.get(question_text)
+    if cached_answer is None and query_cache.is_normalized_mode():
+        if normalized is None:
+            normalized = session.normalize_query(question_text)
+        cached_answer = query_cache.get_normalized(*normalized)
+        if cached_answer is not None:
+            query_cache.set(question_text, cached_answer)
+    return cached_answer, normalized
+
+
+def _is_cached(question_text: str, query_cache: QueryCache, normalized: Optional[NormalizedQuery]) -> bool:
+    if query_cache.contains(question_text):
+        return True
+    return normalized is not None and query_cache.contains_normalized(*normalized)
+
+
+def _store_answer(question_text: str, answer: Answer, query_cache: QueryCache, normalized: Optional[NormalizedQuery]) -> None:
+    query_cache.set(question_text, answer)
+    if normalized is not None:
+        query_cache.set_normalized(*normalized, answer)
+
+
+def _answer_query(config: Config, question_text: str, session: PipelineSession, query_cache: QueryCache) -> Tuple[Optional[Answer], bool]:
+    """Returns (answer, whether it came from the cache)."""
+    cached_answer, normalized = _lookup_cached_answer(question_text, session, query_cache)
     if cached_answer is not None:
-        print(f"Answer (Retrieved from Cache): {cached_answer.to_single_line()}")
-        return
+        return cached_answer, True
 
-    final_answer = _execute_pipeline(config, question_text, chunk_store)
+    final_answer = _execute_pipeline(config, question_text, session, normalized)
     if final_answer is not None:
-        query_cache.set(question_text, final_answer)
-        print(f"Answer: {final_answer.to_single_line()}")
-    else:
-        print("Answer: (no answer generated)")
+        _store_answer(question_text, final_answer, query_cache, normalized)
+    return final_answer, False
 
 
-def _process_batch_queries(config: Config, queries: List[str], batch_path: Path, chunk_store: ChunkStore, query_cache: QueryCache) -> None:
+def _format_answer_line(line: Optional[str], cached: bool) -> str:
+    if line is None:
+        return "Answer: (no answer generated)"
+    if cached:
+        return f"Answer (Retrieved from Cache): {line}"
+    return f"Answer: {line}"
+
+
+def _process_single_query(config: Config, question_text: str, session: PipelineSession, query_cache: QueryCache) -> None:
+    answer, cached = _answer_query(config, question_text, session, query_cache)
+    print(_format_answer_line(answer.to_single_line() if answer is not None else None, cached))
+
+
+def _process_batch_queries(
+    config: Config,
+    queries: List[str],
+    batch_path: Path,
+    session: PipelineSession,
+    query_cache: QueryCache,
+    workers: int = 1,
+    worker_mode: str = "process"
+) -> None:
     print(f"Running {len(queries)} queries in batch mode from: {batch_path}\n")
+    start_time = time.time()
 
-    for idx, q_text in enumerate(queries, start=1):
-        print(f"--- Query #{idx} ---")
-        print(f"Question: {q_text}")
+    executor = _create_batch_executor(config, session, workers, worker_mode)
+    # Answers are computed ahead of time by the pool but consumed strictly in
+    # input order, and only this thread touches the cache, so the printed
+    # output and cache contents are the same as in sequential mode.
+    pending: Dict[str, Future] = {}
+    # Each distinct question is normalized once for the cache key, the
+    # pipeline and the cache store.
+    normalized_queries: Dict[str, Optional[NormalizedQuery]] = {}
+
+    try:
+        if executor is not None:
+            for q_text in queries:
+                if q_text in pending or query_cache.contains(q_text):
+                    continue
+                if q_text not in normalized_queries:
+                    normalized_queries[q_text] = _normalize_query(q_text, session, query_cache)
+                normalized = normalized_queries[q_text]
+                if not _is_cached(q_text, query_cache, normalized):
+                    pending[q_text] = _submit_batch_query(executor, worker_mode, config, q_text, session, normalized)
+
+        for idx, q_text in enumerate(queries, start=1):
+            print(f"--- Query #{idx} ---")
+            print(f"Question: {q_text}")
+
+            cached_answer, normalized = _lookup_cached_answer(q_text, session, query_cache, normalized_queries.get(q_text))
+            normalized_queries[q_text] = normalized
+            if cached_answer is not None:
+                print(f"Answer (Retrieved from Cache): {cached_answer.to_single_line()}\n")
+                continue
+
+            if executor is None:
+                final_answer = _execute_pipeline(config, q_text, session, normalized)
+            else:
+                future = pending.pop(q_text, None)
+                if future is None:
+                    future = _submit_batch_query(executor, worker_mode, config, q_text, session, normalized)
+                final_answer = future.result()
 
-        cached_answer = query_cache.get(q_text)
-        if cached_answer is not None:
-            print(f"Answer (Retrieved from Cache): {cached_answer.to_single_line()}\n")
-        else:
-            final_answer = _execute_pipeline(config, q_text, chunk_store)
             if final_answer is not None:
-                query_cache.set(q_text, final_answer)
+                _store_answer(q_text, final_answer, query_cache, normalized)
                 print(f"Answer: {final_answer.to_single_line()}\n")
             else:
                 print("Answer: (no answer generated)\n")
+    finally:
+        if executor is not None:
+            # Queries not started yet (e.g. after Ctrl+C) are dropped, not run.
+            for future in pending.values():
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    elapsed = time.time() - start_time
+    throughput = len(queries) / elapsed if elapsed > 0 else float("inf")
+    # Reported on stderr so stdout stays identical across worker settings.
+    print(
+        f"Processed {len(queries)} queries in {elapsed:.2f} s "
+        f"({throughput:.2f} queries/sec, workers={workers}, mode={worker_mode if executor else 'sequential'})",
+        file=sys.stderr
+    )
+
+
+# Per-process state for --worker-mode process: one warm session per worker.
+_worker_session: Optional[PipelineSession] = None
+
+
+def _init_batch_worker(config: Config) -> None:
+    global _worker_session
+    chunk_store = ChunkLoader().load_chunks(config.get_chunk_path())
+    _worker_session = PipelineSession(config, chunk_store)
+    _worker_session.warm_up()
+    # Pool workers leave through os._exit, which skips atexit; finalizers
+    # registered here still run, so buffered trace events are not lost.
+    multiprocessing.util.Finalize(None, _worker_session.close, exitpriority=10)
+
+
+def _run_batch_worker_query(config: Config, question_text: str, normalized: Optional[NormalizedQuery]) -> Optional[Answer]:
+    return _execute_pipeline(config, question_text, _worker_session, normalized)
+
+
+def _create_batch_executor(config: Config, session: PipelineSession, workers: int, worker_mode: str) -> Optional[Executor]:
+    if workers <= 1:
+        return None
+
+    # Build (and persist) indexes once here so workers start from warm files
+    # instead of racing to build the same index.
+    session.warm_up()
+
+    if worker_mode == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker, initargs=(config,))
+
+
+def _submit_batch_query(
+    executor: Executor,
+    worker_mode: str,
+    config: Config,
+    question_text: str,
+    session: PipelineSession,
+    normalized: Optional[NormalizedQuery]
+) -> Future:
+    if worker_mode == "thread":
+        return executor.submit(_execute_pipeline, config, question_text, session, normalized)
+    return executor.submit(_run_batch_worker_query, config, question_text, normalized)
+
+
+def _serve(config: Config, address: str, workers: int, session: PipelineSession, query_cache: QueryCache) -> None:
+    # Build (and persist) every index before the first request arrives.
+    session.warm_up()
+    try:
+        server = RagServer(
+            lambda question_text: _answer_query(config, question_text, session, query_cache),
+            address,
+            workers=workers,
+            chunk_count=session.get_chunk_store().size()
+        )
+    except (OSError, ValueError) as ex:
+        print(f"Cannot serve on {address}: {ex}")
+        return
+    # SIGTERM stops the server like Ctrl+C, so the cache and traces are flushed.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"Serving on {server.get_address()} (workers={server.get_workers()}); Ctrl+C to stop", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+def _run_client(address: str, question_text: Optional[str], queries: List[str], batch_path: Optional[Path], workers: int) -> None:
+    client = RagClient(address)
+
+    if question_text is not None:
+        result = client.query(question_text)
+        print(_format_answer_line(result["line"], result["cached"]))
+        return
+
+    print(f"Running {len(queries)} queries in batch mode from: {batch_path}\n")
+    start_time = time.time()
+    # Requests go out concurrently; answers are printed in input order.
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [executor.submit(client.query, q_text) for q_text in queries]
+        for idx, (q_text, future) in enumerate(zip(queries, futures), start=1):
+            result = future.result()
+            print(f"--- Query #{idx} ---")
+            print(f"Question: {q_text}")
+            print(_format_answer_line(result["line"], result["cached"]) + "\n")
+
+    elapsed = time.time() - start_time
+    throughput = len(queries) / elapsed if elapsed > 0 else float("inf")
+    print(f"Processed {len(queries)} queries in {elapsed:.2f} s ({throughput:.2f} queries/sec, client)", file=sys.stderr)
 
 
 def main() -> None:
@@ -133,6 +382,34 @@ def main() -> None:
         "--batch",
         help="Path to batch file (.json list or .txt with one query per line)",
     )
+    mode_group.add_argument(
+        "--serve",
+        nargs="?",
+        const=DEFAULT_SERVER_ADDRESS,
+        metavar="ADDRESS",
+        help=f"Keep the pipeline loaded and answer JSON requests over HTTP at host:port or unix:/path (default: {DEFAULT_SERVER_ADDRESS})",
+    )
+    parser.add_argument(
+        "--client",
+        nargs="?",
+        const=DEFAULT_SERVER_ADDRESS,
+        metavar="ADDRESS",
+        help="Send --q / --batch to a running --serve instance instead of loading the pipeline",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Number of parallel workers for --batch (default: 1, sequential), "
+             f"server request threads for --serve (default: {DEFAULT_SERVER_WORKERS}) "
+             f"or concurrent requests for --client --batch (default: 1)",
+    )
+    parser.add_argument(
+        "--worker-mode",
+        choices=["process", "thread"],
+        default="process",
+        help="Worker pool type used when --workers > 1 (default: process)",
+    )
     args = parser.parse_args()
 
     config_file_path: Optional[Path] = resolve_config_path(args.config)
@@ -156,32 +433,62 @@ def main() -> None:
         eval_harness.run()
         return
 
-    if not args.q and not args.batch:
-        parser.error("Either --q, --batch, or --eval must be provided")
+    if not args.q and not args.batch and args.serve is None:
+        parser.error("Either --q, --batch, --serve or --eval must be provided")
+
+    if args.client is not None:
+        if args.serve is not None:
+            parser.error("--client cannot be combined with --serve")
+        queries: List[str] = []
+        batch_path: Optional[Path] = None
+        if args.batch:
+            batch_path = Path(args.batch).expanduser().resolve()
+            try:
+                queries = _load_batch_queries(batch_path)
+            except (FileNotFoundError, ValueError) as ex:
+                print(str(ex))
+                return
+            if not queries:
+                print("No runnable queries found in batch file.")
+                return
+        try:
+            _run_client(args.client, args.q, queries, batch_path, args.workers or 1)
+        except (OSError, RuntimeError) as ex:
+            print(f"Server request failed: {ex}")
+        return
 
-    chunk_loader: ChunkLoader = ChunkLoader()
+    chunk_loader: ChunkLoader = ChunkLoader(progress=_report_load_progress)
     chunk_store: ChunkStore = chunk_loader.load_chunks(config.get_chunk_path())
+    session: PipelineSession = PipelineSession(config, chunk_store)
 
     data_dir = config_file_path.parent
     cache_file_path = data_dir / "query_cache.json"
-    query_cache = QueryCache(cache_file_path, max_size=100)
-
-    if args.q is not None:
-        _process_single_query(config, args.q, chunk_store, query_cache)
-        return
+    query_cache = _open_query_cache(config, cache_file_path)
 
-    batch_path = Path(args.batch).expanduser().resolve()
     try:
-        queries = _load_batch_queries(batch_path)
-    except (FileNotFoundError, ValueError) as ex:
-        print(str(ex))
-        return
+        if args.serve is not None:
+            _serve(config, args.serve, args.workers or DEFAULT_SERVER_WORKERS, session, query_cache)
+            return
 
-    if not queries:
-        print("No runnable queries found in batch file.")
-        return
+        if args.q is not None:
+            _process_single_query(config, args.q, session, query_cache)
+            return
+
+        batch_path = Path(args.batch).expanduser().resolve()
+        try:
+            queries = _load_batch_queries(batch_path)
+        except (FileNotFoundError, ValueError) as ex:
+            print(str(ex))
+            return
+
+        if not queries:
+            print("No runnable queries found in batch file.")
+            return
 
-    _process_batch_queries(config, queries, batch_path, chunk_store, query_cache)
+        _process_batch_queries(config, queries, batch_path, session, query_cache, args.workers or 1, args.worker_mode)
+    finally:
+        query_cache.close()
+        session.close()
 
 
 if __name__ == "__main__":
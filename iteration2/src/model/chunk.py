@@ -1,10 +1,18 @@
-from typing import List
+from typing import List, Optional
 import re
 
+from src.model.chunk_analysis import ChunkAnalysis
+
 class Chunk:
-   
+
+    __slots__ = (
+        "__doc_id", "__chunk_id", "__text", "__section_id",
+        "__start_offset", "__end_offset", "__analysis",
+    )
+
     def __init__(self, doc_id: str = None, chunk_id: str = None, text: str = None, 
-                 section_id: str = None, start_offset: int = 0, end_offset: int = 0):
+                 section_id: str = None, start_offset: int = 0, end_offset: int = 0,
+                 analysis: Optional[ChunkAnalysis] = None):
        
         self.__doc_id = doc_id
         self.__chunk_id = chunk_id
@@ -12,6 +20,8 @@ class Chunk:
         self.__section_id = section_id
         self.__start_offset = start_offset if start_offset is not None else 0
         self.__end_offset = end_offset if end_offset is not None else 0
+        # ChunkStore hands every view of a chunk the same cached analysis.
+        self.__analysis = analysis
     
     def get_doc_id(self) -> str:
         """Get the document ID."""
@@ -37,6 +47,12 @@ class Chunk:
         """Get the end offset."""
         return self.__end_offset
     
+    def get_analysis(self) -> ChunkAnalysis:
+        """Get the cached text analysis, computed piece by piece on first use."""
+        if self.__analysis is None:
+            self.__analysis = ChunkAnalysis(self.__text)
+        return self.__analysis
+
     def get_sentences(self) -> List[str]:
         sentences = []
         if not self.__text:
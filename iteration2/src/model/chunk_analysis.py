@@ -0,0 +1,106 @@
+from typing import Callable, Optional, Tuple
+import re
+import sys
+
+
+class ChunkAnalysis:
+    """
+    Text analysis of one chunk, shared by every stage that reads chunk text.
+
+    Each product is computed on first use and kept for the life of the
+    chunk, so a chunk is lowercased, tokenized, stemmed and split into
+    sentences at most once per process:
+    - lower text: text.lower(), for substring matching (reranker, answers);
+    - tokens: the \\b\\w+\\b words of the lower text, as the keyword index and
+      the embedding provider read them, with their character offsets;
+    - stems: the tokens run through a stemmer (kept for the last stemmer);
+    - sentences: the text split at [.!?] runs, stripped, as the template
+      answer agent picks them;
+    - match text: the punctuation-free form the evaluation compares against.
+
+    Given a text_loader instead of a text, the raw text is not kept; it is
+    fetched again whenever a product still needs it (ChunkStore slices it
+    out of its text buffer).
+    """
+
+    TOKEN_REGEX = r'\b\w+\b'
+
+    # One instance per chunk, so no per-instance __dict__.
+    __slots__ = (
+        "__text", "__text_loader", "__lower_text", "__tokens", "__token_positions",
+        "__stems", "__sentences", "__lower_sentences", "__match_text",
+    )
+
+    def __init__(self, text: Optional[str] = None, text_loader: Optional[Callable[[], Optional[str]]] = None):
+        self.__text = text or ""
+        self.__text_loader = text_loader
+        self.__lower_text: Optional[str] = None
+        self.__tokens: Optional[Tuple[str, ...]] = None
+        self.__token_positions: Optional[Tuple[int, ...]] = None
+        # (stemmer, stems) of the last stemmer asked for.
+        self.__stems: Optional[tuple] = None
+        self.__sentences: Optional[Tuple[str, ...]] = None
+        self.__lower_sentences: Optional[Tuple[str, ...]] = None
+        self.__match_text: Optional[str] = None
+
+    def get_lower_text(self) -> str:
+        if self.__lower_text is None:
+            self.__lower_text = self.__get_text().lower()
+        return self.__lower_text
+
+    def get_tokens(self) -> Tuple[str, ...]:
+        if self.__tokens is None:
+            # Interned, so the many chunks sharing a word share one string.
+            self.__tokens = tuple(map(sys.intern, re.findall(self.TOKEN_REGEX, self.get_lower_text())))
+        return self.__tokens
+
+    def get_token_positions(self) -> Tuple[int, ...]:
+        """Start offset of each token in the lower text."""
+        if self.__token_positions is None:
+            self.__token_positions = tuple(m.start() for m in re.finditer(self.TOKEN_REGEX, self.get_lower_text()))
+        return self.__token_positions
+
+    def get_stems(self, stemmer) -> Tuple[str, ...]:
+        """Tokens stemmed with the given SimpleStemmer; the tokens when it is None."""
+        if stemmer is None:
+            return self.get_tokens()
+
+        cached = self.__stems
+        if cached is not None and cached[0] is stemmer:
+            return cached[1]
+
+        stems = tuple(map(stemmer.stem, self.get_tokens()))
+        self.__stems = (stemmer, stems)
+        return stems
+
+    def get_sentences(self) -> Tuple[str, ...]:
+        if self.__sentences is None:
+            self.__sentences = tuple(s.strip() for s in re.split(r"[.!?]+", self.__get_text()) if s.strip())
+        return self.__sentences
+
+    def get_lower_sentences(self) -> Tuple[str, ...]:
+        if self.__lower_sentences is None:
+            self.__lower_sentences = tuple(sentence.lower() for sentence in self.get_sentences())
+        return self.__lower_sentences
+
+    def get_match_text(self) -> str:
+        if self.__match_text is None:
+            self.__match_text = self.normalize_for_matching(self.__get_text())
+        return self.__match_text
+
+    def __get_text(self) -> str:
+        if self.__text_loader is not None:
+            return self.__text_loader() or ""
+        return self.__text
+
+    @staticmethod
+    def normalize_for_matching(text: str) -> str:
+        """Folds Turkish capitals, lowercases, and keeps only [a-z0-9@] words."""
+        if not text:
+            return ""
+        text = str(text)
+        text = text.replace("İ", "i").replace("I", "ı").replace("Ğ", "ğ").replace("Ü", "ü").replace("Ş", "ş").replace("Ö", "ö").replace("Ç", "ç")
+        text = text.lower()
+        text = re.sub(r'[^a-z0-9@\s]', ' ', text)
+        text = re.sub(r'\s+', ' ', text).strip()
+        return text
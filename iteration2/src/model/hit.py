@@ -1,8 +1,16 @@
+from typing import Optional
+
+
 class Hit:
-    def __init__(self, doc_id: str = None, chunk_id: str = None, score: int = 0):
+    # Created per candidate on every query; slots keep them small and fast.
+    __slots__ = ("__doc_id", "__chunk_id", "__score", "__ordinal")
+
+    def __init__(self, doc_id: str = None, chunk_id: str = None, score: int = 0, ordinal: Optional[int] = None):
         self.__doc_id = doc_id
         self.__chunk_id = chunk_id
         self.__score = score
+        # ChunkStore ordinal of the chunk, when the retriever knows it.
+        self.__ordinal = ordinal
 
     # Getters
     def get_doc_id(self) -> str:
@@ -14,6 +22,9 @@ class Hit:
     def get_score(self) -> int:
         return self.__score
 
+    def get_ordinal(self) -> Optional[int]:
+        return self.__ordinal
+
     # Setter
     def set_score(self, score: int) -> None:
         self.__score = score
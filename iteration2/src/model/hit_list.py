@@ -0,0 +1,91 @@
+from array import array
+from typing import Iterable, Iterator, List, Optional
+
+from src.index.top_k_selector import TopKSelector
+from src.model.hit import Hit
+
+
+class HitList:
+    """
+    Hits over one ChunkStore as two parallel arrays: chunk ordinal and score.
+
+    Retrievers that score thousands of chunks per query fill a HitList
+    instead of creating a Hit per candidate; top_k() selects on the score
+    array with TopKSelector and only the selected entries become Hit
+    objects. Ordering is score desc, then docId, then chunkId, like the
+    sorted hit lists elsewhere.
+
+    Indexing and iteration return Hit objects, so a HitList can stand in
+    for a List[Hit] where only the getter API is used.
+    """
+
+    __slots__ = ("__store", "__ordinals", "__scores")
+
+    def __init__(
+        self,
+        store,
+        ordinals: Iterable[int] = (),
+        scores: Iterable[float] = (),
+        integer_scores: bool = False
+    ):
+        # store only needs get_chunk_ref_at(ordinal), as ChunkStore provides.
+        self.__store = store
+        self.__ordinals = array("q", ordinals)
+        # Integer scores (e.g. raw term frequency) stay ints in the Hits.
+        self.__scores = array("q" if integer_scores else "d", scores)
+        if len(self.__ordinals) != len(self.__scores):
+            raise ValueError("HitList needs one score per ordinal")
+
+    def append(self, ordinal: int, score: float) -> None:
+        self.__ordinals.append(ordinal)
+        self.__scores.append(score)
+
+    def get_ordinals(self) -> array:
+        return self.__ordinals
+
+    def get_scores(self) -> array:
+        return self.__scores
+
+    def top_k(self, k: int) -> "HitList":
+        """The k best entries, sorted, as a new HitList."""
+        order = self.__top_k_order(k)
+        return HitList(
+            self.__store,
+            [self.__ordinals[i] for i in order],
+            [self.__scores[i] for i in order],
+            self.__scores.typecode == "q"
+        )
+
+    def sort(self) -> None:
+        """Sorts the entries in place."""
+        order = self.__top_k_order(len(self))
+        self.__ordinals = array("q", [self.__ordinals[i] for i in order])
+        self.__scores = array(self.__scores.typecode, [self.__scores[i] for i in order])
+
+    def __top_k_order(self, k: int) -> List[int]:
+        ordinals = self.__ordinals
+        chunk_ref_at = self.__store.get_chunk_ref_at
+        return TopKSelector.select_indices(self.__scores, k, tie_key=lambda i: chunk_ref_at(ordinals[i]))
+
+    def get_hit(self, index: int) -> Hit:
+        ordinal = self.__ordinals[index]
+        doc_id, chunk_id = self.__store.get_chunk_ref_at(ordinal)
+        return Hit(doc_id, chunk_id, self.__scores[index], ordinal)
+
+    def to_hits(self, limit: Optional[int] = None) -> List[Hit]:
+        count = len(self) if limit is None else min(limit, len(self))
+        return [self.get_hit(i) for i in range(count)]
+
+    def __len__(self) -> int:
+        return len(self.__ordinals)
+
+    def __getitem__(self, index: int) -> Hit:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("HitList index out of range")
+        return self.get_hit(index)
+
+    def __iter__(self) -> Iterator[Hit]:
+        for i in range(len(self)):
+            yield self.get_hit(i)
@@ -1,10 +1,14 @@
 # Orchestrator package
+from src.orchestrator.pipeline_session import PipelineSession
 from src.orchestrator.rag_pipeline import RagPipeline
 from src.orchestrator.sequential_rag_pipeline import SequentialRagPipeline
+from src.orchestrator.async_rag_pipeline import AsyncRagPipeline
 from src.orchestrator.rag_orchestrator import RagOrchestrator
 
 __all__ = [
+    'PipelineSession',
     'RagPipeline',
     'SequentialRagPipeline',
+    'AsyncRagPipeline',
     'RagOrchestrator'
 ]
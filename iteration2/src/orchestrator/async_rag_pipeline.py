@@ -0,0 +1,135 @@
+import asyncio
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from src.config.config import Config
+from src.context.context import Context
+from src.model.hit import Hit
+from src.orchestrator.pipeline_session import PipelineSession
+from src.orchestrator.rag_pipeline import RagPipeline
+from src.retrieval.hybrid_retriever import HybridRetriever
+from src.trace.trace_bus import TraceBus
+from src.trace.trace_level import TraceLevel
+
+
+class _DeferredTraceBus:
+    """
+    Hands publish_lazy calls to the session trace thread instead of
+    recording them inline. Events are built and recorded there in
+    publication order; drain() waits until all of them are.
+    """
+
+    def __init__(self, trace_bus: TraceBus, executor):
+        self.__trace_bus = trace_bus
+        self.__executor = executor
+        self.__pending: List[Future] = []
+
+    def publish_lazy(
+        self,
+        stage: str,
+        build: Callable[[TraceLevel], Tuple[str, str]],
+        timing_ms: float,
+        error: Optional[str] = None
+    ) -> None:
+        self.__pending.append(self.__executor.submit(self.__trace_bus.publish_lazy, stage, build, timing_ms, error))
+
+    async def drain(self) -> None:
+        pending, self.__pending = self.__pending, []
+        for future in pending:
+            await asyncio.wrap_future(future)
+
+
+class AsyncRagPipeline(RagPipeline):
+    """
+    Runs the pipeline stages as coroutines on the session executor.
+
+    Stages keep the order and semantics (context updates, retrieval cache,
+    TraceEvents) of SequentialRagPipeline; CPU-bound stage work runs on
+    the executor so the event loop stays free for other queries. For a
+    HybridRetriever the keyword and vector retrievers run concurrently and
+    their hits are merged with HybridRetriever.merge(). Trace events are
+    published from a separate thread, so no stage waits on a sink; they
+    are all recorded before execute_async() returns.
+    """
+
+    def __init__(self, config: Config, context: Context, trace_bus: TraceBus,
+                 session: Optional[PipelineSession] = None):
+        super().__init__(config, context, trace_bus, session)
+        self.__executor = self._session.get_executor()
+        self.__deferred_trace_bus = _DeferredTraceBus(trace_bus, self._session.get_trace_executor())
+        self._trace_bus = self.__deferred_trace_bus
+
+    def execute(self) -> None:
+        asyncio.run(self.execute_async())
+
+    async def execute_async(self) -> None:
+        try:
+            await self.detect_intent_async()
+            await self.write_query_async()
+            await self.retrieve_async()
+            await self.rerank_async()
+            await self.answer_async()
+        finally:
+            await self.__deferred_trace_bus.drain()
+
+    async def detect_intent_async(self) -> None:
+        await self.__run(self.detect_intent)
+
+    async def write_query_async(self) -> None:
+        await self.__run(self.write_query)
+
+    async def retrieve_async(self) -> None:
+        start_time = time.time()
+        terms = self._context.get_terms()
+        hits = None
+        retrieval_cache = None
+        cache_status = None
+        error = None
+
+        try:
+            await self.__run(self._prepare_retriever)
+
+            retrieval_cache = self._session.get_retrieval_cache()
+            if retrieval_cache is not None:
+                cache_key = self._session.get_retrieval_cache_key(terms)
+                hits = retrieval_cache.get(cache_key)
+                cache_status = "hit" if hits is not None else "miss"
+
+            if hits is None:
+                hits = await self.__retrieve_hits(terms)
+                if retrieval_cache is not None:
+                    retrieval_cache.put(cache_key, hits)
+
+            self._context.set_retrieved_hits(hits)
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            timing_ms = (time.time() - start_time) * 1000
+            self._trace_bus.publish_lazy(
+                "retrieve",
+                lambda level: self._build_retrieve_trace(level, terms, hits, retrieval_cache, cache_status),
+                timing_ms,
+                error
+            )
+
+    async def __retrieve_hits(self, terms: List[str]) -> List[Hit]:
+        store = self._context.get_chunk_store()
+        if not isinstance(self._retriever, HybridRetriever):
+            return await self.__run(self._retriever.retrieve, terms, store)
+
+        keyword_hits, vector_hits = await asyncio.gather(
+            self.__run(self._retriever.get_keyword_retriever().retrieve, terms, store),
+            self.__run(self._retriever.get_vector_retriever().retrieve, terms, store)
+        )
+        return self._retriever.merge(keyword_hits, vector_hits)
+
+    async def rerank_async(self) -> None:
+        await self.__run(self.rerank)
+
+    async def answer_async(self) -> None:
+        await self.__run(self.answer)
+
+    async def __run(self, function: Callable, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, function, *args)
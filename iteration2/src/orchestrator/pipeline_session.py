@@ -0,0 +1,513 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+import threading
+
+from src.cache.retrieval_cache import RetrievalCache
+from src.config.config import Config
+from src.data.chunk_store import ChunkStore
+from src.model.intent import Intent
+
+
+class IllegalArgumentError(Exception):
+    pass
+
+
+class PipelineSession:
+    """
+    Long-lived component registry for one Config and ChunkStore.
+
+    Every configured component (intent detector, query writer, retriever,
+    reranker, answer agent) and every resource file they need is resolved
+    once, on first use, and then shared by all queries that run through the
+    session - whether in batch, eval or server mode.
+    """
+
+    def __init__(self, config: Config, chunk_store: ChunkStore,
+                 retrieval_cache: Optional[RetrievalCache] = None):
+        self.__config = config
+        self.__chunk_store = chunk_store
+        self.__lock = threading.RLock()
+
+        # An explicitly passed cache may be shared with other sessions.
+        if retrieval_cache is None and config.get_retrieval_cache_size() > 0:
+            retrieval_cache = RetrievalCache(config.get_retrieval_cache_size())
+        self.__retrieval_cache = retrieval_cache
+
+        self.__intent_rules: Optional[Dict[Intent, List[str]]] = None
+        self.__stopwords: Optional[Set[str]] = None
+        self.__suffixes: Optional[List[str]] = None
+        self.__conjunctions: Optional[List[str]] = None
+        self.__stemmer = None
+        self.__embedding_provider = None
+
+        self.__intent_detector = None
+        self.__query_writer = None
+        self.__retriever = None
+        self.__reranker = None
+        self.__answer_agent = None
+        self.__vector_index = None
+        self.__vector_scheduler = None
+        self.__trace_sink = None
+        self.__executor = None
+        self.__trace_executor = None
+
+    def get_config(self) -> Config:
+        return self.__config
+
+    def get_chunk_store(self) -> ChunkStore:
+        return self.__chunk_store
+
+    def warm_up(self) -> None:
+        """
+        Builds every configured component up front (including the keyword and
+        vector indexes) so the first query does not pay for construction.
+        """
+        self.get_intent_detector()
+        self.get_query_writer()
+        self.get_retriever()
+        self.get_reranker()
+        self.get_answer_agent()
+
+        if self.__config.get_retriever_type() in ("KeywordRetriever", "HybridRetriever"):
+            from src.index.keyword_index import KeywordIndex
+            KeywordIndex.for_store(self.__chunk_store, self.get_stemmer())
+
+    def close(self) -> None:
+        """
+        Stops the vector micro-batch scheduler and the async pipeline
+        executors (after their pending work) and flushes and closes the
+        session trace sink, if they were created.
+        """
+        with self.__lock:
+            if self.__vector_scheduler is not None:
+                self.__vector_scheduler.close()
+                self.__vector_scheduler = None
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=True)
+                self.__executor = None
+            if self.__trace_executor is not None:
+                self.__trace_executor.shutdown(wait=True)
+                self.__trace_executor = None
+            if self.__trace_sink is not None:
+                self.__trace_sink.close()
+                self.__trace_sink = None
+
+    def normalize_query(self, question: str) -> Tuple[Intent, List[str]]:
+        """
+        Reduces a question to (intent, written query terms) for cache keys.
+        Turkish dotted/dotless I are folded first, so casing variants of the
+        same question produce the same terms.
+        """
+        folded = question.replace("İ", "i").replace("I", "ı").lower()
+        intent = self.get_intent_detector().detect(folded)
+        return intent, self.get_query_writer().write(folded, intent)
+
+    @staticmethod
+    def is_normalization_exact(question: str) -> bool:
+        """
+        True if normalize_query() yields the intent and terms the pipeline
+        derives from the question itself, so the pipeline may reuse them.
+        The detector and writer lowercase on their own; only the folding of
+        "I" and "İ" can make the two differ.
+        """
+        return "I" not in question and "İ" not in question
+
+    def get_retrieval_cache(self) -> Optional[RetrievalCache]:
+        return self.__retrieval_cache
+
+    def get_retrieval_cache_key(self, terms: List[str]) -> Tuple:
+        """
+        Everything that determines the retrieved candidate list: the terms,
+        retriever settings and a fingerprint of the indexed chunks.
+        """
+        index_fingerprint = (
+            self.__chunk_store.get_fingerprint(),
+            self.get_embedding_provider().get_signature()
+        )
+        return (
+            tuple(terms),
+            self.__config.get_retriever_type(),
+            self.__config.get_top_k(),
+            self.__config.get_retriever_alpha(),
+            self.__config.get_retriever_beta(),
+            self.__config.get_keyword_scoring(),
+            self.__config.get_bm25_k1(),
+            self.__config.get_bm25_b(),
+            self.__config.get_bm25f_title_weight(),
+            self.__config.get_bm25f_header_weight(),
+            self.__config.get_bm25f_content_weight(),
+            self.__config.get_vector_index_type(),
+            self.__config.get_ivf_nlist(),
+            self.__config.get_ivf_nprobe(),
+            self.__config.get_vector_storage(),
+            self.__config.get_vector_rescore(),
+            index_fingerprint
+        )
+
+    # --------------------------
+    # Resources
+    # --------------------------
+
+    def get_intent_rules(self) -> Dict[Intent, List[str]]:
+        with self.__lock:
+            if self.__intent_rules is None:
+                from src.intent.intent_rules_loader import IntentRulesLoader
+                self.__intent_rules = IntentRulesLoader().load_rules(self.__config.get_rules_file_path())
+            return self.__intent_rules
+
+    def get_stopwords(self) -> Set[str]:
+        with self.__lock:
+            if self.__stopwords is None:
+                self.__stopwords = self.load_stopwords(self.__config.get_stopwords_file_path())
+            return self.__stopwords
+
+    def get_suffixes(self) -> List[str]:
+        with self.__lock:
+            if self.__suffixes is None:
+                self.__suffixes = self.load_suffixes(self.__config.get_suffixes_file_path())
+            return self.__suffixes
+
+    def get_conjunctions(self) -> List[str]:
+        with self.__lock:
+            if self.__conjunctions is None:
+                self.__conjunctions = self.load_conjunctions(self.__config.get_conjunctions_file_path())
+            return self.__conjunctions
+
+    def get_stemmer(self):
+        with self.__lock:
+            if self.__stemmer is None:
+                from src.writer.simple_stemmer import SimpleStemmer
+                stemmer = SimpleStemmer(
+                    suffixes=self.get_suffixes(),
+                    min_word_length=3,
+                    cache_size=self.__config.get_stem_cache_size()
+                )
+                if self.__config.is_precompute_stems():
+                    stemmer.precompute(self.__corpus_vocabulary())
+                self.__stemmer = stemmer
+            return self.__stemmer
+
+    def __corpus_vocabulary(self) -> Set[str]:
+        """
+        Tokens of every chunk text, document title and section header, as the
+        keyword index and embedding provider tokenize them (ChunkAnalysis).
+        """
+        from src.model.chunk_analysis import ChunkAnalysis
+
+        store = self.__chunk_store
+        vocabulary: Set[str] = set()
+        sections: Set[Tuple[str, str]] = set()
+        for chunk in store.iter_chunks():
+            # The store's cached analysis; a chunk without text has no tokens.
+            vocabulary.update(chunk.get_analysis().get_tokens())
+            sections.add((chunk.get_doc_id(), chunk.get_section_id()))
+        for doc_id in store.get_all_doc_ids():
+            # Titles are file-name like; the keyword index splits them at "_".
+            title = (store.get_document_title(doc_id) or "").replace("_", " ")
+            vocabulary.update(ChunkAnalysis(title).get_tokens())
+        for doc_id, section_id in sections:
+            vocabulary.update(ChunkAnalysis(store.get_section_header(doc_id, section_id)).get_tokens())
+        return vocabulary
+
+    def get_trace_sink(self):
+        """
+        One sink per session, so every query of a run appends to the same log.
+        "durable" writes and closes the file per event; "buffered" hands
+        events to a background writer thread. Returns None when the trace
+        level is "off", so no log file is created at all.
+        """
+        with self.__lock:
+            if self.__trace_sink is None:
+                from src.trace.jsonl_trace_sink import JsonlTraceSink
+                from src.trace.buffered_jsonl_trace_sink import BufferedJsonlTraceSink
+                from src.trace.trace_level import TraceLevel
+
+                try:
+                    trace_level = TraceLevel(self.__config.get_trace_level())
+                except ValueError:
+                    raise IllegalArgumentError(f"Unknown trace level: {self.__config.get_trace_level()}")
+                if trace_level == TraceLevel.OFF:
+                    return None
+
+                trace_mode = self.__config.get_trace_mode()
+                logs_dir = self.__config.get_logs_dir_path()
+
+                if trace_mode == "durable":
+                    self.__trace_sink = JsonlTraceSink(logs_dir, trace_level)
+                elif trace_mode == "buffered":
+                    self.__trace_sink = BufferedJsonlTraceSink(
+                        logs_dir,
+                        self.__config.get_trace_queue_size(),
+                        self.__config.get_trace_flush_events(),
+                        self.__config.get_trace_flush_interval_ms(),
+                        self.__config.get_trace_overflow_policy(),
+                        trace_level
+                    )
+                else:
+                    raise IllegalArgumentError(f"Unknown trace mode: {trace_mode}")
+            return self.__trace_sink
+
+    def get_executor(self):
+        """Thread pool (pipeline.async_workers) running the AsyncRagPipeline stages."""
+        with self.__lock:
+            if self.__executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.__config.get_async_workers()),
+                    thread_name_prefix="rag-async"
+                )
+            return self.__executor
+
+    def get_trace_executor(self):
+        """
+        Single thread that publishes AsyncRagPipeline trace events, so stages
+        never wait on a sink and events keep their publication order.
+        """
+        with self.__lock:
+            if self.__trace_executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self.__trace_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rag-trace")
+            return self.__trace_executor
+
+    # --------------------------
+    # Components
+    # --------------------------
+
+    def get_intent_detector(self):
+        with self.__lock:
+            if self.__intent_detector is None:
+                from src.intent.rule_intent_detector import RuleIntentDetector
+
+                if self.__config.get_intent_type() == "RuleIntentDetector":
+                    rules = self.get_intent_rules()
+                    self.__intent_detector = RuleIntentDetector(rules, list(rules.keys()))
+                else:
+                    raise IllegalArgumentError(f"Unknown intent detector type: {self.__config.get_intent_type()}")
+            return self.__intent_detector
+
+    def get_query_writer(self):
+        with self.__lock:
+            if self.__query_writer is None:
+                from src.writer.heuristic_query_writer import HeuristicQueryWriter
+
+                if self.__config.get_writer_type() == "HeuristicQueryWriter":
+                    self.__query_writer = HeuristicQueryWriter(
+                        self.get_stopwords(),
+                        self.get_intent_rules(),
+                        self.get_suffixes(),
+                        self.get_conjunctions(),
+                        self.__config.get_tf_weight(),
+                        self.__config.get_booster_weight(),
+                        self.__config.get_base_weight(),
+                        stemmer=self.get_stemmer()
+                    )
+                else:
+                    raise IllegalArgumentError(f"Unknown query writer type: {self.__config.get_writer_type()}")
+            return self.__query_writer
+
+    def get_embedding_provider(self):
+        with self.__lock:
+            if self.__embedding_provider is None:
+                from src.embedding.simple_embedding_provider import SimpleEmbeddingProvider
+                self.__embedding_provider = SimpleEmbeddingProvider(self.get_stemmer())
+            return self.__embedding_provider
+
+    def get_vector_index(self):
+        with self.__lock:
+            if self.__vector_index is None:
+                from src.index.vector_index import VectorIndex
+
+                self.__vector_index = VectorIndex(
+                    self.__chunk_store,
+                    self.get_embedding_provider(),
+                    self.__config.get_vector_backend(),
+                    self.__config.get_chunk_path() if self.__config.is_persist_vector_index() else None,
+                    self.__config.get_vector_index_type(),
+                    self.__config.get_ivf_nlist(),
+                    self.__config.get_ivf_nprobe(),
+                    self.__config.get_vector_storage(),
+                    self.__config.get_vector_rescore(),
+                    self.__config.get_embedding_batch_size()
+                )
+            return self.__vector_index
+
+    def get_vector_searcher(self):
+        """
+        What VectorRetriever searches: the vector index itself, or a
+        MicroBatchScheduler over it when params.vector_index.batch_window_ms
+        is positive.
+        """
+        with self.__lock:
+            if self.__config.get_vector_batch_window_ms() <= 0:
+                return self.get_vector_index()
+            if self.__vector_scheduler is None:
+                from src.index.micro_batch_scheduler import MicroBatchScheduler
+
+                self.__vector_scheduler = MicroBatchScheduler(
+                    self.get_vector_index(),
+                    self.__config.get_vector_batch_window_ms(),
+                    self.__config.get_vector_batch_max_queries()
+                )
+            return self.__vector_scheduler
+
+    def get_retriever(self):
+        with self.__lock:
+            if self.__retriever is None:
+                from src.retrieval.vector_retriver import VectorRetriever
+                from src.retrieval.hybrid_retriever import HybridRetriever
+
+                retriever_type = self.__config.get_retriever_type()
+                top_k = self.__config.get_top_k()
+
+                if retriever_type == "KeywordRetriever":
+                    self.__retriever = self.__create_keyword_retriever(top_k)
+                elif retriever_type == "VectorRetriever":
+                    self.__retriever = VectorRetriever(self.get_vector_searcher(), top_k)
+                elif retriever_type == "HybridRetriever":
+                    self.__retriever = HybridRetriever(
+                        self.__create_keyword_retriever(top_k),
+                        VectorRetriever(self.get_vector_searcher(), top_k),
+                        self.__config.get_retriever_alpha(),
+                        self.__config.get_retriever_beta(),
+                        top_k
+                    )
+                else:
+                    raise IllegalArgumentError(f"Unknown retriever type: {retriever_type}")
+            return self.__retriever
+
+    def __create_keyword_retriever(self, top_k: int):
+        from src.retrieval.keyword_retriever import KeywordRetriever
+
+        return KeywordRetriever(
+            top_k,
+            self.get_stemmer(),
+            self.__config.get_keyword_scoring(),
+            self.__config.get_bm25_k1(),
+            self.__config.get_bm25_b(),
+            self.__config.get_bm25f_title_weight(),
+            self.__config.get_bm25f_header_weight(),
+            self.__config.get_bm25f_content_weight(),
+            self.__config.is_keyword_pruning()
+        )
+
+    def get_reranker(self):
+        with self.__lock:
+            if self.__reranker is None:
+                from src.reranker.simple_reranker import SimpleReranker
+                from src.reranker.cosine_reranker import CosineReranker
+                from src.reranker.hybrid_reranker import HybridReranker
+
+                reranker_type = self.__config.get_reranker_type()
+
+                if reranker_type == "SimpleReranker":
+                    self.__reranker = SimpleReranker(
+                        self.__config.get_proximity_window(),
+                        self.__config.get_proximity_bonus(),
+                        self.__config.get_title_boost()
+                    )
+                elif reranker_type == "CosineReranker":
+                    self.__reranker = CosineReranker()
+                elif reranker_type == "HybridReranker":
+                    self.__reranker = HybridReranker(
+                        self.__config.get_reranker_alpha(),
+                        self.__config.get_reranker_beta()
+                    )
+                else:
+                    raise IllegalArgumentError(f"Unknown reranker type: {reranker_type}")
+            return self.__reranker
+
+    def get_answer_agent(self):
+        with self.__lock:
+            if self.__answer_agent is None:
+                from src.answer.template_answer_agent import TemplateAnswerAgent
+
+                if self.__config.get_answer_agent_type() == "TemplateAnswerAgent":
+                    self.__answer_agent = TemplateAnswerAgent()
+                else:
+                    raise IllegalArgumentError(f"Unknown answer agent type: {self.__config.get_answer_agent_type()}")
+            return self.__answer_agent
+
+    # --------------------------
+    # Resource file parsers
+    # --------------------------
+
+    @staticmethod
+    def load_stopwords(stopwords_path: Path) -> Set[str]:
+        try:
+            stopwords = set()
+            in_stopwords = False
+
+            with open(stopwords_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    trimmed = line.strip()
+
+                    if not trimmed or trimmed.startswith("#"):
+                        continue
+
+                    if trimmed == "stop_words:":
+                        in_stopwords = True
+                        continue
+
+                    if in_stopwords and trimmed.startswith("-"):
+                        word = trimmed[1:].strip()
+                        if word.startswith('"') and word.endswith('"'):
+                            word = word[1:-1]
+                        stopwords.add(word)
+
+            return stopwords
+        except Exception as e:
+            raise RuntimeError(f"Failed to load stopwords from: {stopwords_path}") from e
+
+    @staticmethod
+    def load_suffixes(suffixes_path: Path) -> List[str]:
+        try:
+            suffixes = []
+            in_suffixes = False
+
+            with open(suffixes_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    trimmed = line.strip()
+
+                    if not trimmed or trimmed.startswith("#"):
+                        continue
+
+                    if trimmed == "suffixes:":
+                        in_suffixes = True
+                        continue
+
+                    if in_suffixes and trimmed.startswith("-"):
+                        suffix = trimmed[1:].strip()
+                        if suffix.startswith('"') and suffix.endswith('"'):
+                            suffix = suffix[1:-1]
+                        suffixes.append(suffix)
+
+            return suffixes
+        except Exception as e:
+            raise RuntimeError(f"Failed to load suffixes from: {suffixes_path}") from e
+
+    @staticmethod
+    def load_conjunctions(conjunctions_path: Path) -> List[str]:
+        try:
+            conjunctions = []
+            in_conjunctions = False
+
+            with open(conjunctions_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    trimmed = line.strip()
+
+                    if not trimmed or trimmed.startswith("#"):
+                        continue
+
+                    if trimmed == "conjunctions:":
+                        in_conjunctions = True
+                        continue
+
+                    if in_conjunctions and trimmed.startswith("-"):
+                        conjunction = trimmed[1:].strip()
+                        if conjunction.startswith('"') and conjunction.endswith('"'):
+                            conjunction = conjunction[1:-1]
+                        conjunctions.append(conjunction)
+
+            return conjunctions
+        except Exception as e:
+            raise RuntimeError(f"Failed to load conjunctions from: {conjunctions_path}") from e
@@ -1,22 +1,69 @@
 from pathlib import Path
+from typing import Optional
 
 from src.config.config import Config
 from src.context.context import Context
+from src.orchestrator.pipeline_session import PipelineSession, IllegalArgumentError
+from src.orchestrator.rag_pipeline import RagPipeline
+from src.orchestrator.async_rag_pipeline import AsyncRagPipeline
 from src.orchestrator.sequential_rag_pipeline import SequentialRagPipeline
 from src.trace.trace_bus import TraceBus
-from src.trace.jsonl_trace_sink import JsonlTraceSink
 
 
 class RagOrchestrator:
     
-    def __init__(self, context: Context):
+    def __init__(self, context: Context, session: Optional[PipelineSession] = None):
        
         self.__context = context
+        self.__session = session
+        # A session created here (none was passed) is closed after each run,
+        # so its trace sink and executors do not outlive the orchestrator.
+        self.__private_session = False
         self.__trace_bus = TraceBus()
     
     def run(self, config: Config) -> None:
-        jsonl_sink = JsonlTraceSink(config.get_logs_dir_path())
-        self.__trace_bus.register(jsonl_sink)
-        
-        pipeline = SequentialRagPipeline(config, self.__context, self.__trace_bus)
-        pipeline.execute()
+        trace_sink = None
+        try:
+            trace_sink = self.__register_trace_sink(config)
+            self.__create_pipeline(config).execute()
+        finally:
+            if trace_sink is not None:
+                self.__trace_bus.unregister(trace_sink)
+            self.__close_private_session()
+
+    async def run_async(self, config: Config) -> None:
+        """run() for callers already inside an event loop (pipeline.mode "async" only)."""
+        trace_sink = None
+        try:
+            trace_sink = self.__register_trace_sink(config)
+            pipeline = self.__create_pipeline(config)
+            if not isinstance(pipeline, AsyncRagPipeline):
+                raise IllegalArgumentError('run_async needs pipeline.mode "async"')
+            await pipeline.execute_async()
+        finally:
+            if trace_sink is not None:
+                self.__trace_bus.unregister(trace_sink)
+            self.__close_private_session()
+
+    def __register_trace_sink(self, config: Config):
+        if self.__session is None:
+            self.__session = PipelineSession(config, self.__context.get_chunk_store())
+            self.__private_session = True
+        trace_sink = self.__session.get_trace_sink()
+        if trace_sink is not None:
+            self.__trace_bus.register(trace_sink)
+        return trace_sink
+
+    def __close_private_session(self) -> None:
+        if self.__private_session:
+            self.__session.close()
+            self.__session = None
+            self.__private_session = False
+
+    def __create_pipeline(self, config: Config) -> RagPipeline:
+        mode = config.get_pipeline_mode()
+        if mode == "sequential":
+            return SequentialRagPipeline(config, self.__context, self.__trace_bus, self.__session)
+        if mode == "async":
+            return AsyncRagPipeline(config, self.__context, self.__trace_bus, self.__session)
+        raise IllegalArgumentError(f"Unknown pipeline mode: {mode}")
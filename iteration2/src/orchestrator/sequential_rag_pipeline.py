@@ -1,4 +1,7 @@
+from typing import Optional
+
 from src.orchestrator.rag_pipeline import RagPipeline
+from src.orchestrator.pipeline_session import PipelineSession
 from src.config.config import Config
 from src.context.context import Context
 from src.trace.trace_bus import TraceBus
@@ -6,9 +9,10 @@ from src.trace.trace_bus import TraceBus
 
 class SequentialRagPipeline(RagPipeline):
   
-    def __init__(self, config: Config, context: Context, trace_bus: TraceBus):
+    def __init__(self, config: Config, context: Context, trace_bus: TraceBus,
+                 session: Optional[PipelineSession] = None):
        
-        super().__init__(config, context, trace_bus)
+        super().__init__(config, context, trace_bus, session)
     
     def execute(self) -> None:
        
@@ -1,6 +1,7 @@
 from typing import List
 
 from src.data.chunk_store import ChunkStore
+from src.index.top_k_selector import TopKSelector
 from src.model.hit import Hit
 from src.reranker.reranker import Reranker
 
@@ -25,12 +26,5 @@ class CosineReranker(Reranker):
         # Simply reorder by existing vector-based score.
         reranked = list(hits)
 
-        reranked.sort(
-            key=lambda h: (
-                -h.get_score(),     # higher cosine score first
-                h.get_doc_id(),     # deterministic tie-break
-                h.get_chunk_id()
-            )
-        )
-
-        return reranked
\ No newline at end of file
+        # Higher score first, then docId/chunkId as deterministic tie-break.
+        return TopKSelector.select_hits(reranked)
\ No newline at end of file
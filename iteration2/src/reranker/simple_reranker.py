@@ -4,6 +4,7 @@ from src.reranker.reranker import Reranker
 from src.data.chunk_store import ChunkStore
 from src.model.chunk import Chunk
 from src.model.hit import Hit 
+from src.index.top_k_selector import TopKSelector
 
 class SimpleReranker(Reranker):
     
@@ -44,7 +45,7 @@ class SimpleReranker(Reranker):
         reranked: List[Hit] = []
 
         for hit in hits:
-            chunk: Optional[Chunk] = store.get_chunk(hit.get_doc_id(), hit.get_chunk_id())
+            chunk: Optional[Chunk] = store.get_chunk(hit.get_doc_id(), hit.get_chunk_id(), hit.get_ordinal())
             
             if chunk is None:
                 continue
@@ -52,7 +53,7 @@ class SimpleReranker(Reranker):
 
             if query_terms and len(query_terms) >= 2:
 
-                chunk_text_lower = chunk.get_text().lower()
+                chunk_text_lower = chunk.get_analysis().get_lower_text()
                 
                 if self.__any_terms_within_window(chunk_text_lower, query_terms, self.__proximity_window):
                     score += self.__proximity_bonus
@@ -71,12 +72,6 @@ class SimpleReranker(Reranker):
                     if term.lower() in title_lower:
                         score += self.__title_boost
                         break 
-            reranked.append(Hit(hit.get_doc_id(), hit.get_chunk_id(), score))
+            reranked.append(Hit(hit.get_doc_id(), hit.get_chunk_id(), score, hit.get_ordinal()))
 
-        reranked.sort(key=lambda h: (
-            -h.get_score(),           
-            h.get_doc_id(),           
-            h.get_chunk_id()         
-        ))
-        
-        return reranked
+        return TopKSelector.select_hits(reranked)
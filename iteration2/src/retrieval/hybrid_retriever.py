@@ -1,6 +1,7 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 from src.data.chunk_store import ChunkStore
+from src.index.top_k_selector import TopKSelector
 from src.model.hit import Hit
 from src.retrieval.retriever import Retriever
 
@@ -31,41 +32,50 @@ class HybridRetriever(Retriever):
     ) -> List[Hit]:
         keyword_hits = self.__keyword_retriever.retrieve(query_terms, store)
         vector_hits = self.__vector_retriever.retrieve(query_terms, store)
+        return self.merge(keyword_hits, vector_hits)
 
+    def get_keyword_retriever(self) -> Retriever:
+        return self.__keyword_retriever
+
+    def get_vector_retriever(self) -> Retriever:
+        return self.__vector_retriever
+
+    def merge(self, keyword_hits: List[Hit], vector_hits: List[Hit]) -> List[Hit]:
+        """
+        Fuses the two candidate lists; callers that run both retrievers
+        themselves (e.g. concurrently) get the same result as retrieve().
+        """
         if not keyword_hits and not vector_hits:
             return []
 
         keyword_max = max((h.get_score() for h in keyword_hits), default=1.0)
         vector_max = max((h.get_score() for h in vector_hits), default=1.0)
 
-        merged: Dict[str, float] = {}
+        # Keyed by (docId, chunkId); the ID strings are shared with the store.
+        merged: Dict[Tuple[str, str], float] = {}
+        ordinals: Dict[Tuple[str, str], Optional[int]] = {}
 
-        for hit in keyword_hits:
-            key = f"{hit.get_doc_id()}||{hit.get_chunk_id()}"
-            normalized_score = hit.get_score() / keyword_max if keyword_max > 0 else 0.0
-            merged[key] = merged.get(key, 0.0) + self.__alpha * normalized_score
-
-        for hit in vector_hits:
-            key = f"{hit.get_doc_id()}||{hit.get_chunk_id()}"
-            normalized_score = hit.get_score() / vector_max if vector_max > 0 else 0.0
-            merged[key] = merged.get(key, 0.0) + self.__beta * normalized_score
+        for source_hits, weight, max_score in (
+            (keyword_hits, self.__alpha, keyword_max),
+            (vector_hits, self.__beta, vector_max),
+        ):
+            for hit in source_hits:
+                key = (hit.get_doc_id(), hit.get_chunk_id())
+                normalized_score = hit.get_score() / max_score if max_score > 0 else 0.0
+                merged[key] = merged.get(key, 0.0) + weight * normalized_score
+                if ordinals.get(key) is None:
+                    ordinals[key] = hit.get_ordinal()
 
         hits: List[Hit] = []
 
-        for key, score in merged.items():
-            doc_id, chunk_id = key.split("||")
+        for (doc_id, chunk_id), score in merged.items():
             hits.append(
                 Hit(
                     doc_id=doc_id,
                     chunk_id=chunk_id,
-                    score=int(score * 1000)
+                    score=int(score * 1000),
+                    ordinal=ordinals[(doc_id, chunk_id)]
                 )
             )
 
-        hits.sort(key=lambda h: (
-            -h.get_score(),
-            h.get_doc_id(),
-            h.get_chunk_id()
-        ))
-
-        return hits[:self.__top_k]
\ No newline at end of file
+        return TopKSelector.select_hits(hits, self.__top_k)
\ No newline at end of file
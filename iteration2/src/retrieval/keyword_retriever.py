@@ -1,71 +1,187 @@
-from typing import Dict, List, Optional
-import re
+from typing import Callable, Dict, List, Optional
 
 from src.data.chunk_store import ChunkStore
+from src.index.keyword_index import KeywordIndex
+from src.index.max_score_evaluator import MaxScoreEvaluator, TermPostings
 from src.model.hit import Hit
+from src.model.hit_list import HitList
 from src.retrieval.retriever import Retriever
 from src.writer.simple_stemmer import SimpleStemmer
 
 
 class KeywordRetriever(Retriever):
+    """
+    Keyword retrieval over the shared KeywordIndex.
+
+    Scoring modes:
+    - "tf": summed raw term frequency in the chunk content (original behavior).
+    - "bm25": Okapi BM25 over chunk content.
+    - "bm25f": BM25F over document title, section header and chunk content,
+      each with its own weight and length normalization.
+    All modes only visit the postings of the query terms. For "bm25",
+    top-k evaluation uses MaxScore pruning (unless disabled), which skips
+    postings that cannot reach the current top-k and returns exactly the
+    exhaustive result.
+    """
+
+    SCORING_TF = "tf"
+    SCORING_BM25 = "bm25"
+    SCORING_BM25F = "bm25f"
+
+    # Below this many query postings the plain scoring loop beats the
+    # bookkeeping of pruned evaluation. "tf" is never pruned: its strongest
+    # terms are the frequent ones, so there is little to skip, and the plain
+    # loop adds raw tfs without a scoring call per posting.
+    MIN_PRUNING_POSTINGS = {SCORING_BM25: 1024}
+
+    def __init__(
+        self,
+        top_k: int,
+        stemmer: Optional[SimpleStemmer] = None,
+        scoring: str = SCORING_TF,
+        k1: float = 1.2,
+        b: float = 0.75,
+        title_weight: float = 2.0,
+        header_weight: float = 1.5,
+        content_weight: float = 1.0,
+        pruning: bool = True
+    ):
+        if scoring not in (self.SCORING_TF, self.SCORING_BM25, self.SCORING_BM25F):
+            raise ValueError(f"Unknown keyword scoring: {scoring}")
 
-    def __init__(self, top_k: int, stemmer: Optional[SimpleStemmer] = None):
         self.__top_k = top_k
         self.__stemmer = stemmer
-
-    def __safe_lower(self, s: str) -> str:
-        return s.lower() if s is not None else ""
-
-    def __extract_words(self, text: str) -> List[str]:
-        words = re.findall(r'\b\w+\b', text.lower())
-        if self.__stemmer:
-            return [self.__stemmer.stem(word) for word in words]
-        return words
-
-    def __count_term_matches(self, chunk_words: List[str], query_term: str) -> int:
-        if not chunk_words or not query_term:
-            return 0
-        
-        query_term_lower = query_term.lower()
-        query_stem = self.__stemmer.stem(query_term_lower) if self.__stemmer else query_term_lower
-        
-        return chunk_words.count(query_stem)
+        self.__scoring = scoring
+        self.__k1 = k1
+        self.__b = b
+        self.__pruning = pruning
+        self.__field_weights = {
+            KeywordIndex.FIELD_TITLE: title_weight,
+            KeywordIndex.FIELD_HEADER: header_weight,
+            KeywordIndex.FIELD_CONTENT: content_weight,
+        }
+
+    def get_scoring(self) -> str:
+        return self.__scoring
 
     def retrieve(self, query_terms: List[str], store: ChunkStore) -> List[Hit]:
         if not query_terms:
             return []
 
-        hit_map: Dict[str, Hit] = {}
+        index = KeywordIndex.for_store(store, self.__stemmer)
+        terms = [index.normalize_term(term) for term in query_terms if term]
+
+        if self.__use_pruning(index, terms):
+            scored = MaxScoreEvaluator(self.__top_k).evaluate(terms, self.__term_postings(index, terms))
+            ordinals = [ordinal for ordinal, _ in scored]
+            scores = [score for _, score in scored]
+        else:
+            scored = self.__score_exhaustive(index, terms)
+            ordinals, scores = scored.keys(), scored.values()
+
+        # Only the top_k candidates become Hit objects.
+        candidates = HitList(store, ordinals, scores, integer_scores=self.__scoring == self.SCORING_TF)
+        return candidates.top_k(self.__top_k).to_hits()
+
+    def __use_pruning(self, index: KeywordIndex, terms: List[str]) -> bool:
+        # BM25F saturates the sum over fields, so it has no per-posting
+        # contribution to bound; the BM25 bound assumes 0 <= b <= 1.
+        min_postings = self.MIN_PRUNING_POSTINGS.get(self.__scoring)
+        if (
+            not self.__pruning
+            or min_postings is None
+            or self.__scoring == self.SCORING_BM25F
+            or not 0.0 <= self.__b <= 1.0
+        ):
+            return False
+        postings = sum(len(index.get_posting_arrays(term)[0]) for term in set(terms))
+        return postings >= min_postings
+
+    def __score_exhaustive(self, index: KeywordIndex, terms: List[str]) -> Dict[int, float]:
+        # Only chunks in the union of the query terms' postings are scored.
+        # Repeated query terms count once per occurrence, as before.
+        scores: Dict[int, float] = {}
+
+        for term in terms:
+            if self.__scoring == self.SCORING_BM25F:
+                self.__add_bm25f(index, term, scores)
+                continue
+
+            ordinals, tfs = index.get_posting_arrays(term)
+            if not ordinals:
+                continue
+            if self.__scoring == self.SCORING_BM25:
+                score = self.__bm25_scorer(index, term)
+                for ordinal, tf in zip(ordinals, tfs):
+                    scores[ordinal] = scores.get(ordinal, 0.0) + score(ordinal, tf)
+            else:
+                for ordinal, tf in zip(ordinals, tfs):
+                    scores[ordinal] = scores.get(ordinal, 0) + tf
 
-        for chunk in store.get_all_chunks():
-            chunk_text = self.__safe_lower(chunk.get_text())
-            chunk_words = self.__extract_words(chunk_text)
-            
-            total_tf = 0
+        return scores
 
-            for term in query_terms:
-                if not term:
-                    continue
-                total_tf += self.__count_term_matches(chunk_words, term)
+    def __term_postings(self, index: KeywordIndex, terms: List[str]) -> Dict[str, TermPostings]:
+        """Postings, per-posting scorer and score upper bound of each query term."""
+        term_postings: Dict[str, TermPostings] = {}
+        k1, b = self.__k1, self.__b
 
-            if total_tf <= 0:
+        for term in set(terms):
+            ordinals, tfs = index.get_posting_arrays(term)
+            if not ordinals:
                 continue
 
-            key = f"{chunk.get_doc_id()}||{chunk.get_chunk_id()}"
-            hit = hit_map.get(key)
-
-            if hit is None:
-                hit = Hit(chunk.get_doc_id(), chunk.get_chunk_id(), total_tf)
-                hit_map[key] = hit
+            max_tf, min_length = index.get_term_bounds(term)
+            if self.__scoring == self.SCORING_BM25:
+                average_length = index.get_average_field_length(KeywordIndex.FIELD_CONTENT) or 1.0
+                # BM25 grows with tf and shrinks with length, so the best case
+                # is the largest tf in the shortest chunk of the postings.
+                upper_bound = index.get_idf(term) * max_tf * (k1 + 1.0) / (
+                    max_tf + k1 * (1.0 - b + b * min_length / average_length)
+                )
+                term_postings[term] = (ordinals, tfs, self.__bm25_scorer(index, term), upper_bound)
             else:
-                hit.set_score(hit.get_score() + total_tf)
+                term_postings[term] = (ordinals, tfs, self.__tf_score, max_tf)
 
-        hits: List[Hit] = list(hit_map.values())
+        return term_postings
 
-        hits.sort(key=lambda h: (
-            -h.get_score(),           
-            h.get_doc_id(),           
-            h.get_chunk_id()
-        ))
-        
-        return hits[:self.__top_k]
+    @staticmethod
+    def __tf_score(ordinal: int, tf: int) -> int:
+        return tf
+
+    def __bm25_scorer(self, index: KeywordIndex, term: str) -> Callable[[int, int], float]:
+        idf = index.get_idf(term)
+        k1, b = self.__k1, self.__b
+        lengths = index.get_field_lengths(KeywordIndex.FIELD_CONTENT)
+        average_length = index.get_average_field_length(KeywordIndex.FIELD_CONTENT) or 1.0
+
+        def score(ordinal: int, tf: int) -> float:
+            norm = k1 * (1.0 - b + b * lengths[ordinal] / average_length)
+            return idf * tf * (k1 + 1.0) / (tf + norm)
+
+        return score
+
+    def __add_bm25f(self, index: KeywordIndex, term: str, scores: Dict[int, float]) -> None:
+        # Length-normalized, weighted term frequency accumulated over fields,
+        # then saturated once per chunk.
+        weighted_tf: Dict[int, float] = {}
+        b = self.__b
+
+        for field, weight in self.__field_weights.items():
+            if weight <= 0:
+                continue
+            ordinals, tfs = index.get_posting_arrays(term, field)
+            if not ordinals:
+                continue
+            lengths = index.get_field_lengths(field)
+            average_length = index.get_average_field_length(field) or 1.0
+            for ordinal, tf in zip(ordinals, tfs):
+                length_norm = 1.0 - b + b * lengths[ordinal] / average_length
+                weighted_tf[ordinal] = weighted_tf.get(ordinal, 0.0) + weight * tf / length_norm
+
+        if not weighted_tf:
+            return
+
+        idf = index.get_any_field_idf(term)
+        k1 = self.__k1
+        for ordinal, tf in weighted_tf.items():
+            scores[ordinal] = scores.get(ordinal, 0.0) + idf * tf * (k1 + 1.0) / (k1 + tf)
@@ -8,7 +8,8 @@ from src.index.vector_index import VectorIndex
 
 class VectorRetriever(Retriever):
     """
-    Retriever that performs semantic search using VectorIndex.
+    Retriever that performs semantic search using VectorIndex, directly or
+    through a MicroBatchScheduler (anything with search_rows()).
     """
 
     def __init__(
@@ -29,23 +30,24 @@ class VectorRetriever(Retriever):
 
         query_text = " ".join(query_terms)
 
-        # VectorIndex returns (key, cosine_score)
-        results = self.__vector_index.search(
+        # VectorIndex returns (row, cosine_score); rows are store ordinals
+        results = self.__vector_index.search_rows(
             query_text=query_text,
             top_k=self.__top_k
         )
 
         hits: List[Hit] = []
 
-        for key, score in results:
-            doc_id, chunk_id = key.split("||")
+        for row, score in results:
+            doc_id, chunk_id = store.get_chunk_ref_at(row)
 
             # scale cosine score to int for deterministic behavior
             hits.append(
                 Hit(
                     doc_id=doc_id,
                     chunk_id=chunk_id,
-                    score=int(score * 1000)
+                    score=int(score * 1000),
+                    ordinal=row
                 )
             )
 
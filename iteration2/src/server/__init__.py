@@ -0,0 +1,8 @@
+# Server package
+from src.server.rag_server import RagServer
+from src.server.rag_client import RagClient
+
+__all__ = [
+    'RagServer',
+    'RagClient'
+]
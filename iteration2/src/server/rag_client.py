@@ -0,0 +1,55 @@
+import http.client
+import json
+import socket
+from typing import Dict
+
+from src.server.rag_server import RagServer
+
+
+class _UnixHttpConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.__path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.__path)
+
+
+class RagClient:
+    """
+    Client of a RagServer at "host:port" or "unix:/path/to.sock".
+    One connection per call, so a client may be shared between threads.
+    """
+
+    def __init__(self, address: str, timeout: float = 60.0):
+        self.__address = address
+        self.__timeout = timeout
+
+    def query(self, question: str) -> Dict[str, object]:
+        return self.__request("POST", "/query", {"question": question})
+
+    def health(self) -> Dict[str, object]:
+        return self.__request("GET", "/health")
+
+    def __request(self, method: str, path: str, payload: Dict[str, object] = None) -> Dict[str, object]:
+        connection = self.__connect()
+        try:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else None
+            headers = {"Content-Type": "application/json; charset=utf-8"} if body is not None else {}
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            result = json.loads(response.read().decode("utf-8"))
+        finally:
+            connection.close()
+
+        if response.status != 200:
+            raise RuntimeError(f"Server returned {response.status}: {result.get('error', result)}")
+        return result
+
+    def __connect(self) -> http.client.HTTPConnection:
+        if self.__address.startswith(RagServer.UNIX_PREFIX):
+            return _UnixHttpConnection(self.__address[len(RagServer.UNIX_PREFIX):], self.__timeout)
+        host, port = RagServer.parse_tcp_address(self.__address)
+        return http.client.HTTPConnection(host, port, timeout=self.__timeout)
@@ -0,0 +1,216 @@
+import json
+import socket
+import socketserver
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from src.model.answer import Answer
+
+# question -> (answer or None, whether it came from the query cache)
+AnswerFunction = Callable[[str], Tuple[Optional[Answer], bool]]
+
+
+class RagServer:
+    """
+    Answers questions over HTTP from one warm, in-process pipeline.
+
+    The address is "host:port" for TCP or "unix:/path/to.sock" for a Unix
+    domain socket. Endpoints (JSON in and out):
+    - POST /query  {"question": "..."} -> {"question", "answer", "citations",
+      "line", "cached"}; "line" is Answer.to_single_line(), "answer" is null
+      when the pipeline produced none.
+    - GET /health -> {"status": "ok", "workers": N, "chunks": N}
+
+    Connections are handled by a fixed pool of worker threads. At most
+    workers + queue_size connections are accepted at a time; beyond that
+    the accept loop waits and further clients queue in the listen backlog.
+    A connection that sends nothing for request_timeout seconds is closed,
+    so a stalled client cannot hold a worker forever. An existing file at
+    a Unix socket path is only replaced when it is a socket.
+    """
+
+    UNIX_PREFIX = "unix:"
+    MAX_BODY_BYTES = 1 << 20
+
+    def __init__(
+        self,
+        answer_question: AnswerFunction,
+        address: str,
+        workers: int = 4,
+        queue_size: int = 64,
+        chunk_count: int = 0,
+        request_timeout: float = 30.0
+    ):
+        self.__answer_question = answer_question
+        self.__request_timeout = request_timeout
+        self.__workers = max(1, workers)
+        self.__chunk_count = chunk_count
+        self.__executor = ThreadPoolExecutor(max_workers=self.__workers, thread_name_prefix="rag-server")
+        self.__slots = threading.BoundedSemaphore(self.__workers + max(0, queue_size))
+
+        if address.startswith(self.UNIX_PREFIX):
+            path = Path(address[len(self.UNIX_PREFIX):])
+            if path.is_symlink() or path.exists():
+                if not stat.S_ISSOCK(path.lstat().st_mode):
+                    raise ValueError(f"Refusing to replace {path}: not a socket")
+                path.unlink()
+            self.__server = _UnixHttpServer(str(path), _RagRequestHandler, self)
+            self.__address = f"{self.UNIX_PREFIX}{path}"
+        else:
+            host, port = self.parse_tcp_address(address)
+            self.__server = _TcpHttpServer((host, port), _RagRequestHandler, self)
+            # Port 0 picks a free port; report the bound one.
+            self.__address = f"{host}:{self.__server.server_address[1]}"
+
+    @staticmethod
+    def parse_tcp_address(address: str) -> Tuple[str, int]:
+        host, separator, port = address.rpartition(":")
+        if not separator or not port.isdigit():
+            raise ValueError(f"Expected host:port or unix:/path, got: {address}")
+        return host or "127.0.0.1", int(port)
+
+    def get_address(self) -> str:
+        return self.__address
+
+    def get_workers(self) -> int:
+        return self.__workers
+
+    def get_request_timeout(self) -> float:
+        return self.__request_timeout
+
+    def serve_forever(self) -> None:
+        self.__server.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stops the accept loop (from another thread) and waits for running requests."""
+        self.__server.shutdown()
+
+    def close(self) -> None:
+        self.__server.server_close()
+        self.__executor.shutdown(wait=True)
+        if self.__address.startswith(self.UNIX_PREFIX):
+            Path(self.__address[len(self.UNIX_PREFIX):]).unlink(missing_ok=True)
+
+    def submit(self, process: Callable[[], None]) -> None:
+        self.__slots.acquire()
+        try:
+            self.__executor.submit(self.__run, process)
+        except RuntimeError:
+            self.__slots.release()
+            raise
+
+    def __run(self, process: Callable[[], None]) -> None:
+        try:
+            process()
+        finally:
+            self.__slots.release()
+
+    def answer(self, question: str) -> Dict[str, object]:
+        answer, cached = self.__answer_question(question)
+        return {
+            "question": question,
+            "answer": answer.get_text() if answer is not None else None,
+            "citations": answer.get_citations() if answer is not None else [],
+            "line": answer.to_single_line() if answer is not None else None,
+            "cached": cached
+        }
+
+    def health(self) -> Dict[str, object]:
+        return {"status": "ok", "workers": self.__workers, "chunks": self.__chunk_count}
+
+
+class _WorkerPoolMixIn:
+    """Hands every accepted connection to the RagServer worker pool."""
+
+    def __init__(self, address, handler, rag_server: RagServer):
+        self.rag_server = rag_server
+        super().__init__(address, handler)
+
+    def process_request(self, request, client_address) -> None:
+        self.rag_server.submit(lambda: self.__process(request, client_address))
+
+    def __process(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+class _TcpHttpServer(_WorkerPoolMixIn, HTTPServer):
+    allow_reuse_address = True
+    request_queue_size = 128
+
+
+class _UnixHttpServer(_WorkerPoolMixIn, socketserver.UnixStreamServer):
+    request_queue_size = 128
+
+
+class _RagRequestHandler(BaseHTTPRequestHandler):
+    server_version = "RagServer/1.0"
+
+    def setup(self) -> None:
+        # StreamRequestHandler applies this as the socket timeout.
+        self.timeout = self.server.rag_server.get_request_timeout()
+        super().setup()
+
+    def do_GET(self) -> None:
+        if self.path != "/health":
+            self.__send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+        self.__send_json(200, self.server.rag_server.health())
+
+    def do_POST(self) -> None:
+        if self.path != "/query":
+            self.__send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+            if not 0 < length <= RagServer.MAX_BODY_BYTES:
+                raise ValueError("Request body must be 1 byte to 1 MB of JSON")
+            body = json.loads(self.__read_body(length).decode("utf-8"))
+            question = body.get("question") if isinstance(body, dict) else None
+            if not isinstance(question, str) or not question.strip():
+                raise ValueError('Expected a JSON object with a non-empty "question"')
+        except (ValueError, UnicodeDecodeError) as ex:
+            self.__send_json(400, {"error": str(ex)})
+            return
+        except socket.timeout:
+            # The client stopped sending mid-body; drop the connection.
+            self.close_connection = True
+            return
+
+        try:
+            result = self.server.rag_server.answer(question.strip())
+        except Exception as ex:
+            self.__send_json(500, {"error": f"{type(ex).__name__}: {ex}"})
+            return
+        self.__send_json(200, result)
+
+    def __read_body(self, length: int) -> bytes:
+        body = self.rfile.read(length)
+        if len(body) != length:
+            raise ValueError("Request body is shorter than its Content-Length")
+        return body
+
+    def __send_json(self, status: int, payload: Dict[str, object]) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address.
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        # One line per request on stderr would drown the server's own output.
+        pass
@@ -1,12 +1,16 @@
 # Trace package
 from src.trace.trace_event import TraceEvent
 from src.trace.trace_bus import TraceBus
+from src.trace.trace_level import TraceLevel
 from src.trace.trace_sink import TraceSink
 from src.trace.jsonl_trace_sink import JsonlTraceSink
+from src.trace.buffered_jsonl_trace_sink import BufferedJsonlTraceSink
 
 __all__ = [
     'TraceEvent',
     'TraceBus',
+    'TraceLevel',
     'TraceSink',
-    'JsonlTraceSink'
+    'JsonlTraceSink',
+    'BufferedJsonlTraceSink'
 ]
@@ -0,0 +1,159 @@
+import atexit
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from src.trace.trace_sink import TraceSink
+from src.trace.trace_event import TraceEvent
+from src.trace.trace_level import TraceLevel
+
+
+class BufferedJsonlTraceSink(TraceSink):
+    """
+    JSONL trace sink that keeps the query path free of file I/O.
+
+    record() only enqueues the event on a bounded queue. A background writer
+    thread serializes events and appends them through one open file handle,
+    flushing every flush_events events or flush_interval_ms milliseconds,
+    whichever comes first. When the queue is full, the "block" policy waits
+    for room and the "drop" policy discards the event and counts it; events
+    that can no longer be written (the writer thread has stopped, or the
+    file write failed) are counted as dropped as well.
+    close() (also registered with atexit) drains the queue and closes the file.
+    """
+
+    POLICY_BLOCK = "block"
+    POLICY_DROP = "drop"
+
+    # How often a blocked record() checks that the writer is still running.
+    PUT_RETRY_SECONDS = 0.1
+
+    __STOP = object()
+
+    def __init__(
+        self,
+        logs_dir: Path,
+        queue_size: int = 1024,
+        flush_events: int = 64,
+        flush_interval_ms: int = 200,
+        overflow_policy: str = POLICY_BLOCK,
+        level: TraceLevel = TraceLevel.FULL
+    ):
+        if overflow_policy not in (self.POLICY_BLOCK, self.POLICY_DROP):
+            raise ValueError(f"Unknown trace overflow policy: {overflow_policy}")
+
+        logs_dir = Path(logs_dir)
+        try:
+            logs_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            raise RuntimeError(f"Failed to create logs directory: {logs_dir}") from e
+
+        # The pid keeps concurrent worker processes from sharing a file.
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.__log_file = logs_dir / f"run-{timestamp}-{os.getpid()}.jsonl"
+
+        self.__queue: "queue.Queue" = queue.Queue(maxsize=max(1, queue_size))
+        self.__flush_events = max(1, flush_events)
+        self.__flush_interval = max(1, flush_interval_ms) / 1000.0
+        self.__overflow_policy = overflow_policy
+        self.__level = level
+        self.__dropped = 0
+        self.__closed = False
+        self.__lock = threading.Lock()  # guards __closed and __dropped
+
+        # Unbuffered binary handle: each flush is appended by __write, which
+        # repeats the write until every byte is out.
+        self.__file = open(self.__log_file, "ab", buffering=0)
+        self.__writer = threading.Thread(target=self.__run_writer, name="trace-writer", daemon=True)
+        self.__writer.start()
+        atexit.register(self.close)
+
+    def record(self, event: TraceEvent) -> None:
+        if self.__closed:
+            raise RuntimeError(f"Failed to write trace event to {self.__log_file}: sink is closed")
+
+        if self.__overflow_policy == self.POLICY_DROP:
+            try:
+                self.__queue.put_nowait(event)
+            except queue.Full:
+                self.__add_dropped(1)
+        elif not self.__put_while_writer_alive(event):
+            self.__add_dropped(1)
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+
+        self.__put_while_writer_alive(self.__STOP)
+        self.__writer.join()
+        self.__file.close()
+        atexit.unregister(self.close)
+
+    def get_level(self) -> TraceLevel:
+        return self.__level
+
+    def get_log_file(self) -> Path:
+        """Get the log file path."""
+        return self.__log_file
+
+    def get_dropped_count(self) -> int:
+        with self.__lock:
+            return self.__dropped
+
+    def __add_dropped(self, count: int) -> None:
+        with self.__lock:
+            self.__dropped += count
+
+    def __put_while_writer_alive(self, item) -> bool:
+        """Blocking put that gives up (returns False) once the writer thread has died."""
+        while True:
+            try:
+                self.__queue.put(item, timeout=self.PUT_RETRY_SECONDS)
+                return True
+            except queue.Full:
+                if not self.__writer.is_alive():
+                    return False
+
+    def __run_writer(self) -> None:
+        pending: List[str] = []
+        deadline = time.monotonic() + self.__flush_interval
+
+        while True:
+            timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self.__queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is self.__STOP:
+                self.__write(pending)
+                return
+
+            if item is not None:
+                pending.append(item.to_json() + "\n")
+
+            if len(pending) >= self.__flush_events or time.monotonic() >= deadline:
+                self.__write(pending)
+                pending = []
+                deadline = time.monotonic() + self.__flush_interval
+
+    def __write(self, lines: List[str]) -> None:
+        if not lines:
+            return
+        data = memoryview("".join(lines).encode("utf-8"))
+        try:
+            # A raw file write may be partial; keep writing the remainder.
+            while data:
+                written = self.__file.write(data)
+                if not written:
+                    raise OSError(f"No progress writing to {self.__log_file}")
+                data = data[written:]
+        except OSError:
+            # Tracing must never take the pipeline down from a background thread.
+            self.__add_dropped(len(lines))
@@ -4,12 +4,14 @@ from datetime import datetime
 
 from src.trace.trace_sink import TraceSink
 from src.trace.trace_event import TraceEvent
+from src.trace.trace_level import TraceLevel
 
 
 class JsonlTraceSink(TraceSink):
   
-    def __init__(self, logs_dir: Path):
+    def __init__(self, logs_dir: Path, level: TraceLevel = TraceLevel.FULL):
         logs_dir = Path(logs_dir)
+        self.__level = level
         
         # Create logs directory if it doesn't exist
         try:
@@ -30,6 +32,9 @@ class JsonlTraceSink(TraceSink):
         except Exception as e:
             raise RuntimeError(f"Failed to write trace event to {self.__log_file}") from e
     
+    def get_level(self) -> TraceLevel:
+        return self.__level
+
     def get_log_file(self) -> Path:
         """Get the log file path."""
         return self.__log_file
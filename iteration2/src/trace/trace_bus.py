@@ -1,6 +1,7 @@
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
 from src.trace.trace_sink import TraceSink
 from src.trace.trace_event import TraceEvent
+from src.trace.trace_level import TraceLevel
 
 
 class TraceBus:
@@ -18,3 +19,32 @@ class TraceBus:
     def publish(self, event: TraceEvent) -> None:
         for sink in self.__sinks:
             sink.record(event)
+
+    def publish_lazy(
+        self,
+        stage: str,
+        build: Callable[[TraceLevel], Tuple[str, str]],
+        timing_ms: float,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Publishes an event whose (inputs, outputs_summary) are produced by
+        build(level). build runs at most once per level that a registered sink
+        asks for, and not at all when every sink is OFF.
+        """
+        events: Dict[TraceLevel, TraceEvent] = {}
+        for sink in self.__sinks:
+            level = sink.get_level()
+            if level == TraceLevel.OFF:
+                continue
+
+            event = events.get(level)
+            if event is None:
+                inputs, outputs_summary = build(level)
+                event = TraceEvent(stage, inputs, outputs_summary, timing_ms, error)
+                events[level] = event
+            sink.record(event)
+
+    def close(self) -> None:
+        for sink in self.__sinks:
+            sink.close()
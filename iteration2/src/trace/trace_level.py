@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class TraceLevel(Enum):
+    """
+    How much detail a sink wants in each trace event.
+    OFF records nothing, SUMMARY records sizes and other cheap facts,
+    FULL records the complete hit lists, stopword set and answer text.
+    """
+    OFF = "off"
+    SUMMARY = "summary"
+    FULL = "full"
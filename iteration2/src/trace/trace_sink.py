@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from src.trace.trace_event import TraceEvent
+from src.trace.trace_level import TraceLevel
 
 
 class TraceSink(ABC):
@@ -9,3 +10,11 @@ class TraceSink(ABC):
     def record(self, event: TraceEvent) -> None:
       
         pass
+
+    def get_level(self) -> TraceLevel:
+        """Detail level this sink wants events built at. FULL by default."""
+        return TraceLevel.FULL
+
+    def close(self) -> None:
+        """Releases any buffered events and resources. No-op by default."""
+        pass
@@ -24,7 +24,8 @@ class HeuristicQueryWriter(QueryWriter):
         booster_weight: float,
         base_weight: float,
         enable_term_weighting: bool = True,
-        enable_stemming: bool = True
+        enable_stemming: bool = True,
+        stemmer: Optional[SimpleStemmer] = None
     ) -> None:
 
         if stopwords is None:
@@ -55,7 +56,8 @@ class HeuristicQueryWriter(QueryWriter):
             base_weight=base_weight
         )
         self.__enable_term_weighting = enable_term_weighting
-        self.__stemmer = SimpleStemmer(suffixes=suffixes, min_word_length=3)
+        # A stemmer shared with the other components also shares its memo.
+        self.__stemmer = stemmer if stemmer is not None else SimpleStemmer(suffixes=suffixes, min_word_length=3)
         self.__enable_stemming = enable_stemming
 
     def write(self, question: str, intent: Intent) -> List[str]:
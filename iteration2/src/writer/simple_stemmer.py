@@ -1,27 +1,83 @@
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 
 
 class SimpleStemmer:
+    """
+    Strips the longest listed suffix that leaves a root of at least two
+    characters.
 
-    def __init__(self, suffixes: List[str], min_word_length: int = 3):
+    Suffixes are kept in a trie of their reversed characters, so a single
+    walk backwards over the word's tail finds every suffix it ends with.
+    Stems are memoized in a bounded LRU cache (cache_size 0 disables it),
+    and precompute() fills an unbounded table for a known vocabulary, such
+    as the corpus, ahead of time. One instance is meant to be shared by all
+    components that stem with the same suffixes.
+    """
+
+    DEFAULT_CACHE_SIZE = 65536
+
+    # Trie key marking that the path from the root spells a whole suffix.
+    __END = ""
+
+    def __init__(self, suffixes: List[str], min_word_length: int = 3, cache_size: int = DEFAULT_CACHE_SIZE):
         self.min_word_length = min_word_length
         self.suffixes_sorted = sorted(suffixes, key=len, reverse=True)
 
+        self.__trie: Dict[str, dict] = {}
+        for suffix in self.suffixes_sorted:
+            # An empty suffix would leave an empty root, which is never used.
+            if not suffix:
+                continue
+            node = self.__trie
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node[self.__END] = {}
+
+        self.__table: Dict[str, str] = {}
+        if cache_size > 0:
+            self.__stem_word = lru_cache(maxsize=cache_size)(self.__strip_suffix)
+        else:
+            self.__stem_word = self.__strip_suffix
+
     def stem(self, word: str) -> str:
         if not word or len(word) < self.min_word_length:
             return word
 
-        word_lower = word.lower()
-        stemmed = word_lower
-
-        for suffix in self.suffixes_sorted:
-            if stemmed.endswith(suffix):
-                root = stemmed[:-len(suffix)]
-                if len(root) >= 2:
-                    stemmed = root
-                    break
-
+        stemmed = self.__table.get(word)
+        if stemmed is None:
+            stemmed = self.__stem_word(word)
         return stemmed
 
     def stem_terms(self, terms: List[str]) -> List[str]:
         return [self.stem(term) for term in terms]
+
+    def precompute(self, words: Iterable[str]) -> int:
+        """
+        Stores the stem of every given word in the lookup table, which is
+        consulted before the LRU cache and never evicts. Returns the table
+        size.
+        """
+        table = self.__table
+        for word in words:
+            if word and len(word) >= self.min_word_length and word not in table:
+                table[word] = self.__strip_suffix(word)
+        return len(table)
+
+    def __strip_suffix(self, word: str) -> str:
+        stemmed = word.lower()
+
+        # Walk the tail backwards; every completed suffix that still leaves
+        # two root characters replaces the shorter one found before it.
+        node: Optional[Dict[str, dict]] = self.__trie
+        longest = 0
+        position = len(stemmed)
+        while position > 2:
+            position -= 1
+            node = node.get(stemmed[position])
+            if node is None:
+                break
+            if self.__END in node:
+                longest = len(stemmed) - position
+
+        return stemmed[:-longest] if longest else stemmed
@@ -0,0 +1,80 @@
+import gc
+import json
+import time
+import weakref
+from pathlib import Path
+
+from src.cache.query_cache import QueryCache
+from src.model.answer import Answer
+from src.model.intent import Intent
+
+
+def test_get_refreshes_recency_so_least_recently_used_is_evicted(tmp_path: Path) -> None:
+    cache = QueryCache(tmp_path / "cache.json", max_size=2)
+    cache.set("a", Answer("A"))
+    cache.set("b", Answer("B"))
+
+    assert cache.get("A").get_text() == "A"  # keys are case-insensitive
+    cache.set("c", Answer("C"))
+
+    assert cache.get("b") is None
+    assert cache.get("a").get_text() == "A"
+    assert cache.get("c").get_text() == "C"
+    assert cache.get_stats() == {"size": 2, "hits": 3, "misses": 1, "evictions": 1, "expirations": 0}
+
+
+def test_entries_expire_after_ttl(tmp_path: Path) -> None:
+    cache = QueryCache(tmp_path / "cache.json", ttl_seconds=0.05)
+    cache.set("q", Answer("answer"))
+
+    assert cache.contains("q")
+    time.sleep(0.1)
+
+    assert not cache.contains("q")
+    assert cache.get("q") is None
+    assert cache.get_stats()["expirations"] == 1
+
+
+def test_writes_are_batched_and_flushed_in_lru_order(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.json"
+    cache = QueryCache(cache_path, flush_every=3)
+
+    cache.set("first", Answer("1", ["doc:1:0-10"]))
+    cache.set("second", Answer("2"))
+    assert not cache_path.exists()
+
+    cache.get("first")
+    cache.set("third", Answer("3"))
+    assert list(json.loads(cache_path.read_text(encoding="utf-8"))) == ["second", "first", "third"]
+
+    cache.set("fourth", Answer("4"))
+    cache.close()
+
+    reloaded = QueryCache(cache_path)
+    assert reloaded.get("fourth").get_text() == "4"
+    assert reloaded.get("first").get_citations() == ["doc:1:0-10"]
+    assert list(tmp_path.iterdir()) == [cache_path]
+
+
+def test_normalized_tier_shares_entries_across_term_order_and_ignores_text_mode(tmp_path: Path) -> None:
+    cache = QueryCache(tmp_path / "cache.json", key_mode="normalized")
+    cache.set_normalized(Intent.STAFF_LOOKUP, ["koordinatör", "erasmus"], Answer("Ayşe Yılmaz"))
+
+    assert cache.get_normalized(Intent.STAFF_LOOKUP, ["erasmus", "koordinatör"]).get_text() == "Ayşe Yılmaz"
+    assert cache.get_normalized(Intent.COURSE, ["erasmus", "koordinatör"]) is None
+    assert cache.get("erasmus koordinatör") is None
+
+    text_cache = QueryCache(tmp_path / "text.json")
+    text_cache.set_normalized(Intent.STAFF_LOOKUP, ["erasmus"], Answer("x"))
+    assert text_cache.size() == 0
+
+
+def test_exit_hook_does_not_keep_an_unclosed_cache_alive(tmp_path: Path) -> None:
+    cache = QueryCache(tmp_path / "cache.json")
+    cache.set("q", Answer("answer"))
+    cache_ref = weakref.ref(cache)
+
+    del cache
+    gc.collect()
+
+    assert cache_ref() is None
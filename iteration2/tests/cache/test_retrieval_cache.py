@@ -0,0 +1,17 @@
+from src.cache.retrieval_cache import RetrievalCache
+from src.model.hit import Hit
+
+
+def test_returns_copies_and_evicts_least_recently_used() -> None:
+    cache = RetrievalCache(max_entries=2)
+    cache.put(("a",), [Hit("doc.txt", "c1", 5)])
+    cache.put(("b",), [Hit("doc.txt", "c2", 3)])
+
+    first = cache.get(("a",))
+    first[0].set_score(100)
+    assert cache.get(("a",))[0].get_score() == 5
+
+    cache.put(("c",), [])
+    assert cache.get(("b",)) is None
+    assert cache.get(("c",)) == []
+    assert cache.get_stats() == {"size": 2, "hits": 3, "misses": 1, "hit_rate": 0.75}
@@ -0,0 +1,108 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.data.chunk_loader import ChunkLoader
+from src.data.chunk_store import ChunkStore
+
+CHUNKS_PATH = Path(__file__).resolve().parents[2] / "data" / "chunks.json"
+
+
+def _snapshot(store: ChunkStore):
+    chunks = [
+        (c.get_doc_id(), c.get_chunk_id(), c.get_section_id(), c.get_text(), c.get_start_offset(), c.get_end_offset())
+        for c in store.iter_chunks()
+    ]
+    titles = {doc_id: store.get_document_title(doc_id) for doc_id in store.get_all_doc_ids()}
+    headers = {(c[0], c[2]): store.get_section_header(c[0], c[2]) for c in chunks}
+    return chunks, titles, headers
+
+
+def _write_jsonl(source: Path, target: Path) -> None:
+    with open(source, "r", encoding="utf-8") as f:
+        documents = json.load(f)["documents"]
+    with open(target, "w", encoding="utf-8") as f:
+        for doc in documents:
+            for section in doc["sections"]:
+                for chunk in section["chunks"]:
+                    record = dict(chunk, docId=doc["docId"], sectionId=section["sectionId"])
+                    record.update(title=doc.get("title"), header=section.get("header"))
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def test_jsonl_and_small_read_blocks_load_the_same_store(tmp_path: Path, monkeypatch) -> None:
+    expected = _snapshot(ChunkLoader().load_chunks(CHUNKS_PATH))
+
+    jsonl_path = tmp_path / "chunks.jsonl"
+    _write_jsonl(CHUNKS_PATH, jsonl_path)
+    assert _snapshot(ChunkLoader().load_chunks(jsonl_path)) == expected
+
+    monkeypatch.setattr(ChunkLoader, "BLOCK_SIZE", 7)
+    reports = []
+    loader = ChunkLoader(lambda p: reports.append((p.get_chunk_count(), p.is_done())), progress_interval=500)
+    assert _snapshot(loader.load_chunks(CHUNKS_PATH)) == expected
+    assert reports == [(500, False), (1000, False), (1500, False), (len(expected[0]), True)]
+    assert loader.get_last_progress().get_fraction() == 1.0
+
+
+def test_invalid_records_are_skipped_and_reported(tmp_path: Path) -> None:
+    nested_path = tmp_path / "chunks.json"
+    nested_path.write_text(json.dumps({"version": 2, "documents": [
+        {"docId": "1", "title": "burs", "sections": [{"sectionId": "1.1", "chunks": [
+            {"chunkId": "1.1.1", "content": "burs başvurusu", "startOffset": 0, "endOffset": 14},
+            {"chunkId": "1.1.2"},
+            {"chunkId": "1.1.3", "content": "ücret", "startOffset": "0"},
+        ]}, "bozuk"]},
+        {"title": "docId yok", "sections": []},
+        {"docId": "2", "sections": [{"sectionId": "2.1", "chunks": [{"chunkId": "2.1.1", "content": "yurt"}]}]},
+    ]}, ensure_ascii=False), encoding="utf-8")
+    jsonl_path = tmp_path / "chunks.jsonl"
+    jsonl_path.write_text("\n".join([
+        '{"docId": "1", "sectionId": "1.1", "chunkId": "1.1.1", "content": "burs başvurusu", "title": "burs"}',
+        '{"docId": "1", "sectionId": "1.1", "chunkId": "1.1.2"',
+        '',
+        '["not", "an", "object"]',
+        '{"sectionId": "1.1", "chunkId": "1.1.4", "content": "docId yok"}',
+        '{"docId": "2", "sectionId": "2.1", "chunkId": "2.1.1", "content": "yurt"}',
+    ]) + "\n", encoding="utf-8")
+
+    for path in (nested_path, jsonl_path):
+        loader = ChunkLoader()
+        store = loader.load_chunks(path)
+        progress = loader.get_last_progress()
+
+        assert [store.get_chunk_ref_at(i) for i in range(store.size())] == [("1", "1.1.1"), ("2", "2.1.1")]
+        assert store.get_document_title("1") == "burs"
+        assert progress.get_chunk_count() == 2
+        assert progress.get_skipped_count() == (3 if path == jsonl_path else 4)
+        assert len(progress.get_errors()) == progress.get_skipped_count()
+
+
+def test_broken_json_syntax_aborts_the_load(tmp_path: Path) -> None:
+    path = tmp_path / "chunks.json"
+    path.write_text('{"documents": [{"docId": "1", "sections": []}, {"docId": ', encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        ChunkLoader().load_chunks(path)
+
+
+def test_null_and_integral_float_offsets_are_accepted(tmp_path: Path) -> None:
+    chunks = [
+        {"chunkId": "1.1.1", "content": "burs", "startOffset": None, "endOffset": 4.0},
+        {"chunkId": "1.1.2", "content": "yurt", "startOffset": 5.0},
+        {"chunkId": "1.1.3", "content": "ücret", "startOffset": 10.5, "endOffset": 15},
+    ]
+    path = tmp_path / "chunks.json"
+    path.write_text(json.dumps({"documents": [
+        {"docId": "1", "sections": [{"sectionId": "1.1", "chunks": chunks}]}
+    ]}), encoding="utf-8")
+
+    loader = ChunkLoader()
+    store = loader.load_chunks(path)
+
+    assert [(c.get_chunk_id(), c.get_start_offset(), c.get_end_offset()) for c in store.iter_chunks()] == [
+        ("1.1.1", 0, 4), ("1.1.2", 5, 0)
+    ]
+    assert isinstance(store.get_chunk_at(0).get_end_offset(), int)
+    assert loader.get_last_progress().get_skipped_count() == 1
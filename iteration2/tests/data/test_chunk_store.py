@@ -0,0 +1,66 @@
+from src.data.chunk_store import ChunkStore
+from src.model.chunk import Chunk
+
+
+def test_chunks_are_addressed_by_insertion_ordinal() -> None:
+    store = ChunkStore()
+    store.add_chunk(Chunk("doc.txt", "c1", "Öğrenci işleri", "s1", 0, 14))
+    store.add_chunk(Chunk("doc.txt", "c2", None, "s2", 15, 15))
+    store.add_chunk(Chunk("other.txt", "c1", "Burs başvurusu", "s1", 0, 14))
+
+    assert store.size() == 3
+    assert store.get_ordinal("other.txt", "c1") == 2
+    assert store.get_ordinal("doc.txt", "c3") is None
+    assert store.get_chunk_ref_at(1) == ("doc.txt", "c2")
+    assert store.get_text_at(0) == "Öğrenci işleri"
+    assert store.get_text_at(1) is None
+
+    chunk = store.get_chunk_at(2)
+    assert (chunk.get_doc_id(), chunk.get_chunk_id(), chunk.get_section_id()) == ("other.txt", "c1", "s1")
+    assert chunk.get_text() == "Burs başvurusu"
+    assert [c.get_chunk_id() for c in store.get_all_chunks()] == ["c1", "c2", "c1"]
+
+
+def test_readding_a_chunk_replaces_it_in_place() -> None:
+    store = ChunkStore()
+    store.add_chunk(Chunk("doc.txt", "c1", "eski metin", "s1", 0, 10))
+    store.add_chunk(Chunk("doc.txt", "c2", "ikinci", "s1", 11, 17))
+    assert store.get_analysis_at(0).get_tokens() == ("eski", "metin")
+
+    store.add_chunk(Chunk("doc.txt", "c1", "yeni metin", "s2", 0, 10))
+
+    assert store.size() == 2
+    assert store.get_ordinal("doc.txt", "c1") == 0
+    assert store.get_chunk("doc.txt", "c1").get_section_id() == "s2"
+    assert store.get_analysis_at(0).get_tokens() == ("yeni", "metin")
+    assert store.get_text_at(1) == "ikinci"
+
+
+def test_get_chunk_uses_ordinal_only_when_it_still_matches() -> None:
+    store = ChunkStore()
+    store.add_chunk(Chunk("doc.txt", "c1", "birinci", "s", 0, 7))
+    store.add_chunk(Chunk("doc.txt", "c2", "ikinci", "s", 8, 14))
+
+    assert store.get_chunk("doc.txt", "c2", 1).get_text() == "ikinci"
+    assert store.get_chunk("doc.txt", "c2", 0).get_text() == "ikinci"
+    assert store.get_chunk("doc.txt", "c2", 99).get_text() == "ikinci"
+    assert store.get_chunk("doc.txt", "c3", 0) is None
+    assert store.get_chunk("doc.txt", "c1").get_analysis() is store.get_analysis_at(0)
+
+
+def test_fingerprint_depends_on_content_only() -> None:
+    def build() -> ChunkStore:
+        store = ChunkStore()
+        store.add_chunk(Chunk("doc.txt", "c1", "Öğrenci işleri", "s1", 0, 14))
+        store.add_chunk(Chunk("doc.txt", "c2", None, "s2", 15, 15))
+        store.set_document_title("doc.txt", "yönetmelik")
+        return store
+
+    first, second = build(), build()
+    assert first.get_fingerprint() == second.get_fingerprint()
+
+    second.set_section_header("doc.txt", "s1", "Genel")
+    assert first.get_fingerprint() != second.get_fingerprint()
+
+    first.add_chunk(Chunk("doc.txt", "c1", "Öğrenci işlerı", "s1", 0, 14))
+    assert first.get_fingerprint() != build().get_fingerprint()
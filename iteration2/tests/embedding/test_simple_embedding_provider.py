@@ -1,4 +1,5 @@
 from src.embedding.simple_embedding_provider import SimpleEmbeddingProvider
+from src.writer.simple_stemmer import SimpleStemmer
 
 
 def test_embedding_is_deterministic() -> None:
@@ -10,4 +11,16 @@ def test_embedding_is_deterministic() -> None:
 
     assert v1 == v2
     assert v1 != v3
-    assert len(v1) == 128
\ No newline at end of file
+    assert len(v1) == 128
+
+
+def test_embed_batch_matches_embed() -> None:
+    provider = SimpleEmbeddingProvider(SimpleStemmer(["leri", "ler", "si"]))
+    texts = ["bilgisayar mühendisliği bölümleri", "", "a", "Erasmus başvuruları, erasmus tarihleri", "bölümleri"]
+
+    batch = provider.embed_batch(texts)
+
+    assert batch.shape == (len(texts), 128)
+    for row, text in zip(batch, texts):
+        assert row.tolist() == provider.embed(text)
+    assert provider.embed_batch([]).shape == (0, 128)
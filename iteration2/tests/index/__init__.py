@@ -0,0 +1 @@
+# Index tests
@@ -0,0 +1,54 @@
+from src.data.chunk_store import ChunkStore
+from src.index.keyword_index import KeywordIndex
+from src.model.chunk import Chunk
+from src.writer.simple_stemmer import SimpleStemmer
+
+
+def test_postings_hold_term_frequency_per_chunk() -> None:
+    store = ChunkStore()
+    store.add_chunk(Chunk("doc.txt", "c1", "Bilgisayar bilgisayar mühendisliği", "s", 0, 30))
+    store.add_chunk(Chunk("doc.txt", "c2", "Elektronik mühendisliği", "s", 31, 50))
+
+    index = KeywordIndex(store)
+
+    assert index.get_postings("bilgisayar") == [("doc.txt||c1", 2)]
+    assert sorted(index.get_postings("mühendisliği")) == [("doc.txt||c1", 1), ("doc.txt||c2", 1)]
+    assert index.get_postings("fizik") == []
+    assert index.get_chunk_ref("doc.txt||c2") == ("doc.txt", "c2")
+
+
+def test_for_store_reuses_index_until_store_changes() -> None:
+    store = ChunkStore()
+    store.add_chunk(Chunk("doc.txt", "c1", "öğrenciler", "s", 0, 10))
+    stemmer = SimpleStemmer(suffixes=["ler"], min_word_length=3)
+
+    first = KeywordIndex.for_store(store, stemmer)
+    assert KeywordIndex.for_store(store, SimpleStemmer(suffixes=["ler"])) is first
+    assert first.normalize_term("Öğrenciler") == "öğrenci"
+    assert first.get_postings("öğrenci") == [("doc.txt||c1", 1)]
+
+    store.add_chunk(Chunk("doc.txt", "c2", "öğrenci", "s", 11, 20))
+    rebuilt = KeywordIndex.for_store(store, stemmer)
+
+    assert rebuilt is not first
+    assert sorted(rebuilt.get_postings("öğrenci")) == [("doc.txt||c1", 1), ("doc.txt||c2", 1)]
+
+
+def test_field_lengths_and_idf_are_precomputed() -> None:
+    store = ChunkStore()
+    store.set_document_title("doc.txt", "erasmus_yonergesi")
+    store.set_section_header("doc.txt", "s", "Başvuru koşulları")
+    store.add_chunk(Chunk("doc.txt", "c1", "başvuru tarihleri ve başvuru yeri", "s", 0, 30))
+    store.add_chunk(Chunk("doc.txt", "c2", "kontenjan", "s", 31, 40))
+    store.add_chunk(Chunk("other.txt", "c3", "kontenjan bilgisi", "t", 0, 20))
+
+    index = KeywordIndex(store)
+
+    assert index.get_field_length(KeywordIndex.FIELD_CONTENT, "doc.txt||c1") == 5
+    assert index.get_average_field_length(KeywordIndex.FIELD_CONTENT) == 8 / 3
+    assert index.get_field_postings(KeywordIndex.FIELD_TITLE, "erasmus") == [("doc.txt||c1", 1), ("doc.txt||c2", 1)]
+    assert index.get_field_postings(KeywordIndex.FIELD_HEADER, "koşulları") == [("doc.txt||c1", 1), ("doc.txt||c2", 1)]
+    # Rarer terms get a larger IDF; "başvuru" also appears in c2's header.
+    assert index.get_idf("başvuru") > index.get_idf("kontenjan") > 0
+    assert index.get_any_field_idf("başvuru") < index.get_idf("başvuru")
+    assert index.get_idf("fizik") == 0.0
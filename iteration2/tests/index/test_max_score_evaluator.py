@@ -0,0 +1,57 @@
+import random
+
+from src.data.chunk_store import ChunkStore
+from src.index.max_score_evaluator import MaxScoreEvaluator
+from src.model.chunk import Chunk
+from src.retrieval.keyword_retriever import KeywordRetriever
+
+
+def _random_store(seed: int) -> ChunkStore:
+    rng = random.Random(seed)
+    # Zipf-like vocabulary so some terms are everywhere and some are rare.
+    vocabulary = [f"w{i}" for i in range(60)]
+    weights = [1.0 / (i + 1) for i in range(len(vocabulary))]
+
+    store = ChunkStore()
+    for i in range(400):
+        words = rng.choices(vocabulary, weights, k=rng.randint(1, 30))
+        store.add_chunk(Chunk(f"doc{i % 7}", f"c{i}", " ".join(words), "s", 0, 0))
+    return store
+
+
+def _as_tuples(hits):
+    return [(h.get_doc_id(), h.get_chunk_id(), h.get_score()) for h in hits]
+
+
+def test_pruned_top_k_matches_exhaustive_evaluation(monkeypatch) -> None:
+    # Force pruning on these small corpora.
+    monkeypatch.setattr(KeywordRetriever, "MIN_PRUNING_POSTINGS", {"tf": 0, "bm25": 0})
+    rng = random.Random(7)
+    for seed in range(3):
+        store = _random_store(seed)
+        for scoring in ("tf", "bm25"):
+            for top_k in (1, 5, 10, 50):
+                pruned = KeywordRetriever(top_k, scoring=scoring)
+                exhaustive = KeywordRetriever(top_k, scoring=scoring, pruning=False)
+                for _ in range(20):
+                    # Duplicates and unknown terms are part of real queries too.
+                    query = [f"w{rng.randint(0, 70)}" for _ in range(rng.randint(1, 8))]
+                    assert _as_tuples(pruned.retrieve(query, store)) == _as_tuples(exhaustive.retrieve(query, store))
+
+
+def test_only_bm25_is_pruned_by_default(monkeypatch) -> None:
+    evaluated = []
+    original = MaxScoreEvaluator.evaluate
+
+    def evaluate(self, query_terms, term_postings):
+        evaluated.append(query_terms)
+        return original(self, query_terms, term_postings)
+
+    monkeypatch.setattr(MaxScoreEvaluator, "evaluate", evaluate)
+    monkeypatch.setattr(KeywordRetriever, "MIN_PRUNING_POSTINGS", {"bm25": 0})
+    store = _random_store(0)
+
+    KeywordRetriever(5, scoring="tf").retrieve(["w0", "w1"], store)
+    assert evaluated == []
+    KeywordRetriever(5, scoring="bm25").retrieve(["w0", "w1"], store)
+    assert evaluated == [["w0", "w1"]]
@@ -0,0 +1,44 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.data.chunk_loader import ChunkLoader
+from src.embedding.simple_embedding_provider import SimpleEmbeddingProvider
+from src.index.micro_batch_scheduler import MicroBatchScheduler
+from src.index.vector_index import VectorIndex
+
+
+def _build_index() -> VectorIndex:
+    store = ChunkLoader().load_chunks(Path(__file__).resolve().parents[2] / "data" / "chunks.json")
+    return VectorIndex(store, SimpleEmbeddingProvider(), backend="numpy")
+
+
+def test_concurrent_searches_are_batched_with_unchanged_results() -> None:
+    index = _build_index()
+    scheduler = MicroBatchScheduler(index, window_ms=200, max_queries=4)
+    queries = ["erasmus başvuru koşulları", "yaz okulu ücreti", "mezuniyet notu", "yurt başvurusu"] * 2
+    results = [None] * len(queries)
+
+    def search(i: int) -> None:
+        results[i] = scheduler.search_rows(queries[i], 10 if i % 2 == 0 else 5)
+
+    threads = [threading.Thread(target=search, args=(i,)) for i in range(len(queries))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    scheduler.close()
+
+    assert results == [index.search_rows(q, 10 if i % 2 == 0 else 5) for i, q in enumerate(queries)]
+    assert scheduler.get_query_count() == len(queries)
+    assert scheduler.get_batch_count() < len(queries)
+
+
+def test_closed_scheduler_rejects_searches() -> None:
+    scheduler = MicroBatchScheduler(_build_index(), window_ms=0)
+
+    assert scheduler.search_rows("erasmus", 3) == scheduler.get_vector_index().search_rows("erasmus", 3)
+    scheduler.close()
+    with pytest.raises(RuntimeError):
+        scheduler.search_rows("erasmus", 3)
@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from src.index import top_k_selector
+from src.index.top_k_selector import TopKSelector
+from src.model.hit import Hit
+
+
+def _random_hits(rng: random.Random, count: int):
+    # Few distinct scores, so most candidates tie with some other one.
+    return [Hit(f"doc{rng.randint(0, 5)}", f"c{i}", rng.randint(0, 4)) for i in range(count)]
+
+
+def _full_sort(hits):
+    return sorted(hits, key=lambda h: (-h.get_score(), h.get_doc_id(), h.get_chunk_id()))
+
+
+@pytest.mark.parametrize("k", [0, 1, 5, 50, 200, None])
+def test_select_hits_matches_a_full_sort(k) -> None:
+    hits = _random_hits(random.Random(3), 200)
+
+    selected = TopKSelector.select_hits(hits, k)
+
+    assert selected == _full_sort(hits)[:k]
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_select_indices_matches_a_full_sort(monkeypatch, with_numpy: bool) -> None:
+    if not with_numpy:
+        monkeypatch.setattr(top_k_selector, "np", None)
+    rng = random.Random(11)
+    scores = [float(rng.randint(0, 9)) for _ in range(300)]
+    names = [f"n{rng.randint(0, 50):02d}" for _ in range(300)]
+
+    for k in (1, 10, 299, 300, 400):
+        assert TopKSelector.select_indices(scores, k) == sorted(range(300), key=lambda i: (-scores[i], i))[:k]
+        assert TopKSelector.select_indices(scores, k, tie_key=names.__getitem__) == sorted(
+            range(300), key=lambda i: (-scores[i], names[i])
+        )[:k]
+    assert TopKSelector.select_indices(scores, 0) == []
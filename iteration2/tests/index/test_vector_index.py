@@ -0,0 +1,164 @@
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.data.chunk_loader import ChunkLoader
+from src.data.chunk_store import ChunkStore
+from src.embedding.simple_embedding_provider import SimpleEmbeddingProvider
+from src.index.vector_index import VectorIndex
+from src.model.chunk import Chunk
+
+
+def _build_store() -> ChunkStore:
+    store = ChunkStore()
+    texts = [
+        "bilgisayar mühendisliği bölümü",
+        "bilgisayar bilgisayar mühendisliği bölümü bölümü",  # proportional to the first
+        "elektronik mühendisliği laboratuvarı",
+        "erasmus başvuru koşulları ve tarihleri",
+        "erasmus koordinatörü bilgisayar bölümü",
+        "ders kayıt takvimi",
+        "",
+        "staj başvuru formu bilgisayar",
+    ]
+    for i, text in enumerate(texts):
+        store.add_chunk(Chunk("doc.txt", f"c{i}", text, "s", 0, len(text)))
+    return store
+
+
+def test_numpy_backend_matches_python_top_k_ordering() -> None:
+    store = _build_store()
+    provider = SimpleEmbeddingProvider()
+    python_index = VectorIndex(store, provider, backend="python")
+    numpy_index = VectorIndex(store, provider, backend="numpy")
+
+    for query in ["bilgisayar bölümü", "erasmus başvuru", "mühendisliği", "fizik", ""]:
+        for top_k in (1, 3, 8, 20):
+            expected = python_index.search(query, top_k)
+            actual = numpy_index.search(query, top_k)
+
+            assert [key for key, _ in actual] == [key for key, _ in expected]
+            for (_, a), (_, e) in zip(actual, expected):
+                assert abs(a - e) < 1e-6
+
+
+def test_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        VectorIndex(ChunkStore(), SimpleEmbeddingProvider(), backend="faiss")
+
+
+def _write_chunks_file(path: Path, texts: List[str]) -> None:
+    chunks = [{"chunkId": f"c{i}", "content": text} for i, text in enumerate(texts)]
+    document = {"docId": "doc", "title": "doc", "sections": [{"sectionId": "1", "chunks": chunks}]}
+    path.write_text(json.dumps({"documents": [document]}), encoding="utf-8")
+
+
+def test_persisted_index_is_reused_until_chunks_file_changes(tmp_path: Path) -> None:
+    chunk_path = tmp_path / "chunks.json"
+    _write_chunks_file(chunk_path, ["erasmus başvuru", "bilgisayar bölümü", "erasmus koordinatörü"])
+    store = ChunkLoader().load_chunks(chunk_path)
+    provider = SimpleEmbeddingProvider()
+
+    built = VectorIndex(store, provider, backend="numpy", chunk_path=chunk_path)
+    loaded = VectorIndex(store, provider, backend="numpy", chunk_path=chunk_path)
+
+    assert not built.is_loaded_from_disk()
+    assert loaded.is_loaded_from_disk()
+    assert loaded.search("erasmus", 3) == built.search("erasmus", 3)
+
+    _write_chunks_file(chunk_path, ["erasmus başvuru", "bilgisayar bölümü"])
+    rebuilt = VectorIndex(ChunkLoader().load_chunks(chunk_path), provider, backend="numpy", chunk_path=chunk_path)
+
+    assert not rebuilt.is_loaded_from_disk()
+    assert rebuilt.size() == 2
+
+
+def test_ivf_index_is_exact_when_probing_every_cell_and_close_otherwise() -> None:
+    store = ChunkLoader().load_chunks(Path(__file__).resolve().parents[2] / "data" / "chunks.json")
+    provider = SimpleEmbeddingProvider()
+    flat = VectorIndex(store, provider, backend="numpy")
+    ivf = VectorIndex(store, provider, backend="numpy", index_type="ivf", nlist=16, nprobe=16)
+
+    assert ivf.get_index_type() == "ivf"
+    queries = ["erasmus başvuru koşulları", "yaz okulu ücreti", "mezuniyet notu", "yurt başvurusu"]
+    for query in queries:
+        assert ivf.search(query, 10) == flat.search(query, 10)
+
+    ivf.set_nprobe(8)
+    found = sum(
+        len({key for key, _ in ivf.search(q, 10)} & {key for key, _ in flat.search(q, 10)}) for q in queries
+    )
+    assert found >= 0.8 * 10 * len(queries)
+
+
+def test_ivf_falls_back_to_exact_scan_on_python_backend() -> None:
+    store = _build_store()
+    index = VectorIndex(store, SimpleEmbeddingProvider(), backend="python", index_type="ivf")
+
+    assert index.get_index_type() == "flat"
+    with pytest.raises(ValueError):
+        VectorIndex(store, SimpleEmbeddingProvider(), index_type="hnsw")
+
+
+@pytest.mark.parametrize("persisted", [False, True])
+def test_int8_storage_with_rescoring_matches_flat_search(tmp_path: Path, persisted: bool) -> None:
+    source = Path(__file__).resolve().parents[2] / "data" / "chunks.json"
+    chunk_path = tmp_path / "chunks.json"
+    chunk_path.write_bytes(source.read_bytes())
+    store = ChunkLoader().load_chunks(chunk_path)
+    provider = SimpleEmbeddingProvider()
+    flat = VectorIndex(store, provider, backend="numpy")
+    quantized = VectorIndex(
+        store, provider, backend="numpy", chunk_path=chunk_path if persisted else None, storage="int8", rescore=50
+    )
+
+    assert quantized.get_storage() == "int8"
+    assert quantized.get_vector_bytes() < flat.get_vector_bytes() / 3
+
+    queries = ["erasmus başvuru koşulları", "yaz okulu ücreti", "mezuniyet notu", "yurt başvurusu"]
+    for query in queries:
+        expected = flat.search(query, 10)
+        actual = quantized.search(query, 10)
+        assert [key for key, _ in actual] == [key for key, _ in expected]
+        for (_, a), (_, e) in zip(actual, expected):
+            assert abs(a - e) < 1e-6
+
+    quantized.set_rescore(0)
+    found = sum(
+        len({key for key, _ in quantized.search(q, 10)} & {key for key, _ in flat.search(q, 10)}) for q in queries
+    )
+    assert found >= 0.8 * 10 * len(queries)
+
+
+def test_bucket_major_storage_matches_dense_search() -> None:
+    store = ChunkLoader().load_chunks(Path(__file__).resolve().parents[2] / "data" / "chunks.json")
+    provider = SimpleEmbeddingProvider()
+    dense = VectorIndex(store, provider, backend="numpy")
+    bucket_major = VectorIndex(store, provider, backend="numpy", storage="bucket_major")
+    dense_ivf = VectorIndex(store, provider, backend="numpy", index_type="ivf", nlist=16, nprobe=4)
+    bucket_major_ivf = VectorIndex(
+        store, provider, backend="numpy", index_type="ivf", nlist=16, nprobe=4, storage="bucket_major"
+    )
+
+    assert bucket_major.get_storage() == "bucket_major"
+    queries = ["erasmus başvuru koşulları", "yaz okulu ücreti", "mezuniyet notu", "yurt başvurusu", "fizik", ""]
+    for expected_index, actual_index in ((dense, bucket_major), (dense_ivf, bucket_major_ivf)):
+        for query in queries:
+            expected = expected_index.search(query, 10)
+            actual = actual_index.search(query, 10)
+            assert [key for key, _ in actual] == [key for key, _ in expected]
+            for (_, a), (_, e) in zip(actual, expected):
+                assert abs(a - e) < 1e-6
+
+
+@pytest.mark.parametrize("backend,storage", [("numpy", "float32"), ("numpy", "bucket_major"), ("numpy", "int8"), ("python", "float32")])
+def test_search_rows_batch_matches_search_rows(backend: str, storage: str) -> None:
+    store = ChunkLoader().load_chunks(Path(__file__).resolve().parents[2] / "data" / "chunks.json")
+    index = VectorIndex(store, SimpleEmbeddingProvider(), backend=backend, storage=storage, rescore=50)
+
+    queries = ["erasmus başvuru koşulları", "", "yaz okulu ücreti", "fizik", "mezuniyet notu", "yurt başvurusu"]
+    for top_k in (1, 10):
+        assert index.search_rows_batch(queries, top_k) == [index.search_rows(q, top_k) for q in queries]
+    assert index.search_rows_batch([], 10) == []
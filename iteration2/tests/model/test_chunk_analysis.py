@@ -0,0 +1,26 @@
+from src.model.chunk import Chunk
+from src.writer.simple_stemmer import SimpleStemmer
+
+
+def test_analysis_is_computed_once_per_chunk() -> None:
+    chunk = Chunk("doc", "c1", "Erasmus BAŞVURULARI başladı. Son tarih 15 Mart! Sorular?", "s", 0, 10)
+    analysis = chunk.get_analysis()
+
+    assert chunk.get_analysis() is analysis
+    assert analysis.get_lower_text() == chunk.get_text().lower()
+    assert analysis.get_tokens() == ("erasmus", "başvurulari", "başladı", "son", "tarih", "15", "mart", "sorular")
+    assert [analysis.get_lower_text()[p:p + 3] for p in analysis.get_token_positions()][:2] == ["era", "baş"]
+    assert analysis.get_sentences() == ("Erasmus BAŞVURULARI başladı", "Son tarih 15 Mart", "Sorular")
+    assert analysis.get_lower_sentences()[0] == "erasmus başvurulari başladı"
+    assert analysis.get_match_text() == "erasmus ba vurular ba lad son tarih 15 mart sorular"
+    assert analysis.get_tokens() is analysis.get_tokens()
+
+
+def test_stems_follow_the_stemmer_asked_for() -> None:
+    analysis = Chunk("doc", "c1", "Kitaplar evlerde", "s", 0, 0).get_analysis()
+    stemmer = SimpleStemmer(["lar", "de", "ler"])
+
+    assert analysis.get_stems(None) == ("kitaplar", "evlerde")
+    assert analysis.get_stems(stemmer) == ("kitap", "evler")
+    assert analysis.get_stems(stemmer) is analysis.get_stems(stemmer)
+    assert analysis.get_stems(SimpleStemmer(["ler", "lerde"])) == ("kitaplar", "ev")
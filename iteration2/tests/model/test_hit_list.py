@@ -0,0 +1,40 @@
+import pytest
+
+from src.data.chunk_store import ChunkStore
+from src.model.chunk import Chunk
+from src.model.hit_list import HitList
+
+
+def _store() -> ChunkStore:
+    store = ChunkStore()
+    # Ordinal order differs from (docId, chunkId) order on purpose.
+    for doc_id, chunk_id in [("b.txt", "c1"), ("a.txt", "c2"), ("a.txt", "c1"), ("c.txt", "c1")]:
+        store.add_chunk(Chunk(doc_id, chunk_id, "metin", "s", 0, 5))
+    return store
+
+
+@pytest.mark.parametrize("k", [1, 2, 3, 4, 10])
+def test_top_k_matches_a_full_sort_with_id_tie_break(k: int) -> None:
+    store = _store()
+    hits = HitList(store, [0, 1, 2, 3], [5, 7, 5, 5], integer_scores=True)
+
+    top = hits.top_k(k)
+
+    expected = sorted(hits, key=lambda h: (-h.get_score(), h.get_doc_id(), h.get_chunk_id()))[:k]
+    assert [str(h) for h in top] == [str(h) for h in expected]
+    assert [h.get_ordinal() for h in top] == [1, 2, 0, 3][:k]
+    assert all(isinstance(h.get_score(), int) for h in top)
+
+
+def test_hit_list_is_a_view_of_hits() -> None:
+    hits = HitList(_store(), [3], [0.25])
+    hits.append(0, 1.5)
+    hits.sort()
+
+    assert len(hits) == 2
+    assert hits[0].get_doc_id() == "b.txt"
+    assert hits[-1].get_score() == 0.25
+    assert [h.get_chunk_id() for h in hits.to_hits(limit=1)] == ["c1"]
+    assert list(hits.get_ordinals()) == [0, 3]
+    with pytest.raises(IndexError):
+        hits[2]
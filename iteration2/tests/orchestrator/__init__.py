@@ -0,0 +1 @@
+# Orchestrator tests
@@ -0,0 +1,87 @@
+import re
+import threading
+from pathlib import Path
+
+from src.config.config_loader import ConfigLoader
+from src.context.context import Context
+from src.data.chunk_loader import ChunkLoader
+from src.model.hit import Hit
+from src.model.query import Query
+from src.orchestrator.async_rag_pipeline import AsyncRagPipeline
+from src.orchestrator.pipeline_session import PipelineSession
+from src.orchestrator.sequential_rag_pipeline import SequentialRagPipeline
+from src.retrieval.hybrid_retriever import HybridRetriever
+from src.retrieval.retriever import Retriever
+from src.trace.trace_bus import TraceBus
+
+from tests.orchestrator.test_pipeline_session import ListTraceSink, _write_config
+
+QUESTIONS = ["Erasmus koordinatörü kimdir?", "Ders kayıtları ne zaman?"]
+
+
+def _event_fields(events):
+    # Hit lists print with object addresses; only their length and order matter here.
+    return [
+        (e.get_stage(), re.sub(r" at 0x[0-9a-f]+", "", e.get_inputs()), re.sub(r" at 0x[0-9a-f]+", "", e.get_outputs_summary()))
+        for e in events
+    ]
+
+
+def _run(pipeline_class, config, session, question):
+    sink = ListTraceSink()
+    trace_bus = TraceBus()
+    trace_bus.register(sink)
+    context = Context()
+    context.set_chunk_store(session.get_chunk_store())
+    context.set_question(Query(question))
+    pipeline_class(config, context, trace_bus, session).execute()
+    return context, sink.events
+
+
+def test_async_pipeline_matches_sequential_pipeline(tmp_path: Path) -> None:
+    config = ConfigLoader(_write_config(tmp_path)).load_config()
+    session = PipelineSession(config, ChunkLoader().load_chunks(config.get_chunk_path()))
+
+    try:
+        for question in QUESTIONS:
+            sequential, sequential_events = _run(SequentialRagPipeline, config, session, question)
+            concurrent, concurrent_events = _run(AsyncRagPipeline, config, session, question)
+
+            assert concurrent.get_terms() == sequential.get_terms()
+            assert [str(h) for h in concurrent.get_retrieved_hits()] == [str(h) for h in sequential.get_retrieved_hits()]
+            assert [str(h) for h in concurrent.get_reranked_hits()] == [str(h) for h in sequential.get_reranked_hits()]
+            assert str(concurrent.get_final_answer()) == str(sequential.get_final_answer())
+            assert _event_fields(concurrent_events) == _event_fields(sequential_events)
+    finally:
+        session.close()
+
+
+class BarrierRetriever(Retriever):
+    """Returns its hits only once the other retriever is running too."""
+
+    def __init__(self, barrier: threading.Barrier, hits):
+        self.__barrier = barrier
+        self.__hits = hits
+
+    def retrieve(self, query_terms, store):
+        self.__barrier.wait()
+        return self.__hits
+
+
+def test_hybrid_retrievers_run_concurrently(tmp_path: Path) -> None:
+    config = ConfigLoader(_write_config(tmp_path)).load_config()
+    session = PipelineSession(config, ChunkLoader().load_chunks(config.get_chunk_path()))
+    barrier = threading.Barrier(2, timeout=5)
+    hybrid = HybridRetriever(
+        BarrierRetriever(barrier, [Hit("1", "1.1.1", 4), Hit("1", "1.1.2", 2)]),
+        BarrierRetriever(barrier, [Hit("1", "1.1.2", 900)]),
+        1.0, 1.0, 10
+    )
+    session.get_retriever = lambda: hybrid
+
+    try:
+        context, _ = _run(AsyncRagPipeline, config, session, QUESTIONS[0])
+    finally:
+        session.close()
+
+    assert [(h.get_chunk_id(), h.get_score()) for h in context.get_retrieved_hits()] == [("1.1.2", 1500), ("1.1.1", 1000)]
@@ -0,0 +1,199 @@
+import json
+import threading
+from pathlib import Path
+
+from src.cache.retrieval_cache import RetrievalCache
+from src.config.config_loader import ConfigLoader
+from src.context.context import Context
+from src.data.chunk_loader import ChunkLoader
+from src.model.query import Query
+from src.orchestrator.pipeline_session import PipelineSession
+from src.orchestrator.rag_orchestrator import RagOrchestrator
+from src.orchestrator.sequential_rag_pipeline import SequentialRagPipeline
+from src.trace.trace_bus import TraceBus
+from src.trace.trace_event import TraceEvent
+from src.trace.trace_sink import TraceSink
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+
+def _write_config(tmp_path: Path) -> Path:
+    chunks = [
+        {"chunkId": "1.1.1", "content": "Erasmus koordinatörü Ayşe Yılmaz'dır."},
+        {"chunkId": "1.1.2", "content": "Ders kayıtları güz döneminde yapılır."},
+    ]
+    document = {"docId": "1", "title": "erasmus", "sections": [{"sectionId": "1.1", "chunks": chunks}]}
+    (tmp_path / "chunks.json").write_text(json.dumps({"documents": [document]}), encoding="utf-8")
+
+    config_text = (DATA_DIR / "config.yaml").read_text(encoding="utf-8")
+    for name in ("intent_rules", "stopwords", "suffixes", "conjunctions"):
+        config_text = config_text.replace(f"./{name}.yaml", (DATA_DIR / f"{name}.yaml").as_posix())
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(config_text, encoding="utf-8")
+    return config_path
+
+
+def test_components_are_built_once_and_shared_across_queries(tmp_path: Path) -> None:
+    config = ConfigLoader(_write_config(tmp_path)).load_config()
+    session = PipelineSession(config, ChunkLoader().load_chunks(config.get_chunk_path()))
+    trace_bus = TraceBus()
+
+    answers = []
+    for question in ["Erasmus koordinatörü kimdir?", "Ders kayıtları ne zaman?"]:
+        context = Context()
+        context.set_chunk_store(session.get_chunk_store())
+        context.set_question(Query(question))
+        SequentialRagPipeline(config, context, trace_bus, session).execute()
+        answers.append(context.get_final_answer())
+
+    assert "Ayşe" in answers[0].get_text()
+    assert "güz" in answers[1].get_text()
+
+    assert session.get_retriever() is session.get_retriever()
+    assert session.get_query_writer() is session.get_query_writer()
+    assert session.get_vector_index() is session.get_vector_index()
+    assert session.get_stemmer() is session.get_stemmer()
+
+
+class ListTraceSink(TraceSink):
+
+    def __init__(self):
+        self.events = []
+
+    def record(self, event: TraceEvent) -> None:
+        self.events.append(event)
+
+
+def test_shared_retrieval_cache_is_reused_across_sessions(tmp_path: Path) -> None:
+    config = ConfigLoader(_write_config(tmp_path)).load_config()
+    chunk_store = ChunkLoader().load_chunks(config.get_chunk_path())
+    retrieval_cache = RetrievalCache(max_entries=8)
+    sink = ListTraceSink()
+    trace_bus = TraceBus()
+    trace_bus.register(sink)
+
+    hits = []
+    for _ in range(2):
+        session = PipelineSession(config, chunk_store, retrieval_cache)
+        context = Context()
+        context.set_chunk_store(chunk_store)
+        context.set_question(Query("Erasmus koordinatörü kimdir?"))
+        SequentialRagPipeline(config, context, trace_bus, session).execute()
+        hits.append([str(h) for h in context.get_retrieved_hits()])
+
+    retrieve_events = [e for e in sink.events if e.get_stage() == "retrieve"]
+    assert hits[0] == hits[1]
+    assert "retrievalCache=miss hitRate=0.000" in retrieve_events[0].get_outputs_summary()
+    assert "retrievalCache=hit hitRate=0.500" in retrieve_events[1].get_outputs_summary()
+
+
+def test_shared_retrieval_cache_hits_for_stores_loaded_separately(tmp_path: Path) -> None:
+    config = ConfigLoader(_write_config(tmp_path)).load_config()
+    retrieval_cache = RetrievalCache(max_entries=8)
+    trace_bus = TraceBus()
+
+    hits = []
+    for _ in range(2):
+        # Every session loads its own store, as every EvalHarness does.
+        chunk_store = ChunkLoader().load_chunks(config.get_chunk_path())
+        context = Context()
+        context.set_chunk_store(chunk_store)
+        context.set_question(Query("Erasmus koordinatörü kimdir?"))
+        SequentialRagPipeline(config, context, trace_bus, PipelineSession(config, chunk_store, retrieval_cache)).execute()
+        hits.append([str(h) for h in context.get_retrieved_hits()])
+
+    assert hits[0] == hits[1]
+    assert retrieval_cache.get_stats()["hits"] == 1
+
+    changed_store = ChunkLoader().load_chunks(config.get_chunk_path())
+    changed_store.set_document_title("1", "değişim")
+    terms = ["erasmus"]
+    assert (
+        PipelineSession(config, changed_store, retrieval_cache).get_retrieval_cache_key(terms)
+        != PipelineSession(config, chunk_store, retrieval_cache).get_retrieval_cache_key(terms)
+    )
+
+
+def test_summary_trace_level_omits_hit_lists(tmp_path: Path) -> None:
+    from src.trace.trace_level import TraceLevel
+
+    class SummarySink(ListTraceSink):
+        def get_level(self) -> TraceLevel:
+            return TraceLevel.SUMMARY
+
+    config = ConfigLoader(_write_config(tmp_path)).load_config()
+    chunk_store = ChunkLoader().load_chunks(config.get_chunk_path())
+    summary_sink, full_sink = SummarySink(), ListTraceSink()
+    trace_bus = TraceBus()
+    trace_bus.register(summary_sink)
+    trace_bus.register(full_sink)
+
+    context = Context()
+    context.set_chunk_store(chunk_store)
+    context.set_question(Query("Erasmus koordinatörü kimdir?"))
+    SequentialRagPipeline(config, context, trace_bus, PipelineSession(config, chunk_store)).execute()
+
+    summary = {e.get_stage(): e for e in summary_sink.events}
+    full = {e.get_stage(): e for e in full_sink.events}
+    assert summary["writeQuery"].get_inputs() == f"stopwords={len(PipelineSession.load_stopwords(config.get_stopwords_file_path()))}"
+    assert "retrievedHits" not in summary["retrieve"].get_outputs_summary()
+    assert "retrievedHits" in full["retrieve"].get_outputs_summary()
+    assert full["answer"].get_outputs_summary() == f"Answer: {context.get_final_answer()}"
+    assert summary["answer"].get_outputs_summary().startswith("Answer length: ")
+
+
+def test_orchestrator_closes_the_session_it_created(tmp_path: Path) -> None:
+    config = ConfigLoader(_write_config(tmp_path)).load_config()
+    writers_before = {t for t in threading.enumerate() if t.name == "trace-writer"}
+
+    context = Context()
+    context.set_chunk_store(ChunkLoader().load_chunks(config.get_chunk_path()))
+    context.set_question(Query("Erasmus koordinatörü kimdir?"))
+    RagOrchestrator(context).run(config)
+
+    assert config.get_trace_mode() == "buffered"
+    assert {t for t in threading.enumerate() if t.name == "trace-writer"} == writers_before
+    log_files = list(config.get_logs_dir_path().glob("run-*.jsonl"))
+    assert len(log_files) == 1 and log_files[0].read_text(encoding="utf-8").count("\n") == 5
+
+
+def test_eval_harness_closes_its_session(tmp_path: Path, monkeypatch) -> None:
+    from src.eval.eval_harness import EvalHarness
+
+    ground_truth_path = tmp_path / "ground_truth.json"
+    ground_truth_path.write_text(json.dumps([
+        {"question": "Erasmus koordinatörü kimdir?", "expected_keywords": ["Ayşe"]}
+    ]), encoding="utf-8")
+    harness = EvalHarness(str(_write_config(tmp_path)), str(ground_truth_path))
+
+    closed = []
+    close = PipelineSession.close
+    monkeypatch.setattr(PipelineSession, "close", lambda session: closed.append(session) or close(session))
+    harness.run()
+
+    assert closed == [harness.session]
+
+
+def test_precomputed_stems_cover_the_analysis_tokens(tmp_path: Path, monkeypatch) -> None:
+    from src.data.chunk_store import ChunkStore
+    from src.model.chunk import Chunk
+    from src.writer.simple_stemmer import SimpleStemmer
+
+    config_path = _write_config(tmp_path)
+    config_path.write_text(
+        config_path.read_text(encoding="utf-8").replace('precompute_stems: "false"', 'precompute_stems: "true"'),
+        encoding="utf-8"
+    )
+    config = ConfigLoader(config_path).load_config()
+    store = ChunkStore()
+    store.set_document_title("1", "erasmus_yonergesi")
+    store.set_section_header("1", "1.1", "Başvuru Koşulları")
+    store.add_chunk(Chunk("1", "1.1.1", "Öğrenciler başvurur.", "1.1", 0, 20))
+    store.add_chunk(Chunk("1", "1.1.2", None, "1.1", 21, 21))
+
+    precomputed = []
+    monkeypatch.setattr(SimpleStemmer, "precompute", lambda self, words: precomputed.extend(words) or 0)
+    PipelineSession(config, store).get_stemmer()
+
+    assert config.is_precompute_stems()
+    assert sorted(precomputed) == sorted(["öğrenciler", "başvurur", "erasmus", "yonergesi", "başvuru", "koşulları"])
@@ -57,3 +57,61 @@ def test_handles_empty_or_null_queries_gracefully() -> None:
 
     assert retriever.retrieve([], store) == []
     assert retriever.retrieve(None, store) == []
+
+
+def test_repeated_query_terms_and_chunks_added_after_first_query_are_scored() -> None:
+    store: ChunkStore = ChunkStore()
+    store.add_chunk(Chunk("doc.txt", "c1", "erasmus erasmus başvuru", "s", 0, 25))
+    store.add_chunk(Chunk("doc.txt", "c2", "erasmus başvuru başvuru başvuru", "s", 26, 60))
+
+    retriever: KeywordRetriever = KeywordRetriever(top_k=5)
+    hits: List[Hit] = retriever.retrieve(["erasmus", "erasmus", "başvuru"], store)
+
+    assert [(h.get_chunk_id(), h.get_score()) for h in hits] == [("c1", 5), ("c2", 5)]
+
+    store.add_chunk(Chunk("doc.txt", "c3", "erasmus erasmus erasmus", "s", 61, 85))
+    hits = retriever.retrieve(["erasmus"], store)
+
+    assert [(h.get_chunk_id(), h.get_score()) for h in hits] == [("c3", 3), ("c1", 2), ("c2", 1)]
+
+
+def test_bm25_prefers_rare_terms_over_repeated_common_ones() -> None:
+    store: ChunkStore = ChunkStore()
+    common = "öğrenci " * 6
+    store.add_chunk(Chunk("a.txt", "long", common + "ders kayıt takvimi ve diğer duyurular", "s", 0, 80))
+    store.add_chunk(Chunk("b.txt", "short", "öğrenci erasmus koordinatörü", "s", 0, 30))
+    for i in range(4):
+        store.add_chunk(Chunk("c.txt", f"filler{i}", "öğrenci işleri", "s", 0, 15))
+
+    query = ["öğrenci", "erasmus"]
+
+    assert KeywordRetriever(top_k=1).retrieve(query, store)[0].get_chunk_id() == "long"
+    assert KeywordRetriever(top_k=1, scoring="bm25").retrieve(query, store)[0].get_chunk_id() == "short"
+
+
+def test_bm25f_uses_title_and_section_header() -> None:
+    store: ChunkStore = ChunkStore()
+    store.set_document_title("yurt.txt", "yurtlar_yonergesi")
+    store.set_section_header("yurt.txt", "1", "Yurt başvuruları")
+    store.add_chunk(Chunk("yurt.txt", "c1", "Başvurular dönem başında alınır.", "1", 0, 30))
+    store.add_chunk(Chunk("staj.txt", "c1", "Staj başvuruları dönem sonunda alınır.", "1", 0, 40))
+
+    query = ["yurt", "başvuruları"]
+
+    assert KeywordRetriever(top_k=1, scoring="bm25").retrieve(query, store)[0].get_doc_id() == "staj.txt"
+    assert KeywordRetriever(top_k=1, scoring="bm25f").retrieve(query, store)[0].get_doc_id() == "yurt.txt"
+
+
+def test_bm25f_title_scoring_follows_title_changes() -> None:
+    store: ChunkStore = ChunkStore()
+    store.set_document_title("a.txt", "staj_yonergesi")
+    store.set_document_title("b.txt", "burs_yonergesi")
+    store.add_chunk(Chunk("a.txt", "c1", "Başvurular dönem başında alınır.", "1", 0, 30))
+    store.add_chunk(Chunk("b.txt", "c1", "Başvurular dönem başında alınır.", "1", 0, 30))
+
+    retriever = KeywordRetriever(top_k=1, scoring="bm25f")
+    assert retriever.retrieve(["burs", "başvurular"], store)[0].get_doc_id() == "b.txt"
+
+    store.set_document_title("a.txt", "burs_basvurusu")
+    store.set_document_title("b.txt", "staj_basvurusu")
+    assert retriever.retrieve(["burs", "başvurular"], store)[0].get_doc_id() == "a.txt"
@@ -0,0 +1,93 @@
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from src.model.answer import Answer
+from src.server.rag_client import RagClient
+from src.server.rag_server import RagServer
+
+
+def _start(server: RagServer) -> threading.Thread:
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+def _stop(server: RagServer, thread: threading.Thread) -> None:
+    server.shutdown()
+    thread.join(timeout=5)
+    server.close()
+
+
+def test_answers_concurrent_queries_from_the_worker_pool() -> None:
+    # Every request waits for the other two, so they must run at the same time.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def answer_question(question: str):
+        barrier.wait()
+        return Answer(f"cevap: {question}", ["1:1.1:0-10"]), question == "b"
+
+    server = RagServer(answer_question, "127.0.0.1:0", workers=3, chunk_count=7)
+    thread = _start(server)
+    try:
+        client = RagClient(server.get_address(), timeout=10)
+        assert client.health() == {"status": "ok", "workers": 3, "chunks": 7}
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(client.query, ["a", "b", "c"]))
+    finally:
+        _stop(server, thread)
+
+    assert [r["answer"] for r in results] == ["cevap: a", "cevap: b", "cevap: c"]
+    assert [r["cached"] for r in results] == [False, True, False]
+    assert results[0]["citations"] == ["1:1.1:0-10"]
+    assert results[0]["line"] == "cevap: a See: 1:1.1:0-10"
+
+
+def test_unix_socket_and_bad_requests(tmp_path: Path) -> None:
+    def answer_question(question: str):
+        if question == "hata":
+            raise ValueError("boom")
+        return None, False
+
+    socket_path = tmp_path / "rag.sock"
+    server = RagServer(answer_question, f"unix:{socket_path}", workers=1)
+    thread = _start(server)
+    try:
+        client = RagClient(f"unix:{socket_path}")
+        assert client.query("soru") == {"question": "soru", "answer": None, "citations": [], "line": None, "cached": False}
+        with pytest.raises(RuntimeError, match="500"):
+            client.query("hata")
+        with pytest.raises(RuntimeError, match="400"):
+            client.query("   ")
+    finally:
+        _stop(server, thread)
+
+    assert not socket_path.exists()
+
+
+def test_refuses_to_replace_a_file_that_is_not_a_socket(tmp_path: Path) -> None:
+    path = tmp_path / "rag.sock"
+    path.write_text("önemli veri", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="not a socket"):
+        RagServer(lambda question: (None, False), f"unix:{path}")
+    assert path.read_text(encoding="utf-8") == "önemli veri"
+
+
+def test_stalled_client_releases_its_worker(tmp_path: Path) -> None:
+    socket_path = tmp_path / "rag.sock"
+    server = RagServer(lambda question: (None, False), f"unix:{socket_path}", workers=1, request_timeout=0.2)
+    thread = _start(server)
+    try:
+        stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stalled.connect(str(socket_path))
+        stalled.sendall(b"POST /query HTTP/1.1\r\nContent-Length: 100\r\n\r\n{")
+        # The only worker is busy with the stalled request until it times out.
+        assert RagClient(f"unix:{socket_path}", timeout=5).query("soru")["answer"] is None
+        stalled.close()
+    finally:
+        _stop(server, thread)
@@ -0,0 +1,116 @@
+import json
+import time
+from pathlib import Path
+
+from src.cache.query_cache import QueryCache
+from src.config.config_loader import ConfigLoader
+from src.data.chunk_loader import ChunkLoader
+from src.main import _open_query_cache, _process_batch_queries
+from src.model.answer import Answer
+from src.orchestrator.pipeline_session import PipelineSession
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+def _load_session(tmp_path: Path) -> PipelineSession:
+    chunks = [
+        {"chunkId": "1.1.1", "content": "Erasmus koordinatörü Ayşe Yılmaz'dır."},
+        {"chunkId": "1.1.2", "content": "Ders kayıtları güz döneminde yapılır."},
+        {"chunkId": "1.1.3", "content": "Staj başvuruları bölüm sekreterliğine yapılır."},
+    ]
+    document = {"docId": "1", "title": "bolum", "sections": [{"sectionId": "1.1", "chunks": chunks}]}
+    (tmp_path / "chunks.json").write_text(json.dumps({"documents": [document]}), encoding="utf-8")
+
+    config_text = (DATA_DIR / "config.yaml").read_text(encoding="utf-8")
+    for name in ("intent_rules", "stopwords", "suffixes", "conjunctions"):
+        config_text = config_text.replace(f"./{name}.yaml", (DATA_DIR / f"{name}.yaml").as_posix())
+    (tmp_path / "config.yaml").write_text(config_text, encoding="utf-8")
+
+    config = ConfigLoader(tmp_path / "config.yaml").load_config()
+    return PipelineSession(config, ChunkLoader().load_chunks(config.get_chunk_path()))
+
+
+def test_thread_pool_batch_output_matches_sequential(tmp_path: Path, capsys) -> None:
+    session = _load_session(tmp_path)
+    config = session.get_config()
+    queries = [
+        "Erasmus koordinatörü kimdir?",
+        "Ders kayıtları ne zaman?",
+        "Staj başvurusu nereye yapılır?",
+        "Erasmus koordinatörü kimdir?",
+    ]
+
+    sequential_cache = QueryCache(tmp_path / "seq.json")
+    _process_batch_queries(config, queries, Path("batch.json"), session, sequential_cache)
+    sequential_cache.close()
+    sequential = capsys.readouterr().out
+
+    parallel_cache = QueryCache(tmp_path / "par.json")
+    _process_batch_queries(
+        config, queries, Path("batch.json"), session, parallel_cache,
+        workers=3, worker_mode="thread"
+    )
+    parallel_cache.close()
+    parallel = capsys.readouterr().out
+
+    assert parallel == sequential
+    assert sequential.count("Answer (Retrieved from Cache)") == 1
+    assert list(json.loads((tmp_path / "par.json").read_text(encoding="utf-8"))) == \
+        list(json.loads((tmp_path / "seq.json").read_text(encoding="utf-8")))
+
+
+def test_normalized_cache_mode_answers_paraphrases_from_cache(tmp_path: Path, capsys) -> None:
+    session = _load_session(tmp_path)
+    queries = [
+        "Erasmus koordinatörü kimdir?",
+        "erasmus koordinatörü kimdir",
+        "ERASMUS KOORDİNATÖRÜ KİMDİR",
+    ]
+
+    cache = QueryCache(tmp_path / "cache.json", key_mode="normalized")
+    _process_batch_queries(session.get_config(), queries, Path("batch.json"), session, cache)
+    output = capsys.readouterr().out
+
+    assert output.count("Answer (Retrieved from Cache)") == 2
+    assert cache.contains("ERASMUS KOORDİNATÖRÜ KİMDİR")
+
+
+def test_query_cache_ttl_and_flush_cadence_come_from_the_config(tmp_path: Path) -> None:
+    _load_session(tmp_path)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        config_path.read_text(encoding="utf-8")
+        .replace('ttl_seconds: "0"', 'ttl_seconds: "0.05"')
+        .replace('flush_every: "50"', 'flush_every: "2"'),
+        encoding="utf-8"
+    )
+    cache_path = tmp_path / "cache.json"
+    cache = _open_query_cache(ConfigLoader(config_path).load_config(), cache_path)
+
+    cache.set("first", Answer("1"))
+    assert not cache_path.exists()
+    cache.set("second", Answer("2"))
+    assert cache_path.exists()
+
+    time.sleep(0.1)
+    assert cache.get("first") is None
+    cache.close()
+
+
+def test_normalized_cache_miss_detects_and_writes_the_query_once(tmp_path: Path, capsys, monkeypatch) -> None:
+    session = _load_session(tmp_path)
+    calls = []
+    detector, writer = session.get_intent_detector(), session.get_query_writer()
+    detect, write = detector.detect, writer.write
+    monkeypatch.setattr(detector, "detect", lambda question: calls.append("detect") or detect(question))
+    monkeypatch.setattr(writer, "write", lambda question, intent: calls.append("write") or write(question, intent))
+
+    cache = QueryCache(tmp_path / "cache.json", key_mode="normalized")
+    _process_batch_queries(session.get_config(), ["Erasmus koordinatörü kimdir?"], Path("batch.json"), session, cache)
+    assert calls == ["detect", "write"]
+    assert "Ayşe" in capsys.readouterr().out
+
+    # "I" folds to "ı" in the cache key, so the pipeline derives its own query.
+    calls.clear()
+    _process_batch_queries(session.get_config(), ["STAJ BAŞVURULARI NEREYE YAPILIR?"], Path("batch.json"), session, cache)
+    assert calls == ["detect", "write", "detect", "write"]
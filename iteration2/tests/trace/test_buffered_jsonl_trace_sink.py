@@ -0,0 +1,111 @@
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.trace.buffered_jsonl_trace_sink import BufferedJsonlTraceSink
+from src.trace.trace_event import TraceEvent
+
+
+def _read_stages(log_file: Path):
+    return [json.loads(line)["stage"] for line in log_file.read_text(encoding="utf-8").splitlines()]
+
+
+def test_close_writes_all_events_in_order(tmp_path: Path) -> None:
+    sink = BufferedJsonlTraceSink(tmp_path, flush_events=1000, flush_interval_ms=60000)
+
+    for i in range(250):
+        sink.record(TraceEvent(f"stage{i}", "in", "out", i))
+    sink.close()
+
+    assert _read_stages(sink.get_log_file()) == [f"stage{i}" for i in range(250)]
+    assert sink.get_dropped_count() == 0
+
+
+def test_events_are_flushed_by_interval_before_close(tmp_path: Path) -> None:
+    sink = BufferedJsonlTraceSink(tmp_path, flush_events=1000, flush_interval_ms=20)
+    sink.record(TraceEvent("retrieve", "in", "out", 1))
+
+    deadline = time.time() + 5
+    while time.time() < deadline and not sink.get_log_file().read_bytes():
+        time.sleep(0.01)
+
+    assert _read_stages(sink.get_log_file()) == ["retrieve"]
+    sink.close()
+
+
+def test_drop_policy_counts_events_that_do_not_fit(tmp_path: Path) -> None:
+    sink = BufferedJsonlTraceSink(tmp_path, queue_size=1, overflow_policy="drop")
+
+    # Stall the writer inside to_json so the queue stays full.
+    release = threading.Event()
+
+    class SlowEvent(TraceEvent):
+        def to_json(self) -> str:
+            release.wait(5)
+            return super().to_json()
+
+    sink.record(SlowEvent("first", "", "", 0))
+    time.sleep(0.05)
+    for _ in range(10):
+        sink.record(TraceEvent("extra", "", "", 0))
+    release.set()
+    sink.close()
+
+    written = _read_stages(sink.get_log_file())
+    assert written[0] == "first"
+    assert len(written) + sink.get_dropped_count() == 11
+    assert sink.get_dropped_count() >= 9
+
+
+def test_record_after_close_raises(tmp_path: Path) -> None:
+    sink = BufferedJsonlTraceSink(tmp_path)
+    sink.close()
+    sink.close()
+
+    with pytest.raises(RuntimeError):
+        sink.record(TraceEvent("answer", "", "", 0))
+
+
+def test_short_writes_are_completed(tmp_path: Path) -> None:
+    sink = BufferedJsonlTraceSink(tmp_path, flush_events=1000, flush_interval_ms=60000)
+
+    class ShortWriter:
+        def __init__(self, file):
+            self.file = file
+
+        def write(self, data) -> int:
+            return self.file.write(data[:7])
+
+        def close(self) -> None:
+            self.file.close()
+
+    sink._BufferedJsonlTraceSink__file = ShortWriter(sink._BufferedJsonlTraceSink__file)
+    for i in range(20):
+        sink.record(TraceEvent(f"stage{i}", "in", "out", i))
+    sink.close()
+
+    assert _read_stages(sink.get_log_file()) == [f"stage{i}" for i in range(20)]
+    assert sink.get_dropped_count() == 0
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_block_policy_does_not_hang_when_the_writer_has_died(tmp_path: Path) -> None:
+    sink = BufferedJsonlTraceSink(tmp_path, queue_size=1, overflow_policy="block")
+
+    class BrokenEvent(TraceEvent):
+        def to_json(self) -> str:
+            raise ValueError("cannot serialize")
+
+    sink.record(BrokenEvent("broken", "", "", 0))
+    deadline = time.time() + 5
+    while time.time() < deadline and sink._BufferedJsonlTraceSink__writer.is_alive():
+        time.sleep(0.01)
+
+    sink.record(TraceEvent("queued", "", "", 0))
+    sink.record(TraceEvent("lost", "", "", 0))
+    sink.close()
+
+    assert sink.get_dropped_count() == 1
@@ -0,0 +1,50 @@
+from src.trace.trace_bus import TraceBus
+from src.trace.trace_event import TraceEvent
+from src.trace.trace_level import TraceLevel
+from src.trace.trace_sink import TraceSink
+
+
+class LevelSink(TraceSink):
+
+    def __init__(self, level: TraceLevel):
+        self.level = level
+        self.events = []
+
+    def get_level(self) -> TraceLevel:
+        return self.level
+
+    def record(self, event: TraceEvent) -> None:
+        self.events.append(event)
+
+
+def test_publish_lazy_builds_once_per_requested_level() -> None:
+    built = []
+
+    def build(level: TraceLevel):
+        built.append(level)
+        return f"in-{level.value}", f"out-{level.value}"
+
+    summary_a, summary_b, full = LevelSink(TraceLevel.SUMMARY), LevelSink(TraceLevel.SUMMARY), LevelSink(TraceLevel.FULL)
+    bus = TraceBus()
+    for sink in (summary_a, summary_b, full):
+        bus.register(sink)
+
+    bus.publish_lazy("retrieve", build, 1.5)
+
+    assert sorted(level.value for level in built) == ["full", "summary"]
+    assert summary_a.events[0] is summary_b.events[0]
+    assert summary_a.events[0].get_outputs_summary() == "out-summary"
+    assert full.events[0].get_inputs() == "in-full"
+
+
+def test_publish_lazy_skips_building_when_all_sinks_are_off() -> None:
+    def build(level: TraceLevel):
+        raise AssertionError("summary should not be built")
+
+    off = LevelSink(TraceLevel.OFF)
+    bus = TraceBus()
+    bus.register(off)
+
+    bus.publish_lazy("rerank", build, 0.0)
+
+    assert off.events == []
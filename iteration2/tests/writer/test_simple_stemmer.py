@@ -192,5 +192,30 @@ class TestSimpleStemmer(unittest.TestCase):
         self.assertIsNotNone(result)
 
 
+class TestSimpleStemmerSuffixTrie(unittest.TestCase):
+    """Suffix matching, memoization and the precomputed stem table."""
+
+    SUFFIXES = ["ler", "lar", "leri", "de", "e", "si"]
+
+    def test_longest_suffix_leaving_two_root_characters_wins(self):
+        stemmer = SimpleStemmer(self.SUFFIXES)
+        self.assertEqual(stemmer.stem("evleri"), "ev")
+        self.assertEqual(stemmer.stem("Evde"), "ev")
+        self.assertEqual(stemmer.stem("ede"), "ed")  # "de" would leave one character
+        self.assertEqual(stemmer.stem("kitap"), "kitap")
+        self.assertEqual(stemmer.stem("ab"), "ab")
+
+    def test_cache_and_table_return_the_same_stems(self):
+        words = ["evleri", "kitaplar", "masade", "okulsi", "ders", "Evde"]
+        expected = [SimpleStemmer(self.SUFFIXES, cache_size=0).stem(w) for w in words]
+
+        cached = SimpleStemmer(self.SUFFIXES, cache_size=2)
+        self.assertEqual([cached.stem(w) for w in words * 2], expected * 2)
+
+        precomputed = SimpleStemmer(self.SUFFIXES)
+        self.assertEqual(precomputed.precompute(words + ["ab", ""]), len(words))
+        self.assertEqual(precomputed.stem_terms(words), expected)
+
+
 if __name__ == "__main__":
     unittest.main()